@@ -2,24 +2,60 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
 
 import voluptuous as vol
 
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME, SERVICE_RELOAD
-from homeassistant.core import Event, HomeAssistant, ServiceCall
+from homeassistant.const import ATTR_DEVICE_ID, CONF_NAME, CONF_UNIQUE_ID, SERVICE_RELOAD
+from homeassistant.core import Event, HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.exceptions import ConfigValidationError, ServiceValidationError
-from homeassistant.helpers import config_validation as cv, discovery
+from homeassistant.helpers import config_validation as cv, discovery, entity_registry as er
 from homeassistant.helpers.entity_registry import RegistryEntry, async_migrate_entries
 from homeassistant.helpers.reload import async_integration_yaml_config, async_reload_integration_platforms
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
+from .candidates import async_release_candidate_index
 from .config_flow import get_value
-from .const import COMPUTE_DEVICE, DOMAIN, PLATFORMS, UPDATE_LISTENER
+from .const import (
+    ATTR_SOLVE_FOR,
+    ATTR_TARGET,
+    ATTR_VALUE,
+    COMPUTE_DEVICE,
+    CONF_AIR_SPEED,
+    CONF_BUNDLE,
+    CONF_CLOTHING_INSULATION,
+    CONF_INPUT_ATTRIBUTES,
+    CONF_LOOKUP_TABLES,
+    CONF_METABOLIC_RATE,
+    CONF_METRICS_ENDPOINT,
+    CONF_OUTDOOR_DEVICE,
+    CONF_RADIANT_TEMPERATURE_SENSOR,
+    CONF_ROLLING_STATISTICS,
+    CONF_SATURATION_MODEL,
+    CONF_SLOW_UPDATE_THRESHOLD,
+    CONF_TRENDS,
+    CONF_WIND_SPEED_SENSOR,
+    DATA_DEVICES,
+    DATA_LEGACY_PLATFORM,
+    DATA_METRICS_ENDPOINT,
+    DATA_YAML_DEVICES,
+    DOMAIN,
+    MIGRATION_LEGACY_UNIQUE_IDS,
+    MIGRATION_STORAGE_KEY,
+    MIGRATION_STORAGE_VERSION,
+    PLATFORMS,
+    SERVICE_SOLVE,
+    UPDATE_LISTENER,
+)
+from .inverse import InverseTarget, SolveFor
+from .pmv import AIR_SPEED_DEFAULT, CLOTHING_INSULATION_DEFAULT, METABOLIC_RATE_DEFAULT
 from .sensor import (
+    BUNDLE_DEFAULT,
     CONF_CUSTOM_ICONS,
     CONF_ENABLED_SENSORS,
     CONF_HUMIDITY_SENSOR,
@@ -27,27 +63,70 @@ from .sensor import (
     CONF_PRESSURE_SENSOR,
     CONF_SCAN_INTERVAL,
     CONF_TEMPERATURE_SENSOR,
+    INPUT_ATTRIBUTES_DEFAULT,
+    LOOKUP_TABLES_DEFAULT,
+    POLL_DEFAULT,
+    ROLLING_STATISTICS_DEFAULT,
+    SATURATION_MODEL_DEFAULT,
+    SCAN_INTERVAL_DEFAULT,
     SENSOR_OPTIONS_SCHEMA,
     SENSOR_SCHEMA,
+    SLOW_UPDATE_THRESHOLD_DEFAULT,
+    TRENDS_DEFAULT,
     LegacySensorType,
     SensorType,
+    async_resolve_device,
 )
+from .view import MetricsView
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up entry configured from user interface."""
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
+# Options applied to a running device by async_update_options, other changes reload the entry
+HOT_APPLIED_OPTIONS = {
+    CONF_TEMPERATURE_SENSOR,
+    CONF_HUMIDITY_SENSOR,
+    CONF_PRESSURE_SENSOR,
+    CONF_POLL,
+    CONF_SCAN_INTERVAL,
+    CONF_CUSTOM_ICONS,
+    CONF_LOOKUP_TABLES,
+    CONF_SATURATION_MODEL,
+    CONF_SLOW_UPDATE_THRESHOLD,
+    CONF_INPUT_ATTRIBUTES,
+}
+
+
+def _entry_config(entry: ConfigEntry) -> dict:
+    """Return the configuration of an entry, options override data."""
+    return {
         CONF_NAME: get_value(entry, CONF_NAME),
         CONF_TEMPERATURE_SENSOR: get_value(entry, CONF_TEMPERATURE_SENSOR),
         CONF_HUMIDITY_SENSOR: get_value(entry, CONF_HUMIDITY_SENSOR),
         CONF_PRESSURE_SENSOR: get_value(entry, CONF_PRESSURE_SENSOR),
         CONF_POLL: get_value(entry, CONF_POLL),
-        CONF_SCAN_INTERVAL: get_value(entry, CONF_SCAN_INTERVAL),
+        CONF_SCAN_INTERVAL: get_value(entry, CONF_SCAN_INTERVAL, SCAN_INTERVAL_DEFAULT),
         CONF_CUSTOM_ICONS: get_value(entry, CONF_CUSTOM_ICONS),
+        CONF_LOOKUP_TABLES: get_value(entry, CONF_LOOKUP_TABLES, LOOKUP_TABLES_DEFAULT),
+        CONF_SATURATION_MODEL: get_value(entry, CONF_SATURATION_MODEL, SATURATION_MODEL_DEFAULT),
+        CONF_SLOW_UPDATE_THRESHOLD: get_value(entry, CONF_SLOW_UPDATE_THRESHOLD, SLOW_UPDATE_THRESHOLD_DEFAULT),
+        CONF_BUNDLE: get_value(entry, CONF_BUNDLE, BUNDLE_DEFAULT),
+        CONF_INPUT_ATTRIBUTES: get_value(entry, CONF_INPUT_ATTRIBUTES, INPUT_ATTRIBUTES_DEFAULT),
+        CONF_ROLLING_STATISTICS: get_value(entry, CONF_ROLLING_STATISTICS, ROLLING_STATISTICS_DEFAULT),
+        CONF_TRENDS: get_value(entry, CONF_TRENDS, TRENDS_DEFAULT),
+        CONF_RADIANT_TEMPERATURE_SENSOR: get_value(entry, CONF_RADIANT_TEMPERATURE_SENSOR),
+        CONF_WIND_SPEED_SENSOR: get_value(entry, CONF_WIND_SPEED_SENSOR),
+        CONF_OUTDOOR_DEVICE: get_value(entry, CONF_OUTDOOR_DEVICE),
+        CONF_AIR_SPEED: get_value(entry, CONF_AIR_SPEED, AIR_SPEED_DEFAULT),
+        CONF_METABOLIC_RATE: get_value(entry, CONF_METABOLIC_RATE, METABOLIC_RATE_DEFAULT),
+        CONF_CLOTHING_INSULATION: get_value(entry, CONF_CLOTHING_INSULATION, CLOTHING_INSULATION_DEFAULT),
     }
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up entry configured from user interface."""
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][entry.entry_id] = _entry_config(entry)
     if get_value(entry, CONF_ENABLED_SENSORS):
         hass.data[DOMAIN][entry.entry_id][CONF_ENABLED_SENSORS] = get_value(entry, CONF_ENABLED_SENSORS)
         data = dict(entry.data)
@@ -65,8 +144,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Update options from user interface."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Update options from user interface.
+
+    Changes of HOT_APPLIED_OPTIONS are applied to the running device, anything else reloads the entry.
+    """
+    data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    compute_device = data.get(COMPUTE_DEVICE)
+    config = _entry_config(entry)
+    changed = {key for key, value in config.items() if data.get(key) != value}
+    if compute_device is None or changed - HOT_APPLIED_OPTIONS:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    if not changed:
+        return
+
+    _LOGGER.debug("Applying changed options %s to %s", changed, compute_device.name)
+    data.update(config)
+    compute_device.async_reconfigure(
+        temperature_entity=config[CONF_TEMPERATURE_SENSOR],
+        humidity_entity=config[CONF_HUMIDITY_SENSOR],
+        pressure_entity=config[CONF_PRESSURE_SENSOR],
+        should_poll=config[CONF_POLL],
+        scan_interval=timedelta(seconds=config[CONF_SCAN_INTERVAL]),
+        lookup_tables=config[CONF_LOOKUP_TABLES],
+        saturation_model=config[CONF_SATURATION_MODEL],
+        slow_update_threshold=config[CONF_SLOW_UPDATE_THRESHOLD],
+        input_attributes=config[CONF_INPUT_ATTRIBUTES],
+        custom_icons=config[CONF_CUSTOM_ICONS],
+    )
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -81,27 +186,61 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             if compute_device:
                 compute_device.cleanup()
             hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            async_release_candidate_index(hass)
     else:
         _LOGGER.error("Failed to unload platforms for entry: %s", entry.entry_id)
     return unload_ok
 
 
+# Sensor types that replace the legacy ones
+LEGACY_SENSOR_TYPES = {
+    LegacySensorType.THERMAL_PERCEPTION: SensorType.DEW_POINT_PERCEPTION,
+    LegacySensorType.SIMMER_INDEX: SensorType.SUMMER_SIMMER_INDEX,
+    LegacySensorType.SIMMER_ZONE: SensorType.SUMMER_SIMMER_PERCEPTION,
+}
+
+
+def _update_legacy_unique_id(entry: RegistryEntry) -> dict[str, str] | None:
+    """Update unique_id of changed sensor names, a unique_id ends in the sensor type."""
+    for legacy_type, sensor_type in LEGACY_SENSOR_TYPES.items():
+        # summer_simmer_index ends in simmer_index as well
+        if entry.unique_id.endswith(legacy_type) and not entry.unique_id.endswith(sensor_type):
+            return {"new_unique_id": entry.unique_id.removesuffix(legacy_type) + sensor_type}
+    return None
+
+
+async def _async_migrate_yaml_unique_ids(hass: HomeAssistant) -> None:
+    """Migrate the legacy sensor type unique_ids of YAML sensors in one pass over the entity registry.
+
+    Config entries are migrated by async_migrate_entry. YAML sensors have no version, so a
+    marker in the storage records that the migration ran and later startups skip the scan.
+    """
+    store = Store(hass, MIGRATION_STORAGE_VERSION, MIGRATION_STORAGE_KEY)
+    migrations = await store.async_load() or {}
+    if migrations.get(MIGRATION_LEGACY_UNIQUE_IDS):
+        return
+
+    registry = er.async_get(hass)
+    for entry in list(registry.entities.values()):
+        if entry.platform != DOMAIN or entry.config_entry_id is not None or (updates := _update_legacy_unique_id(entry)) is None:
+            continue
+        if registry.async_get_entity_id(entry.domain, DOMAIN, updates["new_unique_id"]) is not None:
+            _LOGGER.warning("Cannot migrate %s, an entity with unique_id %s already exists", entry.entity_id, updates["new_unique_id"])
+            continue
+        _LOGGER.info("Migrating unique_id of %s from %s to %s", entry.entity_id, entry.unique_id, updates["new_unique_id"])
+        registry.async_update_entity(entry.entity_id, **updates)
+
+    migrations[MIGRATION_LEGACY_UNIQUE_IDS] = True
+    await store.async_save(migrations)
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Migrate old entry."""
     _LOGGER.debug("Migrating from version %s", config_entry.version)
 
     if config_entry.version == 1:
-
-        def update_unique_id(entry: RegistryEntry):
-            """Update unique_id of changed sensor names."""
-            if LegacySensorType.THERMAL_PERCEPTION in entry.unique_id:
-                return {"new_unique_id": entry.unique_id.replace(LegacySensorType.THERMAL_PERCEPTION, SensorType.DEW_POINT_PERCEPTION)}
-            if LegacySensorType.SIMMER_INDEX in entry.unique_id:
-                return {"new_unique_id": entry.unique_id.replace(LegacySensorType.SIMMER_INDEX, SensorType.SUMMER_SIMMER_INDEX)}
-            if LegacySensorType.SIMMER_ZONE in entry.unique_id:
-                return {"new_unique_id": entry.unique_id.replace(LegacySensorType.SIMMER_ZONE, SensorType.SUMMER_SIMMER_PERCEPTION)}
-
-        await async_migrate_entries(hass, config_entry.entry_id, update_unique_id)
+        await async_migrate_entries(hass, config_entry.entry_id, _update_legacy_unique_id)
         hass.config_entries.async_update_entry(config_entry, version=2)
 
     _LOGGER.info("Migration to version %s successful", config_entry.version)
@@ -117,6 +256,7 @@ OPTIONS_SCHEMA = vol.Schema({}).extend(
 COMBINED_SCHEMA = vol.Schema(
     {
         vol.Optional(SENSOR_DOMAIN): vol.All(cv.ensure_list, [SENSOR_SCHEMA]),
+        vol.Optional(CONF_METRICS_ENDPOINT): cv.boolean,
     }
 ).extend(OPTIONS_SCHEMA.schema)
 
@@ -130,9 +270,20 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+SOLVE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_TARGET): vol.Coerce(InverseTarget),
+        vol.Required(ATTR_VALUE): vol.Coerce(float),
+        vol.Required(ATTR_SOLVE_FOR): vol.Coerce(SolveFor),
+    }
+)
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the thermal_comfort integration."""
+    await _async_migrate_yaml_unique_ids(hass)
+    _setup_metrics_endpoint(hass, config)
     if DOMAIN in config:
         await _process_config(hass, config)
 
@@ -151,32 +302,110 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         if config_yaml is None:
             return
 
-        await async_reload_integration_platforms(hass, DOMAIN, PLATFORMS)
+        _setup_metrics_endpoint(hass, config_yaml)
+        if hass.data.get(DATA_LEGACY_PLATFORM):
+            # Legacy platform configs are only set up by the sensor integration, reload everything
+            for _, compute_device in hass.data.pop(DATA_YAML_DEVICES, {}).values():
+                compute_device.cleanup()
+            await async_reload_integration_platforms(hass, DOMAIN, PLATFORMS)
 
-        if DOMAIN in config_yaml:
-            await _process_config(hass, config_yaml)
+        await _process_config(hass, config_yaml)
 
         hass.bus.async_fire(f"event_{DOMAIN}_reloaded", context=call.context)
 
     async_register_admin_service(hass, DOMAIN, SERVICE_RELOAD, _reload_config)
 
+    async def _solve(call: ServiceCall) -> ServiceResponse:
+        """Return the humidity or temperature each device needs for a target value."""
+        return {"devices": {device_id: _solve_device(hass, device_id, call.data[ATTR_TARGET], call.data[ATTR_VALUE], call.data[ATTR_SOLVE_FOR]) for device_id in call.data[ATTR_DEVICE_ID]}}
+
+    hass.services.async_register(DOMAIN, SERVICE_SOLVE, _solve, schema=SOLVE_SCHEMA, supports_response=SupportsResponse.ONLY)
+
     return True
 
 
+def _solve_device(hass: HomeAssistant, device_id: str, target: InverseTarget, value: float, solve_for: SolveFor) -> dict:
+    """Solve for one device given by device registry id or unique_id, the input not solved for is the current one.
+
+    The solved input is None if no valid input gives the value.
+    """
+    if (compute_device := hass.data.get(DATA_DEVICES, {}).get(async_resolve_device(hass, device_id))) is None:
+        raise ServiceValidationError(
+            f"{device_id} is not a running {DOMAIN} device",
+            translation_domain=DOMAIN,
+            translation_key="device_not_found",
+            translation_placeholders={"device_id": device_id},
+        )
+    result = {
+        "name": compute_device.name,
+        "temperature": compute_device.temperature,
+        "humidity": compute_device.humidity,
+    }
+    result[solve_for] = compute_device.solve(target, value, solve_for)
+    return result
+
+
+def _setup_metrics_endpoint(hass: HomeAssistant, hass_config: ConfigType) -> None:
+    """Enable or disable the metrics endpoint, registering its view on first use."""
+    enabled = any(conf_section.get(CONF_METRICS_ENDPOINT, False) for conf_section in hass_config.get(DOMAIN, []))
+    if enabled and DATA_METRICS_ENDPOINT not in hass.data:
+        if hass.http is None:
+            _LOGGER.error("The %s metrics endpoint requires the http integration", DOMAIN)
+            return
+        hass.http.register_view(MetricsView)
+    if enabled or DATA_METRICS_ENDPOINT in hass.data:
+        hass.data[DATA_METRICS_ENDPOINT] = enabled
+
+
 async def _process_config(hass: HomeAssistant, hass_config: ConfigType) -> None:
-    """Process config."""
-    for conf_section in hass_config[DOMAIN]:
-        for platform_domain in PLATFORMS:
-            if platform_domain in conf_section:
-                hass.async_create_task(
-                    discovery.async_load_platform(
-                        hass,
-                        platform_domain,
-                        DOMAIN,
-                        {
-                            "devices": conf_section[platform_domain],
-                            "options": OPTIONS_SCHEMA(conf_section),
-                        },
-                        hass_config,
-                    )
-                )
+    """Process config, only devices that are new or changed since the last call are (re)created.
+
+    Devices are matched by unique_id. Unchanged devices keep running, devices with only
+    HOT_APPLIED_OPTIONS changed are reconfigured in place and removed devices are removed.
+    """
+    configs = {}
+    for conf_section in hass_config.get(DOMAIN, []):
+        options = OPTIONS_SCHEMA(conf_section)
+        for device_config in conf_section.get(SENSOR_DOMAIN, []):
+            configs[device_config[CONF_UNIQUE_ID]] = options | device_config
+
+    running = hass.data.setdefault(DATA_YAML_DEVICES, {})
+    for unique_id, (device_config, compute_device) in list(running.items()):
+        if (new_config := configs.get(unique_id)) == device_config:
+            continue
+        changed = {key for key in device_config.keys() | new_config.keys() if device_config.get(key) != new_config.get(key)} if new_config else None
+        if changed and not changed - HOT_APPLIED_OPTIONS:
+            _LOGGER.debug("Applying changed options %s to %s", changed, compute_device.name)
+            running[unique_id] = (new_config, compute_device)
+            compute_device.async_reconfigure(
+                temperature_entity=new_config[CONF_TEMPERATURE_SENSOR],
+                humidity_entity=new_config[CONF_HUMIDITY_SENSOR],
+                pressure_entity=new_config.get(CONF_PRESSURE_SENSOR),
+                should_poll=new_config.get(CONF_POLL, POLL_DEFAULT),
+                scan_interval=new_config.get(CONF_SCAN_INTERVAL, timedelta(seconds=SCAN_INTERVAL_DEFAULT)),
+                lookup_tables=new_config.get(CONF_LOOKUP_TABLES, LOOKUP_TABLES_DEFAULT),
+                saturation_model=new_config.get(CONF_SATURATION_MODEL, SATURATION_MODEL_DEFAULT),
+                slow_update_threshold=new_config.get(CONF_SLOW_UPDATE_THRESHOLD, SLOW_UPDATE_THRESHOLD_DEFAULT),
+                input_attributes=new_config.get(CONF_INPUT_ATTRIBUTES, INPUT_ATTRIBUTES_DEFAULT),
+                custom_icons=new_config.get(CONF_CUSTOM_ICONS, False),
+            )
+            continue
+
+        del running[unique_id]
+        for sensor in list(compute_device.sensors):
+            await sensor.async_remove()
+        compute_device.cleanup()
+
+    if devices := [device_config for unique_id, device_config in configs.items() if unique_id not in running]:
+        hass.async_create_task(
+            discovery.async_load_platform(
+                hass,
+                SENSOR_DOMAIN,
+                DOMAIN,
+                {
+                    "devices": devices,
+                    "options": {},
+                },
+                hass_config,
+            )
+        )
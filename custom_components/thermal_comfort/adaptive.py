@@ -0,0 +1,143 @@
+"""Adaptive thermal comfort of ASHRAE 55 (2020) and the prevailing mean outdoor temperature it depends on.
+
+In naturally ventilated rooms occupants adapt to the weather of the past days, so the
+comfortable operative temperature follows the prevailing mean outdoor temperature, the
+exponentially weighted running mean of the daily mean outdoor temperatures. The running
+mean is maintained incrementally from the updates of an outdoor device: one weighting
+per completed day instead of reading 7 to 30 days of history.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
+
+from .const import DATA_RUNNING_MEAN, DOMAIN
+from .storage import DeviceStore
+
+RUNNING_MEAN_STORAGE_KEY = f"{DOMAIN}.running_mean"
+RUNNING_MEAN_STORAGE_VERSION = 1
+# Seconds a changed running mean waits before it is written, the store also writes on shutdown
+RUNNING_MEAN_SAVE_DELAY = 300
+# Weight of the previous running mean, ASHRAE 55 allows 0.6 to 0.9
+RUNNING_MEAN_ALPHA = 0.8
+
+# Comfort temperature = slope * prevailing mean outdoor temperature + intercept, all in °C
+ADAPTIVE_COMFORT_SLOPE = 0.31
+ADAPTIVE_COMFORT_INTERCEPT = 17.8
+# Valid range of the prevailing mean outdoor temperature
+PREVAILING_MEAN_MIN = 10.0
+PREVAILING_MEAN_MAX = 33.5
+# Half widths of the operative temperature ranges by percentage of satisfied occupants
+ACCEPTABILITY_LIMITS = {90: 2.5, 80: 3.5}
+
+
+def adaptive_comfort_temperature(prevailing_mean: float) -> float | None:
+    """Return the comfortable operative temperature, None outside the valid range of the prevailing mean."""
+    if not PREVAILING_MEAN_MIN <= prevailing_mean <= PREVAILING_MEAN_MAX:
+        return None
+    return ADAPTIVE_COMFORT_SLOPE * prevailing_mean + ADAPTIVE_COMFORT_INTERCEPT
+
+
+def acceptability(operative_temperature: float, comfort_temperature: float) -> int:
+    """Return the highest percentage of satisfied occupants whose range holds the operative temperature, 0 for none."""
+    deviation = abs(operative_temperature - comfort_temperature)
+    return next((percentage for percentage, limit in ACCEPTABILITY_LIMITS.items() if deviation <= limit), 0)
+
+
+class RunningMeanTemperature:
+    """Prevailing mean outdoor temperature of a device.
+
+    Each update holds its temperature until the next one. The held temperatures are
+    integrated over time into the mean of the current day, at midnight the mean of
+    the completed day is weighted into the running mean. Days without a valid
+    temperature are skipped.
+    """
+
+    def __init__(self, running_mean: float | None = None, days: int = 0, day: str | None = None, day_sum: float = 0.0, day_seconds: float = 0.0) -> None:
+        """Initialize the running mean, e.g. from a stored state."""
+        self.running_mean = running_mean
+        self.days = days  # completed days in the running mean
+        self._day = date.fromisoformat(day) if day is not None else None
+        self._day_sum = day_sum  # °C * seconds
+        self._day_seconds = day_seconds
+        self._timestamp: datetime | None = None
+        self._temperature: float | None = None
+
+    def update(self, timestamp: datetime, temperature: float | None) -> None:
+        """Integrate the held temperature up to timestamp, then hold the new one.
+
+        Time without a valid temperature, and before the first update, does not count.
+        Timestamps are timezone aware and must not decrease.
+        """
+        if self._timestamp is not None and self._temperature is not None:
+            self._integrate(self._timestamp, timestamp, self._temperature)
+        self._timestamp = timestamp
+        self._temperature = temperature
+
+    def _integrate(self, start: datetime, end: datetime, temperature: float) -> None:
+        """Add a constant temperature from start to end to the daily means, closing the days it leaves."""
+        start = dt_util.as_local(start)
+        end = dt_util.as_local(end)
+        while start < end:
+            day = start.date()
+            if day != self._day:
+                self._close_day()
+                self._day = day
+            midnight = dt_util.start_of_local_day(day + timedelta(days=1))
+            segment_end = min(end, midnight)
+            seconds = (segment_end - start).total_seconds()
+            self._day_sum += temperature * seconds
+            self._day_seconds += seconds
+            start = segment_end
+
+    def _close_day(self) -> None:
+        """Weight the mean of the current day into the running mean."""
+        if self._day_seconds > 0:
+            daily_mean = self._day_sum / self._day_seconds
+            if self.running_mean is None:
+                self.running_mean = daily_mean
+            else:
+                self.running_mean = (1 - RUNNING_MEAN_ALPHA) * daily_mean + RUNNING_MEAN_ALPHA * self.running_mean
+            self.days += 1
+        self._day_sum = 0.0
+        self._day_seconds = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to store."""
+        return {
+            "running_mean": self.running_mean,
+            "days": self.days,
+            "day": self._day.isoformat() if self._day is not None else None,
+            "day_sum": self._day_sum,
+            "day_seconds": self._day_seconds,
+        }
+
+
+class RunningMeanStore(DeviceStore[RunningMeanTemperature]):
+    """Running means of all outdoor devices referenced by other devices, stored across restarts.
+
+    Devices sharing an outdoor device share its running mean.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store, async_load reads it."""
+        super().__init__(hass, RUNNING_MEAN_STORAGE_VERSION, RUNNING_MEAN_STORAGE_KEY, RUNNING_MEAN_SAVE_DELAY, RunningMeanTemperature)
+
+    @callback
+    def async_update(self, unique_id: str, timestamp: datetime, temperature: float | None) -> None:
+        """Update the running mean of a device if another device references it."""
+        if (running_mean := self._states.get(unique_id)) is not None:
+            running_mean.update(timestamp, temperature)
+            self.async_schedule_save()
+
+
+async def async_get_running_mean_store(hass: HomeAssistant) -> RunningMeanStore:
+    """Return the running mean store, reading it on first use."""
+    if (store := hass.data.get(DATA_RUNNING_MEAN)) is None:
+        store = hass.data[DATA_RUNNING_MEAN] = RunningMeanStore(hass)
+    await store.async_load()
+    return store
@@ -0,0 +1,412 @@
+"""Index of the entities the config flow offers as temperature, humidity and pressure sources."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import EVENT_STATE_CHANGED, Platform
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+
+from .const import (
+    CONF_HUMIDITY_SENSOR,
+    CONF_TEMPERATURE_SENSOR,
+    DATA_CANDIDATE_INDEX,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# We are sure that this device classes could not be useful as data source in any case
+DEVICE_CLASSES_FOR_EXCLUDE = frozenset(
+    {
+        SensorDeviceClass.AQI,
+        SensorDeviceClass.BATTERY,
+        SensorDeviceClass.CO,
+        SensorDeviceClass.CO2,
+        SensorDeviceClass.CURRENT,
+        SensorDeviceClass.DATE,
+        SensorDeviceClass.ENERGY,
+        SensorDeviceClass.FREQUENCY,
+        SensorDeviceClass.GAS,
+        SensorDeviceClass.ILLUMINANCE,
+        SensorDeviceClass.MONETARY,
+        SensorDeviceClass.NITROGEN_DIOXIDE,
+        SensorDeviceClass.NITROGEN_MONOXIDE,
+        SensorDeviceClass.NITROUS_OXIDE,
+        SensorDeviceClass.OZONE,
+        SensorDeviceClass.PM1,
+        SensorDeviceClass.PM10,
+        SensorDeviceClass.PM25,
+        SensorDeviceClass.POWER_FACTOR,
+        SensorDeviceClass.POWER,
+        SensorDeviceClass.PRESSURE,
+        SensorDeviceClass.SIGNAL_STRENGTH,
+        SensorDeviceClass.SULPHUR_DIOXIDE,
+        SensorDeviceClass.TIMESTAMP,
+        SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
+        SensorDeviceClass.VOLTAGE,
+    }
+)
+# We are sure that this domains could not be useful as data source in any case
+DOMAINS_FOR_EXCLUDE = frozenset(
+    {
+        Platform.AIR_QUALITY,
+        Platform.ALARM_CONTROL_PANEL,
+        Platform.BINARY_SENSOR,
+        Platform.BUTTON,
+        Platform.CALENDAR,
+        Platform.CAMERA,
+        Platform.CLIMATE,
+        Platform.COVER,
+        Platform.DEVICE_TRACKER,
+        Platform.FAN,
+        Platform.GEO_LOCATION,
+        Platform.IMAGE_PROCESSING,
+        Platform.LIGHT,
+        Platform.LOCK,
+        Platform.MEDIA_PLAYER,
+        Platform.NOTIFY,
+        Platform.REMOTE,
+        Platform.SCENE,
+        Platform.SIREN,
+        Platform.STT,
+        Platform.SWITCH,
+        Platform.TTS,
+        Platform.VACUUM,
+        "automation",
+        "person",
+        "script",
+        "scene",
+        "sun",
+        "timer",
+        "zone",
+    }
+)
+# We are sure that entities with this units could not be useful as data source in any case
+UNITS_FOR_EXCLUDE = frozenset(
+    {
+        # Electric
+        "W",
+        "kW",
+        "VA",
+        "BTU/h",
+        "Wh",
+        "kWh",
+        "MWh",
+        "mA",
+        "A",
+        "mV",
+        "V",
+        # Degree units
+        "°",
+        # Currency units
+        "€",
+        "$",
+        "¢",
+        # Time units
+        "μs",
+        "ms",
+        "s",
+        "min",
+        "h",
+        "d",
+        "w",
+        "m",
+        "y",
+        # Length units
+        "mm",
+        "cm",
+        "km",
+        "in",
+        "ft",
+        "yd",
+        "mi",
+        # Frequency units
+        "Hz",
+        "kHz",
+        "MHz",
+        "GHz",
+        # Pressure units
+        "Pa",
+        "hPa",
+        "kPa",
+        "bar",
+        "cbar",
+        "mbar",
+        "mmHg",
+        "inHg",
+        "psi",
+        # Sound pressure units
+        "dB",
+        "dBa",
+        # Volume units
+        "L",
+        "mL",
+        "m³",
+        "ft³",
+        "gal",
+        "fl. oz.",
+        # Volume Flow Rate units
+        "m³/h",
+        "ft³/m",
+        # Area units
+        "m²",
+        # Mass
+        "g",
+        "kg",
+        "mg",
+        "µg",
+        "oz",
+        "lb",
+        # Conductivity, light flow, heat transfer, ...
+        "µS/cm",
+        "lx",
+        "UV index",
+        "W/m²",
+        "BTU/(h×ft²)",
+        # Precipitation units
+        "mm/h",
+        "in/h",
+        # Concentration units
+        "µg/m³",
+        "mg/m³",
+        "μg/ft³",
+        "p/m³",
+        "ppm",
+        "ppb",
+        # Speed units
+        "mm/d",
+        "in/d",
+        "m/s",
+        "km/h",
+        "mph",
+        # Signal_strength units
+        "dBm",
+        # Data units
+        "bit",
+        "kbit",
+        "Mbit",
+        "Gbit",
+        "B",
+        "kB",
+        "MB",
+        "GB",
+        "TB",
+        "PB",
+        "EB",
+        "ZB",
+        "YB",
+        "KiB",
+        "MiB",
+        "GiB",
+        "TiB",
+        "PiB",
+        "EiB",
+        "ZiB",
+        "YiB",
+        "bit/s",
+        "kbit/s",
+        "Mbit/s",
+        "Gbit/s",
+        "B/s",
+        "kB/s",
+        "MB/s",
+        "GB/s",
+        "KiB/s",
+        "MiB/s",
+        "GiB/s",
+    }
+)
+ADDITIONAL_UNITS_FOR_EXCLUDE = {
+    SensorDeviceClass.HUMIDITY: frozenset({"°C", "°F", "K"}),
+    SensorDeviceClass.TEMPERATURE: frozenset({"%"}),
+}
+
+
+def _device_class(state: State) -> str | None:
+    return state.attributes.get("device_class", state.attributes.get("original_device_class"))
+
+
+def _unit(state: State) -> str | None:
+    return state.attributes.get("unit_of_measurement", state.attributes.get("native_unit_of_measurement"))
+
+
+class CandidateIndex:
+    """Candidate source entities by device class, kept up to date from state changes and entity registry updates.
+
+    An entity is a candidate for a device class if it is a sensor with that device class.
+    With include_all the other entities that are not obviously useless by domain, device
+    class or unit are candidates as well. Entities registered by Thermal Comfort itself
+    never are.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty index, async_start fills it."""
+        self._hass = hass
+        self._registry = er.async_get(hass)
+        self._entries: dict[str, tuple[str | None, bool, str | None]] = {}  # (sensor device class, additional, unit) by entity_id
+        self._sensors: dict[str, set[str]] = {}  # sensor entity_ids by device class
+        self._additional: dict[str, str | None] = {}  # unit by entity_id of the candidates for include_all
+        self._results: dict[tuple[str, bool], list[str]] = {}
+        self._unsubscribe: list[CALLBACK_TYPE] = []
+
+    def __len__(self) -> int:
+        """Return the number of indexed entities."""
+        return len(self._entries)
+
+    @callback
+    def async_start(self) -> None:
+        """Index the current states and follow their changes and the entity registry."""
+        for state in self._hass.states.async_all():
+            self.async_update(state.entity_id, state)
+        self._unsubscribe = [
+            self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True),
+            self._hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated, run_immediately=True),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the state changes and the entity registry."""
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe.clear()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        self.async_update(event.data["entity_id"], event.data["new_state"])
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        # The platform decides whether an entity is our own, a rename moves it
+        if (old_entity_id := event.data.get("old_entity_id")) is not None:
+            self.async_update(old_entity_id, None)
+        self.async_update(event.data["entity_id"], self._hass.states.get(event.data["entity_id"]))
+
+    @callback
+    def async_update(self, entity_id: str, state: State | None) -> None:
+        """Add, update or remove an entity."""
+        entry = None
+        if state is not None and ((registry_entry := self._registry.async_get(entity_id)) is None or registry_entry.platform != DOMAIN):
+            device_class = _device_class(state)
+            unit = _unit(state)
+            sensor_device_class = device_class if state.domain == Platform.SENSOR else None
+            additional = state.domain not in DOMAINS_FOR_EXCLUDE and device_class not in DEVICE_CLASSES_FOR_EXCLUDE and unit not in UNITS_FOR_EXCLUDE
+            if sensor_device_class is not None or additional:
+                entry = (sensor_device_class, additional, unit)
+        if self._entries.get(entity_id) == entry:
+            return
+
+        if (old := self._entries.pop(entity_id, None)) is not None:
+            if old[0] is not None:
+                self._sensors[old[0]].discard(entity_id)
+            self._additional.pop(entity_id, None)
+        if entry is not None:
+            self._entries[entity_id] = entry
+            if entry[0] is not None:
+                self._sensors.setdefault(entry[0], set()).add(entity_id)
+            if entry[1]:
+                self._additional[entity_id] = entry[2]
+        self._results.clear()
+
+    def get(self, device_class: SensorDeviceClass, include_all: bool = False) -> list[str]:
+        """Return the sorted sensors of the device class, with include_all followed by the other sorted candidates."""
+        if (result := self._results.get((device_class, include_all))) is None:
+            sensors = self._sensors.get(device_class, set())
+            result = sorted(sensors)
+            if include_all:
+                units_for_exclude = ADDITIONAL_UNITS_FOR_EXCLUDE.get(device_class, frozenset())
+                result += sorted(entity_id for entity_id, unit in self._additional.items() if unit not in units_for_exclude and entity_id not in sensors)
+            self._results[(device_class, include_all)] = result
+        return list(result)
+
+
+@callback
+def async_get_candidate_index(hass: HomeAssistant) -> CandidateIndex:
+    """Return the candidate index, building it from the state machine on first use."""
+    if (index := hass.data.get(DATA_CANDIDATE_INDEX)) is None:
+        index = hass.data[DATA_CANDIDATE_INDEX] = CandidateIndex(hass)
+        index.async_start()
+        _LOGGER.debug("Indexed %s candidate source entities", len(index))
+    return index
+
+
+@callback
+def async_release_candidate_index(hass: HomeAssistant) -> None:
+    """Drop the candidate index and stop maintaining it, the next use builds it again."""
+    if (index := hass.data.pop(DATA_CANDIDATE_INDEX, None)) is not None:
+        index.async_stop()
+
+
+@dataclass
+class SourcePair:
+    """Temperature and humidity sensor of the same device or area."""
+
+    name: str
+    temperature_sensor: str
+    humidity_sensor: str
+    pressure_sensor: str | None = None
+
+
+@callback
+def async_pair_sources(hass: HomeAssistant) -> list[SourcePair]:
+    """Pair the temperature and humidity sensors that are not configured yet.
+
+    Sensors of the same device are paired first, the remaining ones by area. A pressure
+    sensor of the same device, or else of the same area, is added to the pair. The
+    candidate sensors are grouped in one pass over the index with registry lookups by id.
+    """
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    area_registry = ar.async_get(hass)
+    index = async_get_candidate_index(hass)
+    configured = {
+        (entry.options.get(CONF_TEMPERATURE_SENSOR, entry.data.get(CONF_TEMPERATURE_SENSOR)), entry.options.get(CONF_HUMIDITY_SENSOR, entry.data.get(CONF_HUMIDITY_SENSOR)))
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+
+    # {device class: [entity_ids]} by ("device", device_id) and ("area", area_id)
+    groups: dict[tuple[str, str], dict[str, list[str]]] = {}
+    device_areas: dict[str, str | None] = {}
+    for device_class in (SensorDeviceClass.TEMPERATURE, SensorDeviceClass.HUMIDITY, SensorDeviceClass.PRESSURE):
+        for entity_id in index.get(device_class):
+            if (entry := entity_registry.async_get(entity_id)) is None or (state := hass.states.get(entity_id)) is None or state.attributes.get("state_class") != "measurement":
+                continue
+            device = device_registry.async_get(entry.device_id) if entry.device_id is not None else None
+            if device is not None:
+                groups.setdefault(("device", device.id), {}).setdefault(device_class, []).append(entity_id)
+                device_areas[device.id] = device.area_id
+            if (area_id := entry.area_id or (device.area_id if device is not None else None)) is not None:
+                groups.setdefault(("area", area_id), {}).setdefault(device_class, []).append(entity_id)
+
+    def name(kind: str, key: str) -> str:
+        if kind == "device":
+            device = device_registry.async_get(key)
+            return device.name_by_user or device.name or key
+        area = area_registry.async_get_area(key)
+        return area.name if area is not None else key
+
+    pairs = []
+    paired: set[str] = set()
+    for kind in ("device", "area"):
+        for (group_kind, key), sensors in groups.items():
+            if group_kind != kind:
+                continue
+            temperature = next((entity_id for entity_id in sensors.get(SensorDeviceClass.TEMPERATURE, ()) if entity_id not in paired), None)
+            humidity = next((entity_id for entity_id in sensors.get(SensorDeviceClass.HUMIDITY, ()) if entity_id not in paired), None)
+            if temperature is None or humidity is None:
+                continue
+            paired.update((temperature, humidity))
+            if (temperature, humidity) in configured:
+                continue
+            pressure = sensors.get(SensorDeviceClass.PRESSURE)
+            if not pressure and kind == "device" and (area_id := device_areas[key]) is not None:
+                pressure = groups.get(("area", area_id), {}).get(SensorDeviceClass.PRESSURE)
+            pairs.append(SourcePair(name(kind, key), temperature, humidity, pressure[0] if pressure else None))
+    return pairs
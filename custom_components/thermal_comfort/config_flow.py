@@ -2,21 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.const import CONF_NAME, Platform
-from homeassistant.core import HomeAssistant, State, callback
-from homeassistant.helpers import entity_registry as er
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import EntityRegistry
 from homeassistant.helpers.selector import selector
 
-from .const import DEFAULT_NAME, DOMAIN
+from .candidates import (
+    async_get_candidate_index,
+    async_pair_sources,
+    async_release_candidate_index,
+)
+from .const import (
+    CONF_AIR_SPEED,
+    CONF_BUNDLE,
+    CONF_CLOTHING_INSULATION,
+    CONF_INPUT_ATTRIBUTES,
+    CONF_LOOKUP_TABLES,
+    CONF_METABOLIC_RATE,
+    CONF_OUTDOOR_DEVICE,
+    CONF_PAIRS,
+    CONF_RADIANT_TEMPERATURE_SENSOR,
+    CONF_ROLLING_STATISTICS,
+    CONF_SATURATION_MODEL,
+    CONF_SLOW_UPDATE_THRESHOLD,
+    CONF_TRENDS,
+    CONF_WIND_SPEED_SENSOR,
+    DEFAULT_NAME,
+    DOMAIN,
+)
+from .pmv import (
+    AIR_SPEED_DEFAULT,
+    CLOTHING_INSULATION_DEFAULT,
+    COMFORT_INPUT_RANGES,
+    METABOLIC_RATE_DEFAULT,
+    ComfortInput,
+)
+from .saturation import SaturationModel
 from .sensor import (
+    BUNDLE_DEFAULT,
     CONF_CUSTOM_ICONS,
     CONF_ENABLED_SENSORS,
     CONF_HUMIDITY_SENSOR,
@@ -24,13 +57,25 @@ from .sensor import (
     CONF_PRESSURE_SENSOR,
     CONF_SCAN_INTERVAL,
     CONF_TEMPERATURE_SENSOR,
+    DEFAULT_SENSOR_TYPES,
+    INPUT_ATTRIBUTES_DEFAULT,
+    LOOKUP_TABLES_DEFAULT,
     POLL_DEFAULT,
+    ROLLING_STATISTICS_DEFAULT,
+    ROLLING_STATISTICS_TYPES,
+    SATURATION_MODEL_DEFAULT,
     SCAN_INTERVAL_DEFAULT,
+    SLOW_UPDATE_THRESHOLD_DEFAULT,
+    TREND_TYPES,
+    TRENDS_DEFAULT,
     SensorType,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Source of the flows that create the entries of the further pairs selected in the discovery step
+SOURCE_DISCOVERED_PAIR = "discovered_pair"
+
 
 def get_sensors_by_device_class(
     _er: EntityRegistry,
@@ -38,282 +83,9 @@ def get_sensors_by_device_class(
     device_class: SensorDeviceClass,
     include_all: bool = False,
 ) -> list:
-    """Get sensors of required class from entity registry."""
-
-    def filter_by_device_class(_state: State, _list: list[SensorDeviceClass], should_be_in: bool = True) -> bool:
-        """Filter state objects by device class.
-
-        :param _state: state object for examination
-        :param _list: list of device classes
-        :param should_be_in: should the object's device_class be in the list to pass the filter or not
-        """
-        collected_device_class = _state.attributes.get("device_class", _state.attributes.get("original_device_class"))
-        # XNOR
-        return not ((collected_device_class in _list) ^ should_be_in)
-
-    def filter_for_device_class_sensor(state: State) -> bool:
-        """Filter states by Platform.SENSOR and required device class."""
-        return state.domain == Platform.SENSOR and filter_by_device_class(state, [device_class], should_be_in=True)
-
-    def filter_useless_device_class(state: State) -> bool:
-        """Filter out states with useless for us device class."""
-        device_class_for_exclude = [
-            SensorDeviceClass.AQI,
-            SensorDeviceClass.BATTERY,
-            SensorDeviceClass.CO,
-            SensorDeviceClass.CO2,
-            SensorDeviceClass.CURRENT,
-            SensorDeviceClass.DATE,
-            SensorDeviceClass.ENERGY,
-            SensorDeviceClass.FREQUENCY,
-            SensorDeviceClass.GAS,
-            SensorDeviceClass.ILLUMINANCE,
-            SensorDeviceClass.MONETARY,
-            SensorDeviceClass.NITROGEN_DIOXIDE,
-            SensorDeviceClass.NITROGEN_MONOXIDE,
-            SensorDeviceClass.NITROUS_OXIDE,
-            SensorDeviceClass.OZONE,
-            SensorDeviceClass.PM1,
-            SensorDeviceClass.PM10,
-            SensorDeviceClass.PM25,
-            SensorDeviceClass.POWER_FACTOR,
-            SensorDeviceClass.POWER,
-            SensorDeviceClass.PRESSURE,
-            SensorDeviceClass.SIGNAL_STRENGTH,
-            SensorDeviceClass.SULPHUR_DIOXIDE,
-            SensorDeviceClass.TIMESTAMP,
-            SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
-            SensorDeviceClass.VOLTAGE,
-        ]
-        """We are sure that this device classes could not be useful as data source in any case"""
-        return filter_by_device_class(state, device_class_for_exclude, should_be_in=False)
-
-    def filter_useless_domain(state: State) -> bool:
-        """Filter states with useless for us domains."""
-        domains_for_exclude = [
-            Platform.AIR_QUALITY,
-            Platform.ALARM_CONTROL_PANEL,
-            Platform.BINARY_SENSOR,
-            Platform.BUTTON,
-            Platform.CALENDAR,
-            Platform.CAMERA,
-            Platform.CLIMATE,
-            Platform.COVER,
-            Platform.DEVICE_TRACKER,
-            Platform.FAN,
-            Platform.GEO_LOCATION,
-            Platform.IMAGE_PROCESSING,
-            Platform.LIGHT,
-            Platform.LOCK,
-            Platform.MEDIA_PLAYER,
-            Platform.NOTIFY,
-            Platform.REMOTE,
-            Platform.SCENE,
-            Platform.SIREN,
-            Platform.STT,
-            Platform.SWITCH,
-            Platform.TTS,
-            Platform.VACUUM,
-            "automation",
-            "person",
-            "script",
-            "scene",
-            "sun",
-            "timer",
-            "zone",
-        ]
-        """We are sure that this domains could not be useful as data source in any case"""
-        return state.domain not in domains_for_exclude
-
-    def filter_useless_units(state: State) -> bool:
-        """Filter out states with useless for us units of measurements."""
-        units_for_exclude = [
-            # Electric
-            "W",
-            "kW",
-            "VA",
-            "BTU/h",
-            "Wh",
-            "kWh",
-            "MWh",
-            "mA",
-            "A",
-            "mV",
-            "V",
-            # Degree units
-            "°",
-            # Currency units
-            "€",
-            "$",
-            "¢",
-            # Time units
-            "μs",
-            "ms",
-            "s",
-            "min",
-            "h",
-            "d",
-            "w",
-            "m",
-            "y",
-            # Length units
-            "mm",
-            "cm",
-            "m",
-            "km",
-            "in",
-            "ft",
-            "yd",
-            "mi",
-            # Frequency units
-            "Hz",
-            "kHz",
-            "MHz",
-            "GHz",
-            # Pressure units
-            "Pa",
-            "hPa",
-            "kPa",
-            "bar",
-            "cbar",
-            "mbar",
-            "mmHg",
-            "inHg",
-            "psi",
-            # Sound pressure units
-            "dB",
-            "dBa",
-            # Volume units
-            "L",
-            "mL",
-            "m³",
-            "ft³",
-            "gal",
-            "fl. oz.",
-            # Volume Flow Rate units
-            "m³/h",
-            "ft³/m",
-            # Area units
-            "m²",
-            # Mass
-            "g",
-            "kg",
-            "mg",
-            "µg",
-            "oz",
-            "lb",
-            # Conductivity, light flow, heat transfer, ...
-            "µS/cm",
-            "lx",
-            "UV index",
-            "W/m²",
-            "BTU/(h×ft²)",
-            # Precipitation units
-            "mm/h",
-            "in",
-            "in/h",
-            # Concentration units
-            "µg/m³",
-            "mg/m³",
-            "μg/ft³",
-            "p/m³",
-            "ppm",
-            "ppb",
-            # Speed units
-            "mm/d",
-            "in/d",
-            "m/s",
-            "in/h",
-            "km/h",
-            "mph",
-            # Signal_strength units
-            "dB",
-            "dBm",
-            # Data units
-            "bit",
-            "kbit",
-            "Mbit",
-            "Gbit",
-            "B",
-            "kB",
-            "MB",
-            "GB",
-            "TB",
-            "PB",
-            "EB",
-            "ZB",
-            "YB",
-            "KiB",
-            "MiB",
-            "GiB",
-            "TiB",
-            "PiB",
-            "EiB",
-            "ZiB",
-            "YiB",
-            "bit/s",
-            "kbit/s",
-            "Mbit/s",
-            "Gbit/s",
-            "B/s",
-            "kB/s",
-            "MB/s",
-            "GB/s",
-            "KiB/s",
-            "MiB/s",
-            "GiB/s",
-        ]
-        """We are sure that entities with this units could not be useful as data source in any case"""
-        additional_units = {
-            SensorDeviceClass.HUMIDITY: ["°C", "°F", "K"],
-            SensorDeviceClass.TEMPERATURE: ["%"],
-        }
-        units_for_exclude += additional_units.get(device_class, [])
-
-        unit_of_measurement = state.attributes.get("unit_of_measurement", state.attributes.get("native_unit_of_measurement"))
-        return unit_of_measurement not in units_for_exclude
-
-    def filter_thermal_comfort_ids(entity_id: str) -> bool:
-        """Filter out device_ids containing our SensorType."""
-        return all(sensor_type not in entity_id for sensor_type in SensorType)
-
-    filters_for_additional_sensors: list[callable] = [
-        filter_useless_device_class,
-        filter_useless_domain,
-        filter_useless_units,
-    ]
-
-    result = [
-        state.entity_id
-        for state in filter(
-            filter_for_device_class_sensor,
-            _hass.states.async_all(),
-        )
-    ]
-
-    result.sort()
-    _LOGGER.debug("Results for %s based on device class: %s", device_class, result)
-
-    if include_all:
-        additional_sensors = _hass.states.async_all()
-        for f in filters_for_additional_sensors:
-            additional_sensors = list(filter(f, additional_sensors))
-
-        additional_entity_ids = [state.entity_id for state in additional_sensors]
-        additional_entity_ids = list(set(additional_entity_ids) - set(result))
-        additional_entity_ids.sort()
-        _LOGGER.debug("Additional results: %s", additional_entity_ids)
-        result += additional_entity_ids
-
-    result = list(
-        filter(
-            filter_thermal_comfort_ids,
-            result,
-        )
-    )
-
-    _LOGGER.debug("Results after cleaning own entities: %s", result)
-
+    """Get sensors of required class, with include_all followed by other possibly useful entities."""
+    result = async_get_candidate_index(_hass).get(device_class, include_all)
+    _LOGGER.debug("Results for %s: %s", device_class, result)
     return result
 
 
@@ -380,6 +152,55 @@ def build_schema(
                     CONF_CUSTOM_ICONS,
                     default=get_value(config_entry, CONF_CUSTOM_ICONS, False),
                 ): bool,
+                vol.Optional(
+                    CONF_LOOKUP_TABLES,
+                    default=get_value(config_entry, CONF_LOOKUP_TABLES, LOOKUP_TABLES_DEFAULT),
+                ): bool,
+                vol.Optional(
+                    CONF_SATURATION_MODEL,
+                    default=get_value(config_entry, CONF_SATURATION_MODEL, SATURATION_MODEL_DEFAULT),
+                ): selector({"select": {"options": list(SaturationModel), "mode": "dropdown", "translation_key": CONF_SATURATION_MODEL}}),
+                vol.Optional(
+                    CONF_SLOW_UPDATE_THRESHOLD,
+                    default=get_value(config_entry, CONF_SLOW_UPDATE_THRESHOLD, SLOW_UPDATE_THRESHOLD_DEFAULT),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_BUNDLE,
+                    default=get_value(config_entry, CONF_BUNDLE, BUNDLE_DEFAULT),
+                ): bool,
+                vol.Optional(
+                    CONF_INPUT_ATTRIBUTES,
+                    default=get_value(config_entry, CONF_INPUT_ATTRIBUTES, INPUT_ATTRIBUTES_DEFAULT),
+                ): bool,
+                vol.Optional(
+                    CONF_ROLLING_STATISTICS,
+                    default=get_value(config_entry, CONF_ROLLING_STATISTICS, ROLLING_STATISTICS_DEFAULT),
+                ): cv.multi_select({sensor_type: sensor_type.to_name() for sensor_type in ROLLING_STATISTICS_TYPES}),
+                vol.Optional(
+                    CONF_TRENDS,
+                    default=get_value(config_entry, CONF_TRENDS, TRENDS_DEFAULT),
+                ): cv.multi_select({sensor_type: sensor_type.to_name() for sensor_type in TREND_TYPES}),
+                vol.Optional(
+                    CONF_RADIANT_TEMPERATURE_SENSOR,
+                ): selector({"entity": {"filter": {"device_class": SensorDeviceClass.TEMPERATURE}}}),
+                vol.Optional(
+                    CONF_WIND_SPEED_SENSOR,
+                ): selector({"entity": {"filter": {"device_class": SensorDeviceClass.WIND_SPEED}}}),
+                vol.Optional(
+                    CONF_OUTDOOR_DEVICE,
+                ): selector({"device": {"integration": DOMAIN}}),
+                vol.Optional(
+                    CONF_AIR_SPEED,
+                    default=get_value(config_entry, CONF_AIR_SPEED, AIR_SPEED_DEFAULT),
+                ): vol.All(vol.Coerce(float), vol.Range(*COMFORT_INPUT_RANGES[ComfortInput.AIR_SPEED])),
+                vol.Optional(
+                    CONF_METABOLIC_RATE,
+                    default=get_value(config_entry, CONF_METABOLIC_RATE, METABOLIC_RATE_DEFAULT),
+                ): vol.All(vol.Coerce(float), vol.Range(*COMFORT_INPUT_RANGES[ComfortInput.METABOLIC_RATE])),
+                vol.Optional(
+                    CONF_CLOTHING_INSULATION,
+                    default=get_value(config_entry, CONF_CLOTHING_INSULATION, CLOTHING_INSULATION_DEFAULT),
+                ): vol.All(vol.Coerce(float), vol.Range(*COMFORT_INPUT_RANGES[ComfortInput.CLOTHING_INSULATION])),
             }
         )
         if step == "user":
@@ -387,7 +208,7 @@ def build_schema(
                 {
                     vol.Optional(
                         CONF_ENABLED_SENSORS,
-                        default=list(SensorType),
+                        default=DEFAULT_SENSOR_TYPES,
                     ): cv.multi_select({sensor_type: sensor_type.to_name() for sensor_type in SensorType}),
                 }
             )
@@ -438,6 +259,31 @@ def check_input(hass: HomeAssistant, user_input: dict) -> dict:
         elif p_state.attributes.get("state_class") != "measurement":
             errors[CONF_PRESSURE_SENSOR] = "pressure_not_found"
 
+    # Validate optional radiant temperature sensor
+    r_entity_id = user_input.get(CONF_RADIANT_TEMPERATURE_SENSOR)
+    if r_entity_id:
+        r_state = hass.states.get(r_entity_id)
+        if r_state is None:
+            errors[CONF_RADIANT_TEMPERATURE_SENSOR] = "radiant_temperature_not_found"
+        elif r_state.attributes.get("device_class") != SensorDeviceClass.TEMPERATURE:
+            errors[CONF_RADIANT_TEMPERATURE_SENSOR] = "radiant_temperature_not_found"
+
+    # Validate optional wind speed sensor
+    w_entity_id = user_input.get(CONF_WIND_SPEED_SENSOR)
+    if w_entity_id:
+        w_state = hass.states.get(w_entity_id)
+        if w_state is None:
+            errors[CONF_WIND_SPEED_SENSOR] = "wind_speed_not_found"
+        elif w_state.attributes.get("device_class") != SensorDeviceClass.WIND_SPEED:
+            errors[CONF_WIND_SPEED_SENSOR] = "wind_speed_not_found"
+
+    # Validate optional outdoor device
+    outdoor_device = user_input.get(CONF_OUTDOOR_DEVICE)
+    if outdoor_device:
+        device = dr.async_get(hass).async_get(outdoor_device)
+        if device is None or not any(domain == DOMAIN for domain, _ in device.identifiers):
+            errors[CONF_OUTDOOR_DEVICE] = "outdoor_device_not_found"
+
     return errors
 
 
@@ -452,26 +298,36 @@ class ThermalComfortConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return ThermalComfortOptionsFlow(config_entry)
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._manual = False
+
+    async def _async_set_sources_unique_id(self, user_input: dict) -> None:
+        """Set the unique_id from the source sensors, abort if they are configured already."""
+        registry = er.async_get(self.hass)
+
+        t_sensor = registry.async_get(user_input[CONF_TEMPERATURE_SENSOR])
+        p_sensor = registry.async_get(user_input[CONF_HUMIDITY_SENSOR])
+        _LOGGER.debug("Going to use t_sensor %s", t_sensor)
+        _LOGGER.debug("Going to use p_sensor %s", p_sensor)
+
+        if t_sensor is not None and p_sensor is not None:
+            unique_id = f"{t_sensor.unique_id}-{p_sensor.unique_id}"
+            entry = await self.async_set_unique_id(unique_id)
+            if entry is not None:
+                _LOGGER.debug("An entry with the unique_id %s already exists: %s", unique_id, entry.data)
+            self._abort_if_unique_id_configured()
+
     async def async_step_user(self, user_input=None):
         """Handle a flow initialized by the user."""
         errors = {}
 
+        if user_input is None and not self._manual and async_pair_sources(self.hass):
+            return self.async_show_menu(step_id="user", menu_options=["discovery", "manual"])
+
         if user_input is not None:
             if not (errors := check_input(self.hass, user_input)):
-                registry = er.async_get(self.hass)
-
-                t_sensor = registry.async_get(user_input[CONF_TEMPERATURE_SENSOR])
-                p_sensor = registry.async_get(user_input[CONF_HUMIDITY_SENSOR])
-                _LOGGER.debug("Going to use t_sensor %s", t_sensor)
-                _LOGGER.debug("Going to use p_sensor %s", p_sensor)
-
-                if t_sensor is not None and p_sensor is not None:
-                    unique_id = f"{t_sensor.unique_id}-{p_sensor.unique_id}"
-                    entry = await self.async_set_unique_id(unique_id)
-                    if entry is not None:
-                        _LOGGER.debug("An entry with the unique_id %s already exists: %s", unique_id, entry.data)
-                    self._abort_if_unique_id_configured()
-
+                await self._async_set_sources_unique_id(user_input)
                 return self.async_create_entry(
                     title=user_input[CONF_NAME],
                     data=user_input,
@@ -496,6 +352,82 @@ class ThermalComfortConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    @callback
+    def async_remove(self) -> None:
+        """Release the candidate index unless entries or other flows still use it."""
+        if not self.hass.data.get(DOMAIN) and not self.hass.config_entries.flow.async_progress_by_handler(DOMAIN):
+            async_release_candidate_index(self.hass)
+
+    async def async_step_manual(self, user_input=None):
+        """Set up a single entry with the form of the user step."""
+        self._manual = True
+        return await self.async_step_user()
+
+    async def async_step_discovery(self, user_input=None):
+        """Offer entries for all paired temperature and humidity sensors and create the selected ones."""
+        pairs = {f"{pair.temperature_sensor}+{pair.humidity_sensor}": pair for pair in async_pair_sources(self.hass)}
+        if not pairs:
+            return self.async_abort(reason="no_pairs")
+
+        errors = {}
+        if user_input is not None:
+            selected = []
+            failed = []
+            for key in user_input[CONF_PAIRS]:
+                if (pair := pairs.get(key)) is None:
+                    failed.append(key)  # configured or gone since the form was shown
+                    continue
+                data = {
+                    CONF_NAME: pair.name,
+                    CONF_TEMPERATURE_SENSOR: pair.temperature_sensor,
+                    CONF_HUMIDITY_SENSOR: pair.humidity_sensor,
+                    CONF_ENABLED_SENSORS: list(DEFAULT_SENSOR_TYPES),
+                }
+                if pressure_sensor := pair.pressure_sensor or user_input.get(CONF_PRESSURE_SENSOR):
+                    data[CONF_PRESSURE_SENSOR] = pressure_sensor
+                if check_input(self.hass, data):
+                    failed.append(pair.name)
+                else:
+                    selected.append(data)
+            if not selected:
+                errors["base"] = "no_valid_pairs"
+            else:
+                # This flow creates the entry of the first pair, flows of their own those of the others
+                first, *others = selected
+                await self._async_set_sources_unique_id(first)
+                results = await asyncio.gather(
+                    *(self.hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_DISCOVERED_PAIR}, data=data) for data in others)
+                )
+                failed += [data[CONF_NAME] for data, result in zip(others, results) if result["type"] != FlowResultType.CREATE_ENTRY]
+                created = 1 + sum(result["type"] == FlowResultType.CREATE_ENTRY for result in results)
+                return self.async_create_entry(
+                    title=first[CONF_NAME],
+                    data=first,
+                    description="entries_partially_created" if failed else "entries_created",
+                    description_placeholders={"count": str(created), "failed": ", ".join(failed)},
+                )
+
+        return self.async_show_form(
+            step_id="discovery",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_PAIRS, default=list(pairs)): cv.multi_select(
+                        {key: f"{pair.name}: {pair.temperature_sensor}, {pair.humidity_sensor}" + (f", {pair.pressure_sensor}" if pair.pressure_sensor else "") for key, pair in pairs.items()}
+                    ),
+                    vol.Optional(CONF_PRESSURE_SENSOR): selector({"entity": {"filter": {"device_class": SensorDeviceClass.PRESSURE}}}),
+                }
+            ),
+            errors=errors,
+            description_placeholders={"count": str(len(pairs))},
+        )
+
+    async def async_step_discovered_pair(self, discovery_info: dict):
+        """Create an entry for a further pair selected in the discovery step, the discovery step reports the result."""
+        if errors := check_input(self.hass, discovery_info):
+            return self.async_abort(reason=next(iter(errors.values())))
+        await self._async_set_sources_unique_id(discovery_info)
+        return self.async_create_entry(title=discovery_info[CONF_NAME], data=discovery_info)
+
 
 class ThermalComfortOptionsFlow(config_entries.OptionsFlow):
     """Handle options."""
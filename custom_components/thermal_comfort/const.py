@@ -12,3 +12,44 @@ CONF_POLL = "poll"
 DEFAULT_NAME = "Thermal Comfort"
 UPDATE_LISTENER = "update_listener"
 COMPUTE_DEVICE = "compute_device"
+CONF_LOOKUP_TABLES = "lookup_tables"
+CONF_SATURATION_MODEL = "saturation_model"
+CONF_SLOW_UPDATE_THRESHOLD = "slow_update_threshold"
+CONF_METRICS_ENDPOINT = "metrics_endpoint"
+CONF_BUNDLE = "bundle"
+CONF_INPUT_ATTRIBUTES = "input_attributes"
+CONF_PAIRS = "pairs"
+CONF_ROLLING_STATISTICS = "rolling_statistics"
+CONF_TRENDS = "trends"
+CONF_RADIANT_TEMPERATURE_SENSOR = "radiant_temperature_sensor"
+CONF_AIR_SPEED = "air_speed"
+CONF_METABOLIC_RATE = "metabolic_rate"
+CONF_CLOTHING_INSULATION = "clothing_insulation"
+CONF_WIND_SPEED_SENSOR = "wind_speed_sensor"
+CONF_OUTDOOR_DEVICE = "outdoor_device"
+CONF_COMFORT_ZONES = "comfort_zones"
+
+SERVICE_SOLVE = "solve"
+ATTR_TARGET = "target"
+ATTR_VALUE = "value"
+ATTR_SOLVE_FOR = "solve_for"
+
+DATA_LOOKUP_TABLES = "thermal_comfort_lookup_tables"
+DATA_DEVICES = "thermal_comfort_devices"
+DATA_METRICS_ENDPOINT = "thermal_comfort_metrics_endpoint"
+# Running YAML devices, (config, DeviceThermalComfort) by unique_id
+DATA_YAML_DEVICES = "thermal_comfort_yaml_devices"
+DATA_LEGACY_PLATFORM = "thermal_comfort_legacy_platform"
+DATA_CANDIDATE_INDEX = "thermal_comfort_candidate_index"
+DATA_MOULD_GROWTH = "thermal_comfort_mould_growth"
+DATA_RUNNING_MEAN = "thermal_comfort_running_mean"
+# Completed one time migrations, stored in .storage
+MIGRATION_STORAGE_KEY = f"{DOMAIN}.migrations"
+MIGRATION_STORAGE_VERSION = 1
+MIGRATION_LEGACY_UNIQUE_IDS = "legacy_unique_ids"
+
+# Valid input domain, see DeviceThermalComfort._new_temperature_state and _new_humidity_state
+TEMPERATURE_MIN = -89.2
+TEMPERATURE_MAX = 56.7
+HUMIDITY_MIN = 0
+HUMIDITY_MAX = 100
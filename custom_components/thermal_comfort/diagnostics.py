@@ -0,0 +1,36 @@
+"""Diagnostics support for Thermal Comfort."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
+
+from .const import COMPUTE_DEVICE, DOMAIN
+
+
+def _device_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any] | None:
+    """Return the counters of the compute device of a config entry."""
+    if (device := hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get(COMPUTE_DEVICE)) is None:
+        return None
+    return {
+        "unique_id": device.unique_id,
+        "sensors": [sensor.entity_id for sensor in device.sensors],
+        **device.metrics.as_dict(),
+        "slow_updates": None if device.timer is None else device.timer.slow_updates,
+    }
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+        "device": _device_diagnostics(hass, entry),
+    }
+
+
+async def async_get_device_diagnostics(hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry) -> dict[str, Any]:
+    """Return diagnostics for a device."""
+    return _device_diagnostics(hass, entry)
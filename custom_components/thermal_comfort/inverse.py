@@ -0,0 +1,81 @@
+"""Inverse questions to the formulas: the humidity or temperature that gives a target value.
+
+Where the formula can be inverted algebraically the answer is closed form, otherwise it
+is the root of the formula minus the target, found by the Illinois variant of the false
+position method. Its bracket is the valid input domain, so an answer is always a valid
+input and there is none if the target is out of reach.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import StrEnum
+import math
+
+INVERSE_MAX_ITERATIONS = 60
+INVERSE_TOLERANCE = 0.0001  # of the solved input, °C or %
+
+
+class InverseTarget(StrEnum):
+    """Formulas with an inverse."""
+
+    DEW_POINT = "dew_point"
+    HUMIDEX = "humidex"
+    HEAT_INDEX = "heat_index"
+
+
+class SolveFor(StrEnum):
+    """Input to solve for, the other one keeps its current value."""
+
+    HUMIDITY = "humidity"
+    TEMPERATURE = "temperature"
+
+
+def solve_bracketed(func: Callable[[float], float], lower: float, upper: float) -> float | None:
+    """Return a root of func between lower and upper, None if func has the same sign at both ends."""
+    f_lower = func(lower)
+    f_upper = func(upper)
+    if f_lower == 0:
+        return lower
+    if f_upper == 0:
+        return upper
+    if (f_lower > 0) == (f_upper > 0):
+        return None
+    # The end that stays gets its value halved, so it cannot stall the false position. If two
+    # steps do not halve the bracket a bisection follows, which bounds the iterations.
+    side = 0
+    widths = [math.inf, math.inf]  # of the bracket two and one steps ago
+    for _ in range(INVERSE_MAX_ITERATIONS):
+        if upper - lower > widths[0] / 2:
+            x = (lower + upper) / 2
+        else:
+            x = (lower * f_upper - upper * f_lower) / (f_upper - f_lower)
+        widths = [widths[1], upper - lower]
+        f_x = func(x)
+        if f_x == 0:
+            return x
+        if (f_x > 0) == (f_upper > 0):
+            upper, f_upper = x, f_x
+            if side == -1:
+                f_lower /= 2
+            side = -1
+        else:
+            lower, f_lower = x, f_x
+            if side == 1:
+                f_upper /= 2
+            side = 1
+        if upper - lower <= INVERSE_TOLERANCE:
+            break
+    return (lower * f_upper - upper * f_lower) / (f_upper - f_lower)
+
+
+def humidex_vapor_pressure(temperature: float, humidex: float) -> float:
+    """Return the vapour pressure in hPa of a humidex at a temperature, the inverse of the humidex formula."""
+    return (humidex - temperature) / 0.5555 + 10.0
+
+
+def humidex_dew_point(vapor_pressure: float) -> float | None:
+    """Return the dew point of the vapour pressure in hPa the humidex formula computes from it, None for none."""
+    if vapor_pressure <= 0:
+        return None
+    return 1 / (1 / 273.16 - math.log(vapor_pressure / 6.11) / 5417.7530) - 273.15
@@ -0,0 +1,225 @@
+"""Precomputed interpolation tables for the expensive Thermal Comfort formulas.
+
+The dew point and the moist air enthalpy spend most of their time in a
+saturation term that only depends on the temperature: the series of the dew
+point (three pow and two log calls) and the ASHRAE saturation pressure (exp,
+log and a polynomial). Humidity and pressure enter both formulas
+algebraically, so one dimensional tables over the valid temperature domain are
+enough to replace those terms with a linear interpolation.
+
+The dew point table also serves the Goff-Gratch saturation model. The Magnus
+and Buck models are a single exp call and are always evaluated exactly.
+
+Thom's discomfort index is not tabulated: its arctangents are single C calls
+and an interpolation in Python is slower than evaluating them.
+
+Maximum errors against the exact formulas over the valid domain and pressures
+between 500 and 1100 hPa (checked by tests/test_lookup.py):
+
+- dew point: 1e-5 °C
+- moist air enthalpy: 2e-3 kJ/kg (the ASHRAE formula itself steps at 0 °C)
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Sequence
+import logging
+import math
+import mmap
+import os
+import struct
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DATA_LOOKUP_TABLES, TEMPERATURE_MAX, TEMPERATURE_MIN
+from .saturation import STANDARD_PRESSURE_HPA, goff_gratch_saturation_vapor_pressure
+
+_LOGGER = logging.getLogger(__name__)
+
+TABLES_FILE = "thermal_comfort_tables.bin"
+TABLE_STEP = 0.01
+TABLE_VERSION = 1
+
+# magic, version, number of doubles
+_HEADER = struct.Struct("<4sIQ")
+_MAGIC = b"TCLT"
+
+
+def dew_point_vapor_pressure(temperature: float, pressure_hpa: float, humidity: float) -> float:
+    """Vapour pressure in kPa used by the dew point <http://wahiduddin.net/calc/density_algorithms.htm>."""
+    A0 = 373.15 / (273.15 + temperature)
+    SUM = -7.90298 * (A0 - 1)
+    SUM += 5.02808 * math.log(A0, 10)
+    SUM += -1.3816e-7 * (pow(10, (11.344 * (1 - 1 / A0))) - 1)
+    SUM += 8.1328e-3 * (pow(10, (-3.49149 * (A0 - 1))) - 1)
+    SUM += math.log(pressure_hpa, 10)
+    return pow(10, SUM - 3) * humidity
+
+
+def dew_point_vapor_factor(temperature: float) -> float:
+    """Temperature dependent factor of dew_point_vapor_pressure, which is factor * pressure_hpa * humidity."""
+    return dew_point_vapor_pressure(temperature, 1, 1)
+
+
+def saturation_pressure(temperature: float) -> float:
+    """Saturation vapour pressure in Pa (ASHRAE fundamentals 2021 pg 1.5 eq 5 and 6)."""
+    c_to_k = 273.15
+
+    c1 = -5.6745359e03
+    c2 = 6.3925247e00
+    c3 = -9.6778430e-03
+    c4 = 6.2215701e-07
+    c5 = 2.0747825e-09
+    c6 = -9.4840240e-13
+    c7 = 4.1635019e00
+    c8 = -5.8002206e03
+    c9 = 1.3914993e00
+    c10 = -4.8640239e-02
+    c11 = 4.1764768e-05
+    c12 = -1.4452093e-08
+    c13 = 6.5459673e00
+
+    T = temperature + c_to_k
+
+    return (
+        # ASHRAE fundamentals 2021 pg 1.5 eq 5
+        math.exp(c1 / T + c2 + c3 * T + c4 * T**2 + c5 * T**3 + c6 * T**4 + c7 * math.log(T))
+        if T < c_to_k  # noqa: SIM300
+        # ASHRAE fundamentals 2021 pg 1.5 eq 6
+        else math.exp(c8 / T + c9 + c10 * T + c11 * T**2 + c12 * T**3 + c13 * math.log(T))
+    )
+
+
+class ExactKernels:
+    """Exact evaluation of the expensive formula terms."""
+
+    dew_point_vapor_pressure = staticmethod(dew_point_vapor_pressure)
+    saturation_pressure = staticmethod(saturation_pressure)
+    goff_gratch_saturation_vapor_pressure = staticmethod(goff_gratch_saturation_vapor_pressure)
+
+
+EXACT_KERNELS = ExactKernels()
+
+# name, exact function, start, stop
+TABLE_SPECS = (
+    ("dew_point_vapor_factor", dew_point_vapor_factor, TEMPERATURE_MIN, TEMPERATURE_MAX),
+    ("saturation_pressure", saturation_pressure, TEMPERATURE_MIN, TEMPERATURE_MAX),
+)
+
+
+def _table_size(start: float, stop: float) -> int:
+    return round((stop - start) / TABLE_STEP) + 1
+
+
+def interpolator(start: float, step: float, values: Sequence[float]) -> Callable[[float], float]:
+    """Return a linear interpolation of a function sampled at start + i * step.
+
+    Outside of the sampled range the first or last segment is extrapolated.
+    """
+    inv_step = 1 / step
+    last = len(values) - 2
+
+    def interpolate(x: float) -> float:
+        position = (x - start) * inv_step
+        index = int(position)
+        if index < 0:
+            index = 0
+        elif index > last:
+            index = last
+        lower = values[index]
+        return lower + (values[index + 1] - lower) * (position - index)
+
+    return interpolate
+
+
+class LookupTables:
+    """Interpolation tables with the same interface as ExactKernels."""
+
+    def __init__(self, values: Sequence[float], source: mmap.mmap | None = None) -> None:
+        """Split a flat sequence of doubles into the tables of TABLE_SPECS.
+
+        :param values: samples of all tables, in the order of TABLE_SPECS
+        :param source: memory map backing values, if any
+        """
+        self._source = source
+        offset = 0
+        for name, _, start, stop in TABLE_SPECS:
+            size = _table_size(start, stop)
+            setattr(self, name, interpolator(start, TABLE_STEP, values[offset : offset + size]))
+            offset += size
+
+    def dew_point_vapor_pressure(self, temperature: float, pressure_hpa: float, humidity: float) -> float:
+        """Vapour pressure in kPa used by the dew point."""
+        return self.dew_point_vapor_factor(temperature) * pressure_hpa * humidity
+
+    def goff_gratch_saturation_vapor_pressure(self, temperature: float) -> float:
+        """Saturation vapour pressure in hPa of the Goff-Gratch style series."""
+        return self.dew_point_vapor_factor(temperature) * (STANDARD_PRESSURE_HPA * 1000)
+
+    @property
+    def is_memory_mapped(self) -> bool:
+        """Return True if the tables are backed by a memory-mapped file."""
+        return self._source is not None
+
+
+def build_table_values() -> array:
+    """Sample every table of TABLE_SPECS into one flat array of doubles."""
+    values = array("d")
+    for _, function, start, stop in TABLE_SPECS:
+        values.extend(function(start + i * TABLE_STEP) for i in range(_table_size(start, stop)))
+    return values
+
+
+def _map_file(path: str, count: int) -> mmap.mmap | None:
+    """Memory-map an existing table file, None if it is missing or stale."""
+    try:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size != _HEADER.size + count * 8:
+                return None
+            source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if _HEADER.unpack_from(source) != (_MAGIC, TABLE_VERSION, count):
+        source.close()
+        return None
+    return source
+
+
+def _write_file(path: str, values: array) -> None:
+    """Write the table file atomically."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, TABLE_VERSION, len(values)))
+        values.tofile(file)
+    os.replace(temp_path, path)
+
+
+def load_lookup_tables(path: str | None = None) -> LookupTables:
+    """Load the tables from a memory-mapped file, building the file if needed.
+
+    Without a path, or if the file cannot be written, the tables are kept in
+    process memory only.
+    """
+    count = sum(_table_size(start, stop) for _, _, start, stop in TABLE_SPECS)
+    if path is None:
+        return LookupTables(build_table_values())
+    if (source := _map_file(path, count)) is None:
+        values = build_table_values()
+        try:
+            _write_file(path, values)
+        except OSError as ex:
+            _LOGGER.warning("Could not write lookup tables to %s, keeping them in memory: %s", path, ex)
+            return LookupTables(values)
+        if (source := _map_file(path, count)) is None:
+            return LookupTables(values)
+    return LookupTables(memoryview(source)[_HEADER.size :].cast("d"), source)
+
+
+async def async_get_lookup_tables(hass: HomeAssistant) -> LookupTables:
+    """Return the lookup tables shared by all devices, loading them on first use."""
+    if (future := hass.data.get(DATA_LOOKUP_TABLES)) is None:
+        future = hass.data[DATA_LOOKUP_TABLES] = hass.async_add_executor_job(load_lookup_tables, hass.config.path(STORAGE_DIR, TABLES_FILE))
+    return await future
@@ -0,0 +1,184 @@
+"""Runtime counters of Thermal Comfort devices, reported by diagnostics and the metrics endpoint."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from enum import StrEnum
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bounds of the compute time histogram buckets in seconds, the last bucket is unbounded
+COMPUTE_TIME_BUCKETS = (10e-6, 25e-6, 50e-6, 100e-6, 250e-6, 500e-6, 1e-3, 2.5e-3, 5e-3, 10e-3)
+# Minimum time in seconds between two slow update warnings of a device
+SLOW_UPDATE_WARNING_INTERVAL = 600
+
+
+class UpdateStage(StrEnum):
+    """Stages of the update path of a device."""
+
+    PARSE = "parse"
+    UNIT_CONVERSION = "unit_conversion"
+    FORMULA = "formula"
+    TEMPLATE = "template"
+    WRITE = "write"
+
+
+class Histogram:
+    """Histogram with fixed buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = COMPUTE_TIME_BUCKETS) -> None:
+        """Initialize an empty histogram.
+
+        :param buckets: ascending upper bounds, values above the last one go to an extra bucket
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram in microseconds for diagnostics."""
+        bounds = [f"{bound * 1e6:g}" for bound in self.buckets] + ["+Inf"]
+        return {
+            "buckets_us": dict(zip(bounds, self.counts)),
+            "count": self.count,
+            "mean_us": self.sum / self.count * 1e6 if self.count else None,
+            "max_us": self.max * 1e6,
+        }
+
+
+class DeviceMetrics:
+    """Counters of a DeviceThermalComfort."""
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.input_events: dict[str, int] = {}
+        self.last_input: dict[str, float] = {}  # time.monotonic() by input
+        self.recomputes: dict[str, int] = {}
+        self.cache_hits: dict[str, int] = {}
+        self.compute_time: dict[str, Histogram] = {}
+        self.state_writes = 0
+        self.suppressed_writes = 0
+        self.pending_refreshes = 0
+        self.update_lag: float | None = None  # seconds from the last input until the sensors had processed it
+        self._input_pending = False
+
+    def record_input(self, name: str) -> None:
+        """Count a state change of an input sensor."""
+        self.input_events[name] = self.input_events.get(name, 0) + 1
+        self.last_input[name] = time.monotonic()
+        self._input_pending = True
+
+    def record_compute(self, key: str, seconds: float) -> None:
+        """Count a recompute of a sensor type or intermediate value and its duration."""
+        self.recomputes[key] = self.recomputes.get(key, 0) + 1
+        if (histogram := self.compute_time.get(key)) is None:
+            histogram = self.compute_time[key] = Histogram()
+        histogram.observe(seconds)
+
+    def record_cache_hit(self, key: str) -> None:
+        """Count a sensor type or intermediate value served without recomputing it."""
+        self.cache_hits[key] = self.cache_hits.get(key, 0) + 1
+
+    def record_write(self, written: bool) -> None:
+        """Count a written or suppressed sensor state."""
+        if written:
+            self.state_writes += 1
+        else:
+            self.suppressed_writes += 1
+
+    def record_refresh_scheduled(self) -> None:
+        """Count a scheduled sensor refresh."""
+        self.pending_refreshes += 1
+
+    def record_refresh_done(self) -> None:
+        """Count a finished sensor refresh, the last one ends the update of the latest input."""
+        self.pending_refreshes -= 1
+        if self.pending_refreshes == 0 and self._input_pending:
+            self.update_lag = time.monotonic() - max(self.last_input.values())
+            self._input_pending = False
+
+    def input_age(self) -> dict[str, float]:
+        """Return the seconds since the last state change of each input."""
+        now = time.monotonic()
+        return {name: now - last for name, last in self.last_input.items()}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "input_events": dict(self.input_events),
+            "input_age_seconds": self.input_age(),
+            "recomputes": dict(sorted(self.recomputes.items())),
+            "cache_hits": dict(sorted(self.cache_hits.items())),
+            "state_writes": self.state_writes,
+            "suppressed_writes": self.suppressed_writes,
+            "pending_refreshes": self.pending_refreshes,
+            "update_lag_seconds": self.update_lag,
+            "compute_time": {key: histogram.as_dict() for key, histogram in sorted(self.compute_time.items())},
+        }
+
+
+class UpdateTimer:
+    """Time the stages of a device update and warn when it holds the event loop too long.
+
+    A device only has a timer when the slow update threshold is set, callers check for
+    None so the update path costs nothing more than that check otherwise.
+    """
+
+    def __init__(self, name: str, threshold: float) -> None:
+        """Initialize the timer.
+
+        :param name: device name used in the warning
+        :param threshold: seconds an update may take before it is reported
+        """
+        self.name = name
+        self.threshold = threshold
+        self.stages = dict.fromkeys(UpdateStage, 0.0)
+        self.slow_updates = 0
+        self._start = 0.0
+        self._last_warning = None
+        self._suppressed = 0
+
+    def begin(self) -> None:
+        """Start timing an update."""
+        for stage in self.stages:
+            self.stages[stage] = 0.0
+        self._start = time.perf_counter()
+
+    def add(self, stage: UpdateStage, seconds: float) -> None:
+        """Add time spent in a stage of the current update."""
+        self.stages[stage] += seconds
+
+    def end(self) -> None:
+        """Finish timing an update and warn if it was too slow, at most once per SLOW_UPDATE_WARNING_INTERVAL."""
+        elapsed = time.perf_counter() - self._start
+        if elapsed <= self.threshold:
+            return
+        self.slow_updates += 1
+        now = time.monotonic()
+        if self._last_warning is not None and now - self._last_warning < SLOW_UPDATE_WARNING_INTERVAL:
+            self._suppressed += 1
+            return
+        slowest = max(self.stages, key=self.stages.get)
+        _LOGGER.warning(
+            "Update of %s held the event loop for %.1f ms, most of it in %s (%s)%s",
+            self.name,
+            elapsed * 1e3,
+            slowest,
+            ", ".join(f"{stage}: {seconds * 1e3:.2f} ms" for stage, seconds in self.stages.items()),
+            f", {self._suppressed} more slow updates since the last warning" if self._suppressed else "",
+        )
+        self._last_warning = now
+        self._suppressed = 0
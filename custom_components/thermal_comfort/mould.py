@@ -0,0 +1,111 @@
+"""Mould growth index of Thermal Comfort devices, integrated incrementally as updates arrive.
+
+The index follows the VTT model by Hukka and Viitanen (1999) with the sensitivity
+classes of Ojanen et al. (2010), for the most sensitive class (pine sapwood). It rates
+mould growth on a surface from 0 (no growth) to 6 (heavy, tight growth) from how long
+the humidity stays above the critical humidity of the temperature.
+"""
+
+from __future__ import annotations
+
+import math
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_MOULD_GROWTH, DOMAIN
+from .storage import DeviceStore
+
+MOULD_GROWTH_STORAGE_KEY = f"{DOMAIN}.mould_growth"
+MOULD_GROWTH_STORAGE_VERSION = 1
+# Seconds a changed index waits before it is written, the store also writes on shutdown
+MOULD_GROWTH_SAVE_DELAY = 300
+# Longest integration step in hours, the growth rate depends on the index itself
+MOULD_GROWTH_MAX_STEP = 1.0
+MOULD_INDEX_MAX = 6.0
+
+# Maximum index over the humidity above the critical one, very sensitive class
+_MAX_INDEX_A = 1.0
+_MAX_INDEX_B = 7.0
+_MAX_INDEX_C = 2.0
+# Decline per hour after the start of unfavourable conditions, by their duration in hours
+_DECLINE_FAST = 0.00133  # the first 6 hours
+_DECLINE_SLOW = 0.000667  # after 24 hours, no decline in between
+
+
+def critical_humidity(temperature: float) -> float:
+    """Return the relative humidity in % above which mould grows at a temperature in °C."""
+    if temperature > 20:
+        return 80.0
+    return ((-0.00267 * temperature + 0.160) * temperature - 3.13) * temperature + 100.0
+
+
+class MouldGrowth:
+    """Mould growth index of a device.
+
+    Each update holds its temperature and humidity until the next one, so the index
+    advances by the conditions of the elapsed time at O(1) cost. The index and the
+    duration of the current unfavourable period are all the state there is.
+    """
+
+    def __init__(self, index: float = 0.0, unfavourable_hours: float = 0.0) -> None:
+        """Initialize the index, e.g. from a stored state."""
+        self.index = index
+        self.unfavourable_hours = unfavourable_hours
+        self._timestamp: float | None = None
+        self._temperature: float | None = None
+        self._humidity: float | None = None
+
+    def update(self, timestamp: float, temperature: float | None, humidity: float | None) -> None:
+        """Advance the index to timestamp by the held conditions, then hold the new ones.
+
+        Time without valid conditions, and before the first update, does not count.
+        Timestamps are time.monotonic() seconds and must not decrease.
+        """
+        if self._timestamp is not None and self._temperature is not None and self._humidity is not None:
+            self.advance(self._temperature, self._humidity, (timestamp - self._timestamp) / 3600)
+        self._timestamp = timestamp
+        self._temperature = temperature
+        self._humidity = humidity
+
+    def advance(self, temperature: float, humidity: float, hours: float) -> None:
+        """Advance the index by hours at a temperature in °C and a relative humidity in %."""
+        critical = critical_humidity(temperature)
+        if temperature <= 0 or temperature >= 50 or humidity < critical:
+            start = self.unfavourable_hours
+            end = start + hours
+            decline = _DECLINE_FAST * max(min(end, 6) - start, 0) + _DECLINE_SLOW * max(end - max(start, 24), 0)
+            self.index = max(self.index - decline, 0.0)
+            self.unfavourable_hours = end
+            return
+
+        self.unfavourable_hours = 0.0
+        excess = (critical - humidity) / (critical - 100) if critical < 100 else 1.0
+        max_index = _MAX_INDEX_A + _MAX_INDEX_B * excess - _MAX_INDEX_C * excess * excess
+        # Hours to reach index 1 on a sawn surface, the growth rate is its inverse
+        hours_to_index_1 = 7 * 24 * math.exp(-0.68 * math.log(temperature) - 13.9 * math.log(humidity) + 66.02)
+        while hours > 0:
+            step = min(hours, MOULD_GROWTH_MAX_STEP)
+            k1 = 1.0 if self.index < 1 else 2.0
+            k2 = max(1 - math.exp(2.3 * (self.index - max_index)), 0.0)
+            self.index = min(self.index + step * k1 * k2 / hours_to_index_1, MOULD_INDEX_MAX)
+            hours -= step
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the state to store."""
+        return {"index": self.index, "unfavourable_hours": self.unfavourable_hours}
+
+
+class MouldGrowthStore(DeviceStore[MouldGrowth]):
+    """Mould growth indices of all devices, stored across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store, async_load reads it."""
+        super().__init__(hass, MOULD_GROWTH_STORAGE_VERSION, MOULD_GROWTH_STORAGE_KEY, MOULD_GROWTH_SAVE_DELAY, MouldGrowth)
+
+
+async def async_get_mould_growth_store(hass: HomeAssistant) -> MouldGrowthStore:
+    """Return the mould growth store, reading it on first use."""
+    if (store := hass.data.get(DATA_MOULD_GROWTH)) is None:
+        store = hass.data[DATA_MOULD_GROWTH] = MouldGrowthStore(hass)
+    await store.async_load()
+    return store
@@ -0,0 +1,95 @@
+"""Wet-bulb temperature by the psychrometric equation of ASHRAE Fundamentals (2021).
+
+The equation gives the humidity ratio of air from its temperature and the
+temperature of a wetted surface that evaporates into it, the thermodynamic
+wet-bulb temperature. That temperature is found with the secant method,
+seeded from the closed form fit of Stull (2011) and kept within the bracket
+from the dew point to the air temperature. The number of iterations is bounded,
+each costs one saturation pressure.
+
+Temperatures are in °C, pressures in Pa and humidity ratios in kg/kg.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import math
+
+WET_BULB_MAX_ITERATIONS = 10
+WET_BULB_TOLERANCE = 0.0005  # °C
+# Below the dew point of the bracket, the dew point of another saturation model can be a little higher
+WET_BULB_BRACKET_MARGIN = 1.0  # °C
+
+
+def stull_wet_bulb(temperature: float, humidity: float) -> float:
+    """Return the wet-bulb temperature at standard pressure by the fit of Stull (2011), within 1 °C for 5 to 99 % and -20 to 50 °C."""
+    return (
+        temperature * math.atan(0.151977 * math.sqrt(humidity + 8.313659))
+        + math.atan(temperature + humidity)
+        - math.atan(humidity - 1.676331)
+        + 0.00391838 * humidity**1.5 * math.atan(0.023101 * humidity)
+        - 4.686035
+    )
+
+
+def humidity_ratio(vapor_pressure: float, pressure: float) -> float:
+    """Return the humidity ratio of air (ASHRAE fundamentals 2021 pg 1.9 eq 20)."""
+    return 0.621945 * vapor_pressure / (pressure - vapor_pressure)
+
+
+def psychrometric_humidity_ratio(temperature: float, wet_bulb: float, pressure: float, saturation_pressure: Callable[[float], float]) -> float:
+    """Return the humidity ratio of air with a wet-bulb temperature (ASHRAE fundamentals 2021 pg 1.10 eq 33 and 35)."""
+    saturated = humidity_ratio(saturation_pressure(wet_bulb), pressure)
+    if wet_bulb >= 0:
+        return ((2501 - 2.326 * wet_bulb) * saturated - 1.006 * (temperature - wet_bulb)) / (2501 + 1.86 * temperature - 4.186 * wet_bulb)
+    # Over ice
+    return ((2830 - 0.24 * wet_bulb) * saturated - 1.006 * (temperature - wet_bulb)) / (2830 + 1.86 * temperature - 2.1 * wet_bulb)
+
+
+def wet_bulb_temperature(
+    temperature: float,
+    humidity_ratio: float,
+    pressure: float,
+    saturation_pressure: Callable[[float], float],
+    dew_point: float,
+    seed: float,
+) -> float:
+    """Return the thermodynamic wet-bulb temperature.
+
+    The result is within the bracket even if the iterations run out.
+
+    :param humidity_ratio: of the air, see humidity_ratio
+    :param saturation_pressure: saturation vapour pressure in Pa of a temperature
+    :param dew_point: lower end of the bracket
+    :param seed: estimate to start from, e.g. stull_wet_bulb
+    """
+    lower = dew_point - WET_BULB_BRACKET_MARGIN
+    upper = temperature
+    if lower >= upper:
+        return temperature
+
+    def residual(wet_bulb: float) -> float:
+        # Increases with the wet-bulb temperature
+        return psychrometric_humidity_ratio(temperature, wet_bulb, pressure, saturation_pressure) - humidity_ratio
+
+    previous = min(max(seed, lower), upper)
+    previous_residual = residual(previous)
+    current = previous - 0.1 if previous_residual > 0 else previous + 0.1
+    for _ in range(WET_BULB_MAX_ITERATIONS):
+        if previous_residual > 0:
+            upper = min(upper, previous)
+        else:
+            lower = max(lower, previous)
+        if upper - lower <= WET_BULB_TOLERANCE:
+            return (lower + upper) / 2
+        # Steps out of the bracket end just inside it, the root of saturated air is at its upper end
+        current = min(max(current, lower + WET_BULB_TOLERANCE / 2), upper - WET_BULB_TOLERANCE / 2)
+        current_residual = residual(current)
+        if current_residual == previous_residual:
+            return current
+        step = current_residual * (current - previous) / (current_residual - previous_residual)
+        previous, previous_residual = current, current_residual
+        current -= step
+        if abs(step) <= WET_BULB_TOLERANCE:
+            break
+    return min(max(current, lower), upper)
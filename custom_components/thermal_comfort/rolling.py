@@ -0,0 +1,185 @@
+"""Rolling statistics of Thermal Comfort values, maintained incrementally as updates arrive."""
+
+from __future__ import annotations
+
+from collections import deque
+from enum import StrEnum
+
+
+class RollingStatistic(StrEnum):
+    """Statistics of a rolling window."""
+
+    MIN = "min"
+    MAX = "max"
+    MEAN = "mean"
+
+
+# Window lengths in seconds by their name in unique_ids and sensor names
+ROLLING_WINDOWS = {"1h": 3600, "24h": 86400}
+# Window length of trends in seconds, short enough to follow a shower within minutes
+TREND_WINDOW = 900
+# Seconds between reads of the windows without new input, so that values leaving them expire
+EXPIRY_INTERVAL = TREND_WINDOW / 15
+
+
+class RollingStatistics:
+    """Minimum, maximum and time-weighted mean of a value over a sliding time window.
+
+    Each value holds from its timestamp until the next one, so the last sample before the
+    window still counts from the start of the window. Older samples are dropped as they
+    leave the window. The minimum and maximum are the fronts of monotonic deques and the
+    mean comes from a running integral, which makes adding a sample and reading the
+    statistics amortized O(1).
+    """
+
+    def __init__(self, window: float) -> None:
+        """Initialize empty statistics.
+
+        :param window: length of the window in seconds
+        """
+        self.window = window
+        self._samples: deque[tuple[float, float]] = deque()  # (timestamp, value)
+        self._integral = 0.0  # of the held values from the first to the last sample
+        self._min: deque[tuple[float, float]] = deque()  # increasing values
+        self._max: deque[tuple[float, float]] = deque()  # decreasing values
+
+    def __len__(self) -> int:
+        """Return the number of samples kept."""
+        return len(self._samples)
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample, its timestamp must not be before that of earlier samples and reads."""
+        if self._samples:
+            last_timestamp, last_value = self._samples[-1]
+            self._integral += last_value * (timestamp - last_timestamp)
+        self._samples.append((timestamp, value))
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((timestamp, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((timestamp, value))
+        self._evict(timestamp)
+
+    def _evict(self, now: float) -> None:
+        """Drop the samples that no longer hold within the window ending now."""
+        samples = self._samples
+        start = now - self.window
+        while len(samples) > 1 and samples[1][0] <= start:
+            timestamp, value = samples.popleft()
+            self._integral -= value * (samples[0][0] - timestamp)
+        if samples:
+            first = samples[0][0]
+            while self._min[0][0] < first:
+                self._min.popleft()
+            while self._max[0][0] < first:
+                self._max.popleft()
+
+    def minimum(self, now: float) -> float | None:
+        """Return the minimum within the window ending now, None without samples."""
+        self._evict(now)
+        return self._min[0][1] if self._min else None
+
+    def maximum(self, now: float) -> float | None:
+        """Return the maximum within the window ending now, None without samples."""
+        self._evict(now)
+        return self._max[0][1] if self._max else None
+
+    def mean(self, now: float) -> float | None:
+        """Return the time-weighted mean within the window ending now, None without samples.
+
+        Before the first sample nothing is known, so a window that is not filled yet
+        averages over the time since the first sample only.
+        """
+        self._evict(now)
+        if not self._samples:
+            return None
+        first_timestamp, first_value = self._samples[0]
+        last_timestamp, last_value = self._samples[-1]
+        start = max(now - self.window, first_timestamp)
+        if now <= start:
+            return last_value
+        integral = self._integral + last_value * (now - last_timestamp) - first_value * (start - first_timestamp)
+        return integral / (now - start)
+
+    def get(self, statistic: RollingStatistic, now: float) -> float | None:
+        """Return a statistic within the window ending now."""
+        if statistic is RollingStatistic.MIN:
+            return self.minimum(now)
+        if statistic is RollingStatistic.MAX:
+            return self.maximum(now)
+        return self.mean(now)
+
+
+class RollingTrend:
+    """Slope of a value over a sliding time window by least squares regression.
+
+    Running sums of the samples in the window are updated as samples are added and
+    dropped, so adding a sample and reading the slope are amortized O(1). Timestamps are
+    taken relative to an origin that moves along once per window, which keeps the sums
+    small and the regression numerically stable.
+    """
+
+    def __init__(self, window: float) -> None:
+        """Initialize an empty trend.
+
+        :param window: length of the window in seconds
+        """
+        self.window = window
+        self._samples: deque[tuple[float, float]] = deque()  # (timestamp relative to the origin, value)
+        self._origin = 0.0
+        self._sum_t = 0.0
+        self._sum_v = 0.0
+        self._sum_tt = 0.0
+        self._sum_tv = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample, its timestamp must not be before that of earlier samples and reads."""
+        if not self._samples:
+            self._origin = timestamp
+        elif timestamp - self._origin > 2 * self.window:
+            self._evict(timestamp)
+            self._rebase(self._origin + self._samples[0][0] if self._samples else timestamp)
+        t = timestamp - self._origin
+        self._samples.append((t, value))
+        self._sum_t += t
+        self._sum_v += value
+        self._sum_tt += t * t
+        self._sum_tv += t * value
+        self._evict(timestamp)
+
+    def _rebase(self, origin: float) -> None:
+        """Move the origin and recompute the sums, once per window."""
+        shift = origin - self._origin
+        self._origin = origin
+        self._samples = deque((t - shift, value) for t, value in self._samples)
+        self._sum_t = sum(t for t, _ in self._samples)
+        self._sum_v = sum(value for _, value in self._samples)
+        self._sum_tt = sum(t * t for t, _ in self._samples)
+        self._sum_tv = sum(t * value for t, value in self._samples)
+
+    def _evict(self, now: float) -> None:
+        """Drop the samples before the window ending now."""
+        start = now - self.window - self._origin
+        samples = self._samples
+        while samples and samples[0][0] < start:
+            t, value = samples.popleft()
+            self._sum_t -= t
+            self._sum_v -= value
+            self._sum_tt -= t * t
+            self._sum_tv -= t * value
+
+    def slope(self, now: float) -> float | None:
+        """Return the slope per second within the window ending now, None with less than two samples at different times."""
+        self._evict(now)
+        count = len(self._samples)
+        if count < 2:
+            return None
+        denominator = count * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 1e-9 * count * self._sum_tt:
+            return None
+        return (count * self._sum_tv - self._sum_t * self._sum_v) / denominator
@@ -0,0 +1,91 @@
+"""Saturation vapour pressure models shared by the Thermal Comfort formulas.
+
+With the legacy ``formula`` model every sensor keeps the constants of its
+published formula. Any other model is evaluated once per update and all
+vapour pressure dependent sensors (dew point and everything derived from it,
+absolute humidity, relative strain and moist air enthalpy) use its result.
+
+Saturation vapour pressures are over water, in hPa, temperatures in °C.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from enum import StrEnum
+import math
+
+STANDARD_PRESSURE_HPA = 1013.246
+
+
+class SaturationModel(StrEnum):
+    """Saturation vapour pressure models."""
+
+    FORMULA = "formula"
+    MAGNUS = "magnus"
+    BUCK = "buck"
+    GOFF_GRATCH = "goff_gratch"
+
+
+def magnus_saturation_vapor_pressure(temperature: float) -> float:
+    """Magnus form with the constants of Alduchov and Eskridge (1996)."""
+    return 6.1094 * math.exp(17.625 * temperature / (243.04 + temperature))
+
+
+def magnus_dew_point(vapor_pressure: float) -> float:
+    """Invert magnus_saturation_vapor_pressure."""
+    L = math.log(vapor_pressure / 6.1094)
+    return 243.04 * L / (17.625 - L)
+
+
+def buck_saturation_vapor_pressure(temperature: float) -> float:
+    """Arden Buck equation (1996)."""
+    return 6.1121 * math.exp((18.678 - temperature / 234.5) * (temperature / (257.14 + temperature)))
+
+
+def buck_dew_point(vapor_pressure: float) -> float:
+    """Invert buck_saturation_vapor_pressure, the lower root of its quadratic in temperature."""
+    L = math.log(vapor_pressure / 6.1121)
+    b = 18.678 - L
+    return 234.5 / 2 * (b - math.sqrt(b * b - 4 * 257.14 * L / 234.5))
+
+
+def goff_gratch_saturation_vapor_pressure(temperature: float) -> float:
+    """Goff-Gratch style series <http://wahiduddin.net/calc/density_algorithms.htm>."""
+    A0 = 373.15 / (273.15 + temperature)
+    SUM = -7.90298 * (A0 - 1)
+    SUM += 5.02808 * math.log(A0, 10)
+    SUM += -1.3816e-7 * (pow(10, (11.344 * (1 - 1 / A0))) - 1)
+    SUM += 8.1328e-3 * (pow(10, (-3.49149 * (A0 - 1))) - 1)
+    SUM += math.log(STANDARD_PRESSURE_HPA, 10)
+    return pow(10, SUM)
+
+
+def goff_gratch_dew_point(vapor_pressure: float) -> float:
+    """Dew point approximation published together with the series."""
+    Td = math.log(vapor_pressure / 6.1078)
+    return (241.88 * Td) / (17.558 - Td)
+
+
+def goff_gratch_dew_point_vapor_pressure(dew_point: float) -> float:
+    """Invert goff_gratch_dew_point."""
+    return 6.1078 * math.exp(17.558 * dew_point / (241.88 + dew_point))
+
+
+SATURATION_VAPOR_PRESSURE: dict[SaturationModel, Callable[[float], float]] = {
+    SaturationModel.MAGNUS: magnus_saturation_vapor_pressure,
+    SaturationModel.BUCK: buck_saturation_vapor_pressure,
+    SaturationModel.GOFF_GRATCH: goff_gratch_saturation_vapor_pressure,
+}
+
+DEW_POINT: dict[SaturationModel, Callable[[float], float]] = {
+    SaturationModel.MAGNUS: magnus_dew_point,
+    SaturationModel.BUCK: buck_dew_point,
+    SaturationModel.GOFF_GRATCH: goff_gratch_dew_point,
+}
+
+# Vapour pressure of a dew point, the inverse of DEW_POINT
+DEW_POINT_VAPOR_PRESSURE: dict[SaturationModel, Callable[[float], float]] = {
+    SaturationModel.MAGNUS: magnus_saturation_vapor_pressure,
+    SaturationModel.BUCK: buck_saturation_vapor_pressure,
+    SaturationModel.GOFF_GRATCH: goff_gratch_dew_point_vapor_pressure,
+}
@@ -1,12 +1,14 @@
 """Sensor platform for Thermal Comfort integration."""
 
 from asyncio import Lock
-from dataclasses import dataclass
-from datetime import timedelta
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 from enum import StrEnum
-from functools import wraps
+from functools import partial, wraps
 import logging
 import math
+import time
 from typing import Any, Self
 
 import voluptuous as vol
@@ -21,23 +23,78 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_SENSORS,
     CONF_UNIQUE_ID,
+    PERCENTAGE,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    UnitOfPressure,
+    UnitOfSpeed,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
 from homeassistant.helpers.template import Template
 from homeassistant.loader import async_get_custom_components
-from homeassistant.util import convert as convert_pressure
-from homeassistant.util.unit_conversion import TemperatureConverter
-
-from .const import COMPUTE_DEVICE, CONF_PRESSURE_SENSOR, DEFAULT_NAME, DOMAIN
+import homeassistant.util.dt as dt_util
+from homeassistant.util.unit_conversion import PressureConverter, SpeedConverter, TemperatureConverter
+
+from .adaptive import (
+    RunningMeanTemperature,
+    acceptability,
+    adaptive_comfort_temperature,
+    async_get_running_mean_store,
+)
+from .const import (
+    COMPUTE_DEVICE,
+    CONF_AIR_SPEED,
+    CONF_BUNDLE,
+    CONF_CLOTHING_INSULATION,
+    CONF_COMFORT_ZONES,
+    CONF_INPUT_ATTRIBUTES,
+    CONF_LOOKUP_TABLES,
+    CONF_METABOLIC_RATE,
+    CONF_OUTDOOR_DEVICE,
+    CONF_PRESSURE_SENSOR,
+    CONF_RADIANT_TEMPERATURE_SENSOR,
+    CONF_ROLLING_STATISTICS,
+    CONF_SATURATION_MODEL,
+    CONF_SLOW_UPDATE_THRESHOLD,
+    CONF_TRENDS,
+    CONF_WIND_SPEED_SENSOR,
+    DATA_DEVICES,
+    DATA_LEGACY_PLATFORM,
+    DATA_RUNNING_MEAN,
+    DATA_YAML_DEVICES,
+    DEFAULT_NAME,
+    DOMAIN,
+    HUMIDITY_MAX,
+    HUMIDITY_MIN,
+    TEMPERATURE_MAX,
+    TEMPERATURE_MIN,
+)
+from .inverse import InverseTarget, SolveFor, humidex_dew_point, humidex_vapor_pressure, solve_bracketed
+from .lookup import EXACT_KERNELS, async_get_lookup_tables
+from .metrics import DeviceMetrics, UpdateStage, UpdateTimer
+from .mould import MouldGrowth, MouldGrowthStore, async_get_mould_growth_store, critical_humidity
+from .pmv import (
+    AIR_SPEED_DEFAULT,
+    CLOTHING_INSULATION_DEFAULT,
+    COMFORT_INPUT_RANGES,
+    METABOLIC_RATE_DEFAULT,
+    PERSONAL_INPUTS,
+    ComfortInput,
+    Occupant,
+    predicted_percentage_dissatisfied as percentage_dissatisfied,
+)
+from .psychrometrics import humidity_ratio, stull_wet_bulb, wet_bulb_temperature
+from .rolling import EXPIRY_INTERVAL, ROLLING_WINDOWS, TREND_WINDOW, RollingStatistic, RollingStatistics, RollingTrend
+from .saturation import DEW_POINT, DEW_POINT_VAPOR_PRESSURE, SATURATION_VAPOR_PRESSURE, SaturationModel, goff_gratch_dew_point, goff_gratch_dew_point_vapor_pressure
+from .utci import WIND_SPEED_DEFAULT, universal_thermal_climate_index
+from .zones import DEFAULT_COMFORT_ZONES, ZONE_OUTSIDE, comfort_zones, freeze_zones
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,11 +102,16 @@ ATTR_DEW_POINT = "dew_point"
 ATTR_HUMIDITY = "humidity"
 ATTR_HUMIDEX = "humidex"
 ATTR_FROST_POINT = "frost_point"
+ATTR_CRITICAL_HUMIDITY = "critical_humidity"
 ATTR_RELATIVE_STRAIN_INDEX = "relative_strain_index"
 ATTR_SUMMER_SCHARLAU_INDEX = "summer_scharlau_index"
 ATTR_WINTER_SCHARLAU_INDEX = "winter_scharlau_index"
 ATTR_SUMMER_SIMMER_INDEX = "summer_simmer_index"
 ATTR_THOMS_DISCOMFORT_INDEX = "thoms_discomfort_index"
+ATTR_PREVAILING_MEAN_OUTDOOR_TEMPERATURE = "prevailing_mean_outdoor_temperature"
+ATTR_OPERATIVE_TEMPERATURE = "operative_temperature"
+ATTR_ACCEPTABILITY = "acceptability"
+ATTR_COMFORT_ZONES = "comfort_zones"
 CONF_ENABLED_SENSORS = "enabled_sensors"
 CONF_SENSOR_TYPES = "sensor_types"
 CONF_CUSTOM_ICONS = "custom_icons"
@@ -60,6 +122,13 @@ CONF_HUMIDITY_SENSOR = "humidity_sensor"
 CONF_POLL = "poll"
 # Default values
 POLL_DEFAULT = False
+LOOKUP_TABLES_DEFAULT = False
+BUNDLE_DEFAULT = False
+INPUT_ATTRIBUTES_DEFAULT = True
+ROLLING_STATISTICS_DEFAULT: list[str] = []
+TRENDS_DEFAULT: list[str] = []
+SATURATION_MODEL_DEFAULT = SaturationModel.FORMULA
+SLOW_UPDATE_THRESHOLD_DEFAULT = 0  # milliseconds, 0 disables the stage timing
 SCAN_INTERVAL_DEFAULT = 30
 DISPLAY_PRECISION = 2
 
@@ -76,6 +145,8 @@ class SensorType(StrEnum):
     """Sensor type enum."""
 
     ABSOLUTE_HUMIDITY = "absolute_humidity"
+    ADAPTIVE_COMFORT_TEMPERATURE = "adaptive_comfort_temperature"
+    COMFORT_ZONE = "comfort_zone"
     DEW_POINT = "dew_point"
     DEW_POINT_PERCEPTION = "dew_point_perception"
     FROST_POINT = "frost_point"
@@ -84,12 +155,18 @@ class SensorType(StrEnum):
     HUMIDEX = "humidex"
     HUMIDEX_PERCEPTION = "humidex_perception"
     MOIST_AIR_ENTHALPY = "moist_air_enthalpy"
+    MOULD_RISK = "mould_risk"
+    PREDICTED_MEAN_VOTE = "predicted_mean_vote"
+    PREDICTED_PERCENTAGE_DISSATISFIED = "predicted_percentage_dissatisfied"
     RELATIVE_STRAIN_PERCEPTION = "relative_strain_perception"
     SUMMER_SCHARLAU_PERCEPTION = "summer_scharlau_perception"
     WINTER_SCHARLAU_PERCEPTION = "winter_scharlau_perception"
     SUMMER_SIMMER_INDEX = "summer_simmer_index"
     SUMMER_SIMMER_PERCEPTION = "summer_simmer_perception"
     THOMS_DISCOMFORT_PERCEPTION = "thoms_discomfort_perception"
+    UNIVERSAL_THERMAL_CLIMATE_INDEX = "universal_thermal_climate_index"
+    WET_BULB_GLOBE_TEMPERATURE = "wet_bulb_globe_temperature"
+    WET_BULB_TEMPERATURE = "wet_bulb_temperature"
 
     def to_name(self) -> str:
         """Return the title of the sensor type."""
@@ -106,6 +183,13 @@ class SensorType(StrEnum):
             )
 
 
+class IntermediateType(StrEnum):
+    """Values computed once per update and shared by several sensor types."""
+
+    SATURATION_VAPOR_PRESSURE = "saturation_vapor_pressure"
+    HUMIDITY_RATIO = "humidity_ratio"
+
+
 class DewPointPerception(StrEnum):
     """Thermal Perception."""
 
@@ -262,6 +346,25 @@ SENSOR_TYPES = {
         "state_class": SensorStateClass.MEASUREMENT,
         "icon": "mdi:water-circle",
     },
+    SensorType.MOULD_RISK: {
+        "key": SensorType.MOULD_RISK,
+        "suggested_display_precision": DISPLAY_PRECISION,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:bacteria-outline",
+    },
+    SensorType.PREDICTED_MEAN_VOTE: {
+        "key": SensorType.PREDICTED_MEAN_VOTE,
+        "suggested_display_precision": DISPLAY_PRECISION,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:account-question",
+    },
+    SensorType.PREDICTED_PERCENTAGE_DISSATISFIED: {
+        "key": SensorType.PREDICTED_PERCENTAGE_DISSATISFIED,
+        "suggested_display_precision": 1,
+        "native_unit_of_measurement": PERCENTAGE,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:account-group",
+    },
     SensorType.RELATIVE_STRAIN_PERCEPTION: {
         "key": SensorType.RELATIVE_STRAIN_PERCEPTION,
         "device_class": SensorDeviceClass.ENUM,
@@ -300,9 +403,62 @@ SENSOR_TYPES = {
         "options": list(map(str, ThomsDiscomfortPerception)),
         "icon": "mdi:sun-thermometer",
     },
+    SensorType.UNIVERSAL_THERMAL_CLIMATE_INDEX: {
+        "key": SensorType.UNIVERSAL_THERMAL_CLIMATE_INDEX,
+        "device_class": SensorDeviceClass.TEMPERATURE,
+        "suggested_display_precision": DISPLAY_PRECISION,
+        "native_unit_of_measurement": UnitOfTemperature.CELSIUS,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:weather-windy",
+    },
+    SensorType.WET_BULB_GLOBE_TEMPERATURE: {
+        "key": SensorType.WET_BULB_GLOBE_TEMPERATURE,
+        "device_class": SensorDeviceClass.TEMPERATURE,
+        "suggested_display_precision": DISPLAY_PRECISION,
+        "native_unit_of_measurement": UnitOfTemperature.CELSIUS,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:sun-thermometer-outline",
+    },
+    SensorType.WET_BULB_TEMPERATURE: {
+        "key": SensorType.WET_BULB_TEMPERATURE,
+        "device_class": SensorDeviceClass.TEMPERATURE,
+        "suggested_display_precision": DISPLAY_PRECISION,
+        "native_unit_of_measurement": UnitOfTemperature.CELSIUS,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:thermometer-water",
+    },
+    SensorType.ADAPTIVE_COMFORT_TEMPERATURE: {
+        "key": SensorType.ADAPTIVE_COMFORT_TEMPERATURE,
+        "device_class": SensorDeviceClass.TEMPERATURE,
+        "suggested_display_precision": DISPLAY_PRECISION,
+        "native_unit_of_measurement": UnitOfTemperature.CELSIUS,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:home-thermometer-outline",
+    },
+    SensorType.COMFORT_ZONE: {
+        "key": SensorType.COMFORT_ZONE,
+        "icon": "mdi:vector-polygon",
+    },
 }
 
-DEFAULT_SENSOR_TYPES = list(SENSOR_TYPES.keys())
+# Sensor types only created when asked for, they keep state of their own, need inputs to be set up or solve iteratively
+OPT_IN_SENSOR_TYPES = [
+    SensorType.ADAPTIVE_COMFORT_TEMPERATURE,
+    SensorType.COMFORT_ZONE,
+    SensorType.MOULD_RISK,
+    SensorType.PREDICTED_MEAN_VOTE,
+    SensorType.PREDICTED_PERCENTAGE_DISSATISFIED,
+    SensorType.UNIVERSAL_THERMAL_CLIMATE_INDEX,
+    SensorType.WET_BULB_GLOBE_TEMPERATURE,
+    SensorType.WET_BULB_TEMPERATURE,
+]
+DEFAULT_SENSOR_TYPES = [sensor_type for sensor_type in SENSOR_TYPES if sensor_type not in OPT_IN_SENSOR_TYPES]
+# Sensor types that can have rolling statistics sensors
+ROLLING_STATISTICS_TYPES = [SensorType.DEW_POINT, SensorType.HEAT_INDEX, SensorType.ABSOLUTE_HUMIDITY]
+# Sensor types that can have trend sensors
+TREND_TYPES = [SensorType.DEW_POINT, SensorType.ABSOLUTE_HUMIDITY]
+# State of the bundle sensor if it is one of the bundled sensor types
+BUNDLE_PRIMARY = SensorType.DEW_POINT
 
 SENSOR_OPTIONS_SCHEMA = vol.Schema(
     {
@@ -310,6 +466,20 @@ SENSOR_OPTIONS_SCHEMA = vol.Schema(
         vol.Optional(CONF_SCAN_INTERVAL): cv.time_period,
         vol.Optional(CONF_CUSTOM_ICONS): cv.boolean,
         vol.Optional(CONF_SENSOR_TYPES): cv.ensure_list,
+        vol.Optional(CONF_LOOKUP_TABLES): cv.boolean,
+        vol.Optional(CONF_SATURATION_MODEL): vol.Coerce(SaturationModel),
+        vol.Optional(CONF_SLOW_UPDATE_THRESHOLD): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_BUNDLE): cv.boolean,
+        vol.Optional(CONF_INPUT_ATTRIBUTES): cv.boolean,
+        vol.Optional(CONF_ROLLING_STATISTICS): vol.All(cv.ensure_list, [vol.In(ROLLING_STATISTICS_TYPES)]),
+        vol.Optional(CONF_TRENDS): vol.All(cv.ensure_list, [vol.In(TREND_TYPES)]),
+        # Corners of each zone as [operative temperature in °C, relative humidity in %]
+        vol.Optional(CONF_COMFORT_ZONES): {
+            cv.string: vol.All(vol.Length(min=3), [vol.ExactSequence([vol.Coerce(float), vol.All(vol.Coerce(float), vol.Range(min=0, max=100))])])
+        },
+        vol.Optional(CONF_AIR_SPEED): vol.Any(vol.All(vol.Coerce(float), vol.Range(*COMFORT_INPUT_RANGES[ComfortInput.AIR_SPEED])), cv.entity_id),
+        vol.Optional(CONF_METABOLIC_RATE): vol.Any(vol.All(vol.Coerce(float), vol.Range(*COMFORT_INPUT_RANGES[ComfortInput.METABOLIC_RATE])), cv.entity_id),
+        vol.Optional(CONF_CLOTHING_INSULATION): vol.Any(vol.All(vol.Coerce(float), vol.Range(*COMFORT_INPUT_RANGES[ComfortInput.CLOTHING_INSULATION])), cv.entity_id),
     },
     extra=vol.REMOVE_EXTRA,
 )
@@ -319,6 +489,9 @@ SENSOR_SCHEMA = vol.Schema(
         vol.Optional(CONF_NAME): cv.string,
         vol.Required(CONF_TEMPERATURE_SENSOR): cv.entity_id,
         vol.Required(CONF_HUMIDITY_SENSOR): cv.entity_id,
+        vol.Optional(CONF_RADIANT_TEMPERATURE_SENSOR): cv.entity_id,
+        vol.Optional(CONF_WIND_SPEED_SENSOR): cv.entity_id,
+        vol.Optional(CONF_OUTDOOR_DEVICE): cv.string,
         vol.Optional(CONF_ICON_TEMPLATE): cv.template,
         vol.Optional(CONF_ENTITY_PICTURE_TEMPLATE): cv.template,
         vol.Required(CONF_UNIQUE_ID): cv.string,
@@ -326,8 +499,16 @@ SENSOR_SCHEMA = vol.Schema(
 ).extend(SENSOR_OPTIONS_SCHEMA.schema)
 
 
+# Seconds the nested computes of the running compute took, its own time excludes them.
+# Each sensor update runs in its own task and so has its own stack of computes.
+_nested_compute_time: ContextVar[list[float] | None] = ContextVar("nested_compute_time", default=None)
+
+
 def compute_once_lock(sensor_type):
-    """Only compute if sensor_type needs update, return just the value otherwise."""
+    """Only compute if sensor_type (or an IntermediateType) needs update, return just the value otherwise.
+
+    Compute times are exclusive, e.g. frost_risk does not count the time of dew_point.
+    """
 
     def wrapper(func):
         @wraps(func)
@@ -335,11 +516,29 @@ def compute_once_lock(sensor_type):
             # Check if inputs are invalid; return None if so
             if self._temperature is None or self._humidity is None:
                 return None
-            async with self._compute_states[sensor_type].lock:
-                if self._compute_states[sensor_type].needs_update:
-                    setattr(self, f"_{sensor_type}", await func(self, *args, **kwargs))
-                    self._compute_states[sensor_type].needs_update = False
-                return getattr(self, f"_{sensor_type}", None)
+            # The caller does not count this call, waiting for the lock included
+            call_start = time.perf_counter()
+            try:
+                async with self._compute_states[sensor_type].lock:
+                    if self._compute_states[sensor_type].needs_update:
+                        nested = [0.0]
+                        token = _nested_compute_time.set(nested)
+                        start = time.perf_counter()
+                        try:
+                            setattr(self, f"_{sensor_type}", await func(self, *args, **kwargs))
+                        finally:
+                            _nested_compute_time.reset(token)
+                        elapsed = time.perf_counter() - start - nested[0]
+                        self.metrics.record_compute(sensor_type, elapsed)
+                        if self.timer is not None:
+                            self.timer.add(UpdateStage.FORMULA, elapsed)
+                        self._compute_states[sensor_type].needs_update = False
+                    else:
+                        self.metrics.record_cache_hit(sensor_type)
+                    return getattr(self, f"_{sensor_type}", None)
+            finally:
+                if (caller := _nested_compute_time.get()) is not None:
+                    caller[0] += time.perf_counter() - call_start
 
         return wrapped
 
@@ -354,6 +553,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         )
         devices = [dict(device_config, **{CONF_NAME: device_name}) for (device_name, device_config) in config[CONF_SENSORS].items()]
         options = {}
+        hass.data[DATA_LEGACY_PLATFORM] = True
     else:
         devices = discovery_info["devices"]
         options = discovery_info["options"]
@@ -371,19 +571,52 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
             pressure_entity=device_config.get(CONF_PRESSURE_SENSOR),
             should_poll=device_config.get(CONF_POLL, POLL_DEFAULT),
             scan_interval=device_config.get(CONF_SCAN_INTERVAL, timedelta(seconds=SCAN_INTERVAL_DEFAULT)),
+            lookup_tables=device_config.get(CONF_LOOKUP_TABLES, LOOKUP_TABLES_DEFAULT),
+            saturation_model=device_config.get(CONF_SATURATION_MODEL, SATURATION_MODEL_DEFAULT),
+            slow_update_threshold=device_config.get(CONF_SLOW_UPDATE_THRESHOLD, SLOW_UPDATE_THRESHOLD_DEFAULT),
+            input_attributes=device_config.get(CONF_INPUT_ATTRIBUTES, INPUT_ATTRIBUTES_DEFAULT),
+            rolling_statistics=device_config.get(CONF_ROLLING_STATISTICS, ROLLING_STATISTICS_DEFAULT),
+            trends=device_config.get(CONF_TRENDS, TRENDS_DEFAULT),
+            radiant_temperature_entity=device_config.get(CONF_RADIANT_TEMPERATURE_SENSOR),
+            wind_speed_entity=device_config.get(CONF_WIND_SPEED_SENSOR),
+            outdoor_device=device_config.get(CONF_OUTDOOR_DEVICE),
+            comfort_zones=device_config.get(CONF_COMFORT_ZONES, DEFAULT_COMFORT_ZONES),
+            air_speed=device_config.get(CONF_AIR_SPEED, AIR_SPEED_DEFAULT),
+            metabolic_rate=device_config.get(CONF_METABOLIC_RATE, METABOLIC_RATE_DEFAULT),
+            clothing_insulation=device_config.get(CONF_CLOTHING_INSULATION, CLOTHING_INSULATION_DEFAULT),
         )
-
-        sensors += [
-            SensorThermalComfort(
-                device=compute_device,
-                icon_template=device_config.get(CONF_ICON_TEMPLATE),
-                entity_picture_template=device_config.get(CONF_ENTITY_PICTURE_TEMPLATE),
-                sensor_type=SensorType.from_string(sensor_type),
-                custom_icons=device_config.get(CONF_CUSTOM_ICONS, False),
-                is_config_entry=False,
+        if discovery_info is not None:
+            hass.data.setdefault(DATA_YAML_DEVICES, {})[compute_device.unique_id] = (device_config, compute_device)
+
+        sensor_types = [SensorType.from_string(sensor_type) for sensor_type in device_config.get(CONF_SENSOR_TYPES, DEFAULT_SENSOR_TYPES)]
+        # Without sensor types there is nothing to bundle, the device gets no sensors either way
+        if device_config.get(CONF_BUNDLE, BUNDLE_DEFAULT) and sensor_types:
+            primary = BUNDLE_PRIMARY if BUNDLE_PRIMARY in sensor_types else sensor_types[0]
+            async_remove_bundled_entities(hass, compute_device.unique_id, primary)
+            sensors.append(
+                BundleThermalComfort(
+                    device=compute_device,
+                    icon_template=device_config.get(CONF_ICON_TEMPLATE),
+                    entity_picture_template=device_config.get(CONF_ENTITY_PICTURE_TEMPLATE),
+                    sensor_type=primary,
+                    bundled_types=sensor_types,
+                    custom_icons=device_config.get(CONF_CUSTOM_ICONS, False),
+                    is_config_entry=False,
+                )
             )
-            for sensor_type in device_config.get(CONF_SENSOR_TYPES, DEFAULT_SENSOR_TYPES)
-        ]
+        else:
+            sensors += [
+                SensorThermalComfort(
+                    device=compute_device,
+                    icon_template=device_config.get(CONF_ICON_TEMPLATE),
+                    entity_picture_template=device_config.get(CONF_ENTITY_PICTURE_TEMPLATE),
+                    sensor_type=sensor_type,
+                    custom_icons=device_config.get(CONF_CUSTOM_ICONS, False),
+                    is_config_entry=False,
+                )
+                for sensor_type in sensor_types
+            ]
+        sensors += _derived_sensors(compute_device, device_config.get(CONF_CUSTOM_ICONS, False), is_config_entry=False)
 
     async_add_entities(sensors)
     return True
@@ -413,10 +646,37 @@ async def async_setup_entry(
         pressure_entity=data.get(CONF_PRESSURE_SENSOR),
         should_poll=data[CONF_POLL],
         scan_interval=timedelta(seconds=data.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL_DEFAULT)),
+        lookup_tables=data.get(CONF_LOOKUP_TABLES, LOOKUP_TABLES_DEFAULT),
+        saturation_model=data.get(CONF_SATURATION_MODEL, SATURATION_MODEL_DEFAULT),
+        slow_update_threshold=data.get(CONF_SLOW_UPDATE_THRESHOLD, SLOW_UPDATE_THRESHOLD_DEFAULT),
+        input_attributes=data.get(CONF_INPUT_ATTRIBUTES, INPUT_ATTRIBUTES_DEFAULT),
+        rolling_statistics=data.get(CONF_ROLLING_STATISTICS, ROLLING_STATISTICS_DEFAULT),
+        trends=data.get(CONF_TRENDS, TRENDS_DEFAULT),
+        radiant_temperature_entity=data.get(CONF_RADIANT_TEMPERATURE_SENSOR),
+        wind_speed_entity=data.get(CONF_WIND_SPEED_SENSOR),
+        outdoor_device=data.get(CONF_OUTDOOR_DEVICE),
+        air_speed=data.get(CONF_AIR_SPEED, AIR_SPEED_DEFAULT),
+        metabolic_rate=data.get(CONF_METABOLIC_RATE, METABOLIC_RATE_DEFAULT),
+        clothing_insulation=data.get(CONF_CLOTHING_INSULATION, CLOTHING_INSULATION_DEFAULT),
     )
 
     hass.data[DOMAIN][config_entry.entry_id][COMPUTE_DEVICE] = compute_device
 
+    if data.get(CONF_BUNDLE, BUNDLE_DEFAULT):
+        async_remove_bundled_entities(hass, compute_device.unique_id, BUNDLE_PRIMARY)
+        async_add_entities(
+            [
+                BundleThermalComfort(
+                    device=compute_device,
+                    sensor_type=BUNDLE_PRIMARY,
+                    bundled_types=[*DEFAULT_SENSOR_TYPES, *(sensor_type for sensor_type in OPT_IN_SENSOR_TYPES if sensor_type in data.get(CONF_ENABLED_SENSORS, []))],
+                    custom_icons=data[CONF_CUSTOM_ICONS],
+                ),
+                *_derived_sensors(compute_device, data[CONF_CUSTOM_ICONS]),
+            ]
+        )
+        return
+
     entities: list[SensorThermalComfort] = [
         SensorThermalComfort(
             device=compute_device,
@@ -426,11 +686,45 @@ async def async_setup_entry(
         )
         for sensor_type in SensorType
     ]
+    entities += _derived_sensors(compute_device, data[CONF_CUSTOM_ICONS])
 
     if entities:
         async_add_entities(entities)
 
 
+def _derived_sensors(device: "DeviceThermalComfort", custom_icons: bool, is_config_entry: bool = True) -> list["DerivedThermalComfort"]:
+    """Return the rolling statistics sensors of a device, one per sensor type, window and statistic, and its trend sensors."""
+    return [
+        RollingStatisticsThermalComfort(
+            device=device,
+            sensor_type=sensor_type,
+            statistic=statistic,
+            window=window,
+            custom_icons=custom_icons,
+            is_config_entry=is_config_entry,
+        )
+        for sensor_type in device.rolling
+        for window in ROLLING_WINDOWS
+        for statistic in RollingStatistic
+    ] + [TrendThermalComfort(device=device, sensor_type=sensor_type, custom_icons=custom_icons, is_config_entry=is_config_entry) for sensor_type in device.trends]
+
+
+@callback
+def async_remove_bundled_entities(hass: HomeAssistant, unique_id: str, primary: SensorType) -> None:
+    """Remove the per sensor type entities of a device switched to bundle mode.
+
+    The bundle sensor keeps the unique_id, and thereby the entity_id and history, of the
+    primary sensor type. The other sensor types continue as its attributes.
+    """
+    registry = er.async_get(hass)
+    for sensor_type in SensorType:
+        if sensor_type is primary:
+            continue
+        if (entity_id := registry.async_get_entity_id(SENSOR_DOMAIN, DOMAIN, id_generator(unique_id, sensor_type))) is not None:
+            _LOGGER.info("Removing %s, its value is now an attribute of the bundle sensor", entity_id)
+            registry.async_remove(entity_id)
+
+
 def id_generator(unique_id: str, sensor_type: str) -> str:
     """Generate id based on unique_id and sensor type.
 
@@ -444,6 +738,10 @@ def id_generator(unique_id: str, sensor_type: str) -> str:
 class SensorThermalComfort(SensorEntity):
     """Representation of a Thermal Comfort Sensor."""
 
+    # Copies of the input states, the recorder stores the states of the input sensors already. Values that
+    # are states of other sensor types are recorded, the sensor of that type may not be set up.
+    _unrecorded_attributes = frozenset({ATTR_TEMPERATURE, ATTR_HUMIDITY})
+
     def __init__(
         self,
         device: "DeviceThermalComfort",
@@ -457,25 +755,13 @@ class SensorThermalComfort(SensorEntity):
         """Initialize the sensor."""
         self._device = device
         self._sensor_type = sensor_type
-        entity_description = SENSOR_TYPES[sensor_type]
+        entity_description = dict(SENSOR_TYPES[sensor_type])
         entity_description["translation_key"] = sensor_type
         entity_description["has_entity_name"] = True
         if not is_config_entry:
             if self._device.name is not None:
                 entity_description["has_entity_name"] = False
                 entity_description["name"] = f"{self._device.name} {self._sensor_type.to_name()}"
-            if sensor_type in [SensorType.DEW_POINT_PERCEPTION, SensorType.SUMMER_SIMMER_INDEX, SensorType.SUMMER_SIMMER_PERCEPTION]:
-                registry = er.async_get(self._device.hass)
-                match sensor_type:
-                    case SensorType.DEW_POINT_PERCEPTION:
-                        unique_id = id_generator(self._device.unique_id, LegacySensorType.THERMAL_PERCEPTION)
-                    case SensorType.SUMMER_SIMMER_INDEX:
-                        unique_id = id_generator(self._device.unique_id, LegacySensorType.SIMMER_INDEX)
-                    case SensorType.SUMMER_SIMMER_PERCEPTION:
-                        unique_id = id_generator(self._device.unique_id, LegacySensorType.SIMMER_ZONE)
-                entity_id = registry.async_get_entity_id(SENSOR_DOMAIN, DOMAIN, unique_id)
-                if entity_id is not None:
-                    registry.async_update_entity(entity_id, new_unique_id=id_generator(self._device.unique_id, sensor_type))
         if custom_icons:
             if entity_description["key"] in TC_ICONS:
                 entity_description["icon"] = TC_ICONS[entity_description["key"]]
@@ -487,12 +773,18 @@ class SensorThermalComfort(SensorEntity):
         self._attr_extra_state_attributes = {}
         self._attr_unique_id = id_generator(self._device.unique_id, sensor_type)
         self._attr_should_poll = False
+        self._written = None
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
         return self._device.device_info
 
+    def set_custom_icons(self, custom_icons: bool) -> None:
+        """Switch between the custom and the default icon, written with the next update."""
+        icon = TC_ICONS.get(self._sensor_type) if custom_icons else None
+        self._attr_icon = icon or SENSOR_TYPES[self._sensor_type]["icon"]
+
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
@@ -501,6 +793,10 @@ class SensorThermalComfort(SensorEntity):
     async def async_added_to_hass(self):
         """Register callbacks."""
         self._device.sensors.append(self)
+        if self._sensor_type is SensorType.MOULD_RISK:
+            await self._device.async_track_mould_growth()
+        if self._sensor_type is SensorType.ADAPTIVE_COMFORT_TEMPERATURE:
+            await self._device.async_track_running_mean()
         if self._icon_template is not None:
             self._icon_template.hass = self.hass
         if self._entity_picture_template is not None:
@@ -508,9 +804,18 @@ class SensorThermalComfort(SensorEntity):
         if self._device.compute_states[self._sensor_type].needs_update:
             self.async_schedule_update_ha_state(True)
 
+    async def async_will_remove_from_hass(self):
+        """Stop receiving updates from the device."""
+        if self in self._device.sensors:
+            self._device.sensors.remove(self)
+
+    async def _async_value(self):
+        """Return the value of the sensor type, a (value, attributes) tuple for some."""
+        return await getattr(self._device, self._sensor_type)()
+
     async def async_update(self):
         """Update the state of the sensor."""
-        value = await getattr(self._device, self._sensor_type)()
+        value = await self._async_value()
         if value is None:
             self._attr_native_value = None
             self._attr_extra_state_attributes = {}
@@ -522,6 +827,10 @@ class SensorThermalComfort(SensorEntity):
                 self._attr_extra_state_attributes = {}
             self._attr_native_value = value
 
+        timer = self._device.timer
+        if timer is not None:
+            start = time.perf_counter()
+
         # Handle icon and entity picture templates
         for property_name, template in (
             ("_attr_icon", self._icon_template),
@@ -553,8 +862,133 @@ class SensorThermalComfort(SensorEntity):
                         ex,
                     )
 
-        # Explicitly write the state to ensure it updates in Home Assistant
-        self.async_write_ha_state()
+        if timer is not None:
+            timer.add(UpdateStage.TEMPLATE, time.perf_counter() - start)
+
+        # Write the state only if something changed since the last write, Home Assistant drops
+        # an unchanged state anyway, skipping it saves building it
+        written = (self.native_value, self.extra_state_attributes, self.icon, self.entity_picture)
+        if written == self._written:
+            self._device.metrics.record_write(False)
+            return
+        self._written = written
+        self._device.metrics.record_write(True)
+        if timer is None:
+            self.async_write_ha_state()
+        else:
+            start = time.perf_counter()
+            self.async_write_ha_state()
+            timer.add(UpdateStage.WRITE, time.perf_counter() - start)
+
+    @callback
+    def async_schedule_refresh(self) -> None:
+        """Schedule a recompute, which writes the state only if it changed."""
+        self._device.metrics.record_refresh_scheduled()
+        self.hass.async_create_task(self._async_refresh(), f"{self.entity_id} refresh", eager_start=True)
+
+    async def _async_refresh(self) -> None:
+        try:
+            await self.async_update()
+        finally:
+            self._device.metrics.record_refresh_done()
+
+
+class BundleThermalComfort(SensorThermalComfort):
+    """Single sensor of a device, the other sensor types are written as its attributes."""
+
+    def __init__(self, device: "DeviceThermalComfort", sensor_type: SensorType, bundled_types: list[SensorType], **kwargs) -> None:
+        """Initialize the sensor.
+
+        :param sensor_type: primary sensor type, the state of the sensor
+        :param bundled_types: sensor types written as attributes, the primary one is skipped
+        """
+        super().__init__(device, sensor_type, **kwargs)
+        self._bundled_types = [bundled_type for bundled_type in bundled_types if bundled_type != sensor_type]
+        self._bundle_attributes = {}
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        return dict(super().extra_state_attributes, **self._bundle_attributes)
+
+    async def async_added_to_hass(self):
+        """Register callbacks."""
+        if SensorType.MOULD_RISK in self._bundled_types:
+            await self._device.async_track_mould_growth()
+        if SensorType.ADAPTIVE_COMFORT_TEMPERATURE in self._bundled_types:
+            await self._device.async_track_running_mean()
+        await super().async_added_to_hass()
+
+    async def async_update(self):
+        """Update the bundled values, then the state of the sensor."""
+        attributes = {}
+        for sensor_type in self._bundled_types:
+            value = await getattr(self._device, sensor_type)()
+            if isinstance(value, tuple) and len(value) == 2:
+                attributes.update(value[1])
+                value = value[0]
+            attributes[sensor_type] = round(value, DISPLAY_PRECISION) if isinstance(value, float) else value
+        self._bundle_attributes = attributes
+        await super().async_update()
+
+
+class DerivedThermalComfort(SensorThermalComfort):
+    """Sensor derived from the values of a sensor type of a device over time."""
+
+    def __init__(self, device: "DeviceThermalComfort", sensor_type: SensorType, key: str, name_suffix: str, **kwargs) -> None:
+        """Initialize the sensor.
+
+        :param key: suffix of the sensor type in the key and unique_id
+        :param name_suffix: suffix of the sensor type in the name
+        """
+        description = kwargs.pop("description", {})
+        super().__init__(device, sensor_type, **kwargs)
+        self.entity_description = replace(
+            self.entity_description,
+            key=f"{sensor_type}_{key}",
+            translation_key=None,
+            name=f"{self.entity_description.name} {name_suffix}" if not self.entity_description.has_entity_name else f"{sensor_type.to_name()} {name_suffix}",
+            **description,
+        )
+        self._attr_unique_id = id_generator(device.unique_id, f"{sensor_type}_{key}")
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes, the inputs are attributes of the sensor type itself."""
+        return self._attr_extra_state_attributes
+
+
+class RollingStatisticsThermalComfort(DerivedThermalComfort):
+    """Rolling minimum, maximum or time-weighted mean of a sensor type of a device."""
+
+    def __init__(self, device: "DeviceThermalComfort", sensor_type: SensorType, statistic: RollingStatistic, window: str, **kwargs) -> None:
+        """Initialize the sensor.
+
+        :param statistic: statistic that is the state of the sensor
+        :param window: name of the window in ROLLING_WINDOWS
+        """
+        super().__init__(device, sensor_type, f"{statistic}_{window}", f"{window} {statistic}", **kwargs)
+        self._statistic = statistic
+        self._window = window
+
+    async def _async_value(self):
+        """Return the statistic of the window ending now."""
+        return self._device.rolling[self._sensor_type][self._window].get(self._statistic, time.monotonic())
+
+
+class TrendThermalComfort(DerivedThermalComfort):
+    """Rate of change per hour of a sensor type of a device."""
+
+    def __init__(self, device: "DeviceThermalComfort", sensor_type: SensorType, **kwargs) -> None:
+        """Initialize the sensor."""
+        unit = SENSOR_TYPES[sensor_type]["native_unit_of_measurement"]
+        # A rate is not a temperature, it must not be converted like one
+        super().__init__(device, sensor_type, "trend", "trend", description={"device_class": None, "native_unit_of_measurement": f"{unit}/h"}, **kwargs)
+
+    async def _async_value(self):
+        """Return the least squares slope of the trend window ending now."""
+        slope = self._device.trends[self._sensor_type].slope(time.monotonic())
+        return None if slope is None else slope * 3600
 
 
 @dataclass
@@ -578,6 +1012,19 @@ class DeviceThermalComfort:
         pressure_entity: str | None,
         should_poll: bool,
         scan_interval: timedelta,
+        lookup_tables: bool = LOOKUP_TABLES_DEFAULT,
+        saturation_model: SaturationModel = SATURATION_MODEL_DEFAULT,
+        slow_update_threshold: float = SLOW_UPDATE_THRESHOLD_DEFAULT,
+        input_attributes: bool = INPUT_ATTRIBUTES_DEFAULT,
+        rolling_statistics: list[SensorType] = ROLLING_STATISTICS_DEFAULT,
+        trends: list[SensorType] = TRENDS_DEFAULT,
+        radiant_temperature_entity: str | None = None,
+        wind_speed_entity: str | None = None,
+        outdoor_device: str | None = None,
+        comfort_zones: dict[str, list[list[float]]] = DEFAULT_COMFORT_ZONES,
+        air_speed: float | str = AIR_SPEED_DEFAULT,
+        metabolic_rate: float | str = METABOLIC_RATE_DEFAULT,
+        clothing_insulation: float | str = CLOTHING_INSULATION_DEFAULT,
     ):
         """Initialize the sensor."""
         self.hass = hass
@@ -589,6 +1036,7 @@ class DeviceThermalComfort:
             model="Virtual Device",
         )
         self.extra_state_attributes = {}
+        self._input_attributes = input_attributes
         self._temperature_entity = temperature_entity
         self._humidity_entity = humidity_entity
         self._pressure_entity = pressure_entity
@@ -597,29 +1045,128 @@ class DeviceThermalComfort:
         self._pressure_pa = None  # Store pressure in Pascals
         self._should_poll = should_poll
         self.sensors = []
-        self._compute_states = {sensor_type: ComputeState(lock=Lock()) for sensor_type in SENSOR_TYPES}
+        self._compute_states = {key: ComputeState(lock=Lock()) for key in (*SENSOR_TYPES, *IntermediateType)}
         self._timer_remove = None
         self._state_listeners = []
+        self._kernels = EXACT_KERNELS
+        self.metrics = DeviceMetrics()
+        self.timer = UpdateTimer(name, slow_update_threshold / 1000) if slow_update_threshold else None
+        self._saturation_model = SaturationModel(saturation_model)
+        self.rolling = {SensorType(sensor_type): {window: RollingStatistics(seconds) for window, seconds in ROLLING_WINDOWS.items()} for sensor_type in rolling_statistics}
+        self.trends = {SensorType(sensor_type): RollingTrend(TREND_WINDOW) for sensor_type in trends}
+        self._expiry_remove = None
+        self.mould_growth: MouldGrowth | None = None  # set by async_track_mould_growth
+        self._mould_growth_store: MouldGrowthStore | None = None
+        # Device registry id or unique_id of the device whose temperature is the outdoor temperature
+        self._outdoor_device = outdoor_device
+        self.running_mean: RunningMeanTemperature | None = None  # set by async_track_running_mean
+        self._comfort_zones = freeze_zones(comfort_zones)
+        # Constants or entity_ids of the comfort index inputs, without entity the radiant temperature is the
+        # air temperature and the wind speed WIND_SPEED_DEFAULT
+        self._comfort_sources = {
+            ComfortInput.RADIANT_TEMPERATURE: radiant_temperature_entity,
+            ComfortInput.WIND_SPEED: wind_speed_entity,
+            ComfortInput.AIR_SPEED: air_speed,
+            ComfortInput.METABOLIC_RATE: metabolic_rate,
+            ComfortInput.CLOTHING_INSULATION: clothing_insulation,
+        }
+        self._comfort_inputs = {comfort_input: None if isinstance(source, str) else source for comfort_input, source in self._comfort_sources.items()}
+        self._occupant: Occupant | None = None
+        self._clothing_temperature: float | None = None  # of the last solve, the next one starts from it
+        hass.data.setdefault(DATA_DEVICES, {})[unique_id] = self
+
+        self._track_sources()
+        self._seed_sources()
 
+        hass.async_create_task(self._set_version())
+        if lookup_tables:
+            hass.async_create_task(self._load_lookup_tables())
+
+        if self._should_poll:
+            self._start_timer(scan_interval)
+        if self.rolling or self.trends:
+            # Inputs that level off fire no state changes, the windows still have to move on
+            self._expiry_remove = async_track_time_interval(self.hass, self._async_expire, timedelta(seconds=EXPIRY_INTERVAL))
+
+    def _track_sources(self):
+        """Listen to state changes of the input sensors."""
         self._state_listeners.append(async_track_state_change_event(self.hass, self._temperature_entity, self.temperature_state_listener))
         self._state_listeners.append(async_track_state_change_event(self.hass, self._humidity_entity, self.humidity_state_listener))
         if self._pressure_entity is not None:
             self._state_listeners.append(async_track_state_change_event(self.hass, self._pressure_entity, self.pressure_state_listener))
-            hass.async_create_task(self._new_pressure_state(hass.states.get(self._pressure_entity)))
+        for comfort_input, source in self._comfort_sources.items():
+            if isinstance(source, str):
+                self._state_listeners.append(async_track_state_change_event(self.hass, source, partial(self.comfort_input_state_listener, comfort_input)))
+
+    def _seed_sources(self):
+        """Process the current states of the input sensors."""
+        if self._pressure_entity is not None:
+            self.hass.async_create_task(self._new_pressure_state(self.hass.states.get(self._pressure_entity)))
+        for comfort_input, source in self._comfort_sources.items():
+            if isinstance(source, str):
+                self.hass.async_create_task(self._new_comfort_input_state(comfort_input, self.hass.states.get(source)))
+        self.hass.async_create_task(self._new_temperature_state(self.hass.states.get(self._temperature_entity)))
+        self.hass.async_create_task(self._new_humidity_state(self.hass.states.get(self._humidity_entity)))
+
+    def _start_timer(self, scan_interval: timedelta | None):
+        """Start polling the sensors."""
+        if scan_interval is None:
+            scan_interval = timedelta(seconds=SCAN_INTERVAL_DEFAULT)
+        self._timer_remove = async_track_time_interval(
+            self.hass,
+            self.async_update_sensors,
+            scan_interval,
+        )
 
-        hass.async_create_task(self._new_temperature_state(hass.states.get(temperature_entity)))
-        hass.async_create_task(self._new_humidity_state(hass.states.get(humidity_entity)))
+    @callback
+    def async_reconfigure(
+        self,
+        temperature_entity: str,
+        humidity_entity: str,
+        pressure_entity: str | None,
+        should_poll: bool,
+        scan_interval: timedelta,
+        lookup_tables: bool,
+        saturation_model: SaturationModel,
+        slow_update_threshold: float,
+        input_attributes: bool,
+        custom_icons: bool,
+    ) -> None:
+        """Apply changed options to the running device and its sensors, then recompute them from the current input states."""
+        if (temperature_entity, humidity_entity, pressure_entity) != (self._temperature_entity, self._humidity_entity, self._pressure_entity):
+            self.cancel_listeners()
+            self._temperature_entity = temperature_entity
+            self._humidity_entity = humidity_entity
+            self._pressure_entity = pressure_entity
+            self._pressure_pa = None
+            self._track_sources()
 
-        hass.async_create_task(self._set_version())
+        self.cancel_timer()
+        self._should_poll = should_poll
+        if should_poll:
+            self._start_timer(scan_interval)
 
+        if lookup_tables:
+            self.hass.async_create_task(self._load_lookup_tables())
+        else:
+            self._kernels = EXACT_KERNELS
+        self._saturation_model = SaturationModel(saturation_model)
+        self.timer = UpdateTimer(self.name, slow_update_threshold / 1000) if slow_update_threshold else None
+        self._input_attributes = input_attributes
+        self.extra_state_attributes.clear()
+        for sensor in self.sensors:
+            sensor.set_custom_icons(custom_icons)
+
+        self.hass.async_create_task(self._async_reseed())
+
+    async def _async_reseed(self):
+        """Recompute from the current input states and refresh the sensors, also when they are polled."""
+        if self._pressure_entity is not None:
+            await self._new_pressure_state(self.hass.states.get(self._pressure_entity))
+        await self._new_temperature_state(self.hass.states.get(self._temperature_entity))
+        await self._new_humidity_state(self.hass.states.get(self._humidity_entity))
         if self._should_poll:
-            if scan_interval is None:
-                scan_interval = timedelta(seconds=SCAN_INTERVAL_DEFAULT)
-            self._timer_remove = async_track_time_interval(
-                self.hass,
-                self.async_update_sensors,
-                scan_interval,
-            )
+            await self.async_update_sensors(True)
 
     def cancel_timer(self):
         """Cancel the polling timer if it exists."""
@@ -627,6 +1174,13 @@ class DeviceThermalComfort:
             self._timer_remove()  # Call the remove function
             self._timer_remove = None
 
+    @callback
+    def _async_expire(self, now: datetime) -> None:
+        """Refresh the rolling statistics and trends, dropping the values that left their windows."""
+        for sensor in self.sensors:
+            if isinstance(sensor, DerivedThermalComfort):
+                sensor.async_schedule_refresh()
+
     def cancel_listeners(self):
         """Cancel all state change listeners."""
         for listener in self._state_listeners:
@@ -638,24 +1192,59 @@ class DeviceThermalComfort:
         """Perform all cleanup actions."""
         self.cancel_timer()
         self.cancel_listeners()
+        if self._expiry_remove is not None:
+            self._expiry_remove()
+            self._expiry_remove = None
+        if self.hass.data.get(DATA_DEVICES, {}).get(self.unique_id) is self:
+            del self.hass.data[DATA_DEVICES][self.unique_id]
+
+    async def async_track_mould_growth(self) -> None:
+        """Start integrating the mould growth index, restored from the store, once a sensor needs it."""
+        if self.mould_growth is None:
+            self._mould_growth_store = await async_get_mould_growth_store(self.hass)
+            self.mould_growth = self._mould_growth_store.async_get(self.unique_id)
+            self.mould_growth.update(time.monotonic(), self._temperature, self._humidity)
+
+    async def async_track_running_mean(self) -> None:
+        """Start maintaining the running mean of the outdoor device, shared with other devices and restored from the store."""
+        if self.running_mean is None and self._outdoor_device is not None:
+            store = await async_get_running_mean_store(self.hass)
+            self.running_mean = store.async_get(async_resolve_device(self.hass, self._outdoor_device))
 
     async def _set_version(self):
         self._device_info["sw_version"] = (await async_get_custom_components(self.hass))[DOMAIN].version.string
 
+    async def _load_lookup_tables(self):
+        """Switch the formulas to the shared interpolation tables once they are loaded."""
+        try:
+            self._kernels = await async_get_lookup_tables(self.hass)
+        except OSError as ex:
+            _LOGGER.error("Could not load lookup tables for %s, using exact formulas: %s", self.name, ex)
+
     async def temperature_state_listener(self, event):
         """Handle temperature device state changes."""
+        self.metrics.record_input("temperature")
         await self._new_temperature_state(event.data.get("new_state"))
 
     async def _new_temperature_state(self, state):
         """Process new temperature state."""
+        if (timer := self.timer) is not None:
+            timer.begin()
+            start = time.perf_counter()
         if _is_valid_state(state):
             try:
                 temp = float(state.state)
                 unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT, self.hass.config.units.temperature_unit)
+                if timer is not None:
+                    parsed = time.perf_counter()
+                    timer.add(UpdateStage.PARSE, parsed - start)
                 temperature = TemperatureConverter.convert(temp, unit, UnitOfTemperature.CELSIUS)
-                if -89.2 <= temperature <= 56.7:
+                if timer is not None:
+                    timer.add(UpdateStage.UNIT_CONVERSION, time.perf_counter() - parsed)
+                if TEMPERATURE_MIN <= temperature <= TEMPERATURE_MAX:
                     self._temperature = temperature
-                    self.extra_state_attributes[ATTR_TEMPERATURE] = temp
+                    if self._input_attributes:
+                        self.extra_state_attributes[ATTR_TEMPERATURE] = temp
                 else:
                     self._temperature = None  # Out of range
             except ValueError:
@@ -663,19 +1252,28 @@ class DeviceThermalComfort:
         else:
             self._temperature = None  # Unavailable or unknown state
         await self.async_update()  # Always update sensors
+        if timer is not None:
+            timer.end()
 
     async def humidity_state_listener(self, event):
         """Handle humidity device state changes."""
+        self.metrics.record_input("humidity")
         await self._new_humidity_state(event.data.get("new_state"))
 
     async def _new_humidity_state(self, state):
         """Process new humidity state."""
+        if (timer := self.timer) is not None:
+            timer.begin()
+            start = time.perf_counter()
         if _is_valid_state(state):
             try:
                 humidity = float(state.state)
-                if 0 < humidity <= 100:  # Valid humidity range
+                if timer is not None:
+                    timer.add(UpdateStage.PARSE, time.perf_counter() - start)
+                if HUMIDITY_MIN < humidity <= HUMIDITY_MAX:  # Valid humidity range
                     self._humidity = humidity
-                    self.extra_state_attributes[ATTR_HUMIDITY] = humidity
+                    if self._input_attributes:
+                        self.extra_state_attributes[ATTR_HUMIDITY] = humidity
                 else:
                     self._humidity = None  # Out of range (e.g., 150.0)
             except ValueError:
@@ -683,19 +1281,30 @@ class DeviceThermalComfort:
         else:
             self._humidity = None  # Unavailable or unknown state
         await self.async_update()  # Always update sensors
+        if timer is not None:
+            timer.end()
 
     async def pressure_state_listener(self, event):
         """Handle pressure device state changes."""
+        self.metrics.record_input("pressure")
         await self._new_pressure_state(event.data.get("new_state"))
 
     async def _new_pressure_state(self, state):
         """Process new pressure state."""
+        if (timer := self.timer) is not None:
+            timer.begin()
+            start = time.perf_counter()
         if _is_valid_state(state):
             try:
                 pressure = float(state.state)
                 unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                if timer is not None:
+                    parsed = time.perf_counter()
+                    timer.add(UpdateStage.PARSE, parsed - start)
                 if unit is not None:
-                    self._pressure_pa = convert_pressure(pressure, unit, "Pa")
+                    self._pressure_pa = PressureConverter.convert(pressure, unit, UnitOfPressure.PA)
+                    if timer is not None:
+                        timer.add(UpdateStage.UNIT_CONVERSION, time.perf_counter() - parsed)
                 else:
                     self._pressure_pa = None
             except ValueError:
@@ -703,6 +1312,35 @@ class DeviceThermalComfort:
         else:
             self._pressure_pa = None
         await self.async_update()
+        if timer is not None:
+            timer.end()
+
+    async def comfort_input_state_listener(self, comfort_input: ComfortInput, event):
+        """Handle state changes of the entities of comfort index inputs."""
+        self.metrics.record_input(comfort_input)
+        await self._new_comfort_input_state(comfort_input, event.data.get("new_state"))
+
+    async def _new_comfort_input_state(self, comfort_input: ComfortInput, state):
+        """Process a new state of a comfort index input."""
+        value = None
+        if _is_valid_state(state):
+            try:
+                value = float(state.state)
+                if comfort_input is ComfortInput.RADIANT_TEMPERATURE:
+                    unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT, self.hass.config.units.temperature_unit)
+                    value = TemperatureConverter.convert(value, unit, UnitOfTemperature.CELSIUS)
+                elif comfort_input is ComfortInput.WIND_SPEED:
+                    unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT, UnitOfSpeed.METERS_PER_SECOND)
+                    value = SpeedConverter.convert(value, unit, UnitOfSpeed.METERS_PER_SECOND)
+                minimum, maximum = COMFORT_INPUT_RANGES[comfort_input]
+                if not minimum <= value <= maximum:
+                    value = None  # Out of range
+            except ValueError:
+                value = None  # Non-numeric state
+        self._comfort_inputs[comfort_input] = value
+        if comfort_input in PERSONAL_INPUTS:
+            self._occupant = None
+        await self.async_update()
 
     def get_pressure_hpa(self) -> float:
         """Return pressure in hPa, falling back to standard if unavailable."""
@@ -712,16 +1350,52 @@ class DeviceThermalComfort:
         """Return pressure in Pa, falling back to standard if unavailable."""
         return self._pressure_pa if self._pressure_pa is not None else 101325  # else is standard pressure at sea-level
 
+    @compute_once_lock(IntermediateType.SATURATION_VAPOR_PRESSURE)
+    async def saturation_vapor_pressure(self) -> float:
+        """Saturation vapour pressure in hPa of the configured saturation model."""
+        if self._saturation_model is SaturationModel.GOFF_GRATCH:
+            return self._kernels.goff_gratch_saturation_vapor_pressure(self._temperature)
+        return SATURATION_VAPOR_PRESSURE[self._saturation_model](self._temperature)
+
+    async def vapor_pressure(self) -> float:
+        """Vapour pressure in hPa of the configured saturation model."""
+        return self._humidity / 100 * await self.saturation_vapor_pressure()
+
+    def saturation_pressure_pa(self, temperature: float) -> float:
+        """Saturation vapour pressure in Pa of any temperature, ASHRAE with the formula model."""
+        if self._saturation_model is SaturationModel.FORMULA:
+            return self._kernels.saturation_pressure(temperature)
+        if self._saturation_model is SaturationModel.GOFF_GRATCH:
+            return 100 * self._kernels.goff_gratch_saturation_vapor_pressure(temperature)
+        return 100 * SATURATION_VAPOR_PRESSURE[self._saturation_model](temperature)
+
+    def operative_temperature(self) -> float | None:
+        """Operative temperature, at low air speeds the mean of air and radiant temperature."""
+        if self._comfort_sources[ComfortInput.RADIANT_TEMPERATURE] is None:
+            return self._temperature
+        if (radiant_temperature := self._comfort_inputs[ComfortInput.RADIANT_TEMPERATURE]) is None:
+            return None
+        return (self._temperature + radiant_temperature) / 2
+
+    @compute_once_lock(IntermediateType.HUMIDITY_RATIO)
+    async def humidity_ratio(self) -> float:
+        """Humidity ratio in kg/kg."""
+        if self._saturation_model is not SaturationModel.FORMULA:
+            p_ws = 100 * await self.saturation_vapor_pressure()
+        else:
+            # calculate saturation vapor pressure for temperature (ASHRAE fundamentals 2021 pg 1.5 eq 5 and 6)
+            p_ws = self._kernels.saturation_pressure(self._temperature)
+
+        # calculate vapor pressure for RH % (ASHRAE fundamentals 2021 pg 1.9 eq 22)
+        p_w = self._humidity / 100 * p_ws
+        return humidity_ratio(p_w, self.get_pressure_pa())
+
     @compute_once_lock(SensorType.DEW_POINT)
     async def dew_point(self) -> float:
         """Dew Point <http://wahiduddin.net/calc/density_algorithms.htm>."""
-        A0 = 373.15 / (273.15 + self._temperature)
-        SUM = -7.90298 * (A0 - 1)
-        SUM += 5.02808 * math.log(A0, 10)
-        SUM += -1.3816e-7 * (pow(10, (11.344 * (1 - 1 / A0))) - 1)
-        SUM += 8.1328e-3 * (pow(10, (-3.49149 * (A0 - 1))) - 1)
-        SUM += math.log(self.get_pressure_hpa(), 10)
-        VP = pow(10, SUM - 3) * self._humidity
+        if self._saturation_model is not SaturationModel.FORMULA:
+            return DEW_POINT[self._saturation_model](await self.vapor_pressure())
+        VP = self._kernels.dew_point_vapor_pressure(self._temperature, self.get_pressure_hpa(), self._humidity)
         Td = math.log(VP / 0.61078)
         Td = (241.88 * Td) / (17.558 - Td)
         return Td
@@ -729,29 +1403,36 @@ class DeviceThermalComfort:
     @compute_once_lock(SensorType.HEAT_INDEX)
     async def heat_index(self) -> float:
         """Heat Index <http://www.wpc.ncep.noaa.gov/html/heatindex_equation.shtml>."""
-        fahrenheit = TemperatureConverter.convert(self._temperature, UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT)
-        hi = 0.5 * (fahrenheit + 61.0 + ((fahrenheit - 68.0) * 1.2) + (self._humidity * 0.094))
+        return self.heat_index_at(self._temperature, self._humidity)
+
+    @staticmethod
+    def heat_index_at(temperature: float, humidity: float) -> float:
+        """Heat index of any temperature and humidity."""
+        fahrenheit = TemperatureConverter.convert(temperature, UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT)
+        hi = 0.5 * (fahrenheit + 61.0 + ((fahrenheit - 68.0) * 1.2) + (humidity * 0.094))
 
         if hi > 79:
             hi = -42.379 + 2.04901523 * fahrenheit
-            hi = hi + 10.14333127 * self._humidity
-            hi = hi + -0.22475541 * fahrenheit * self._humidity
+            hi = hi + 10.14333127 * humidity
+            hi = hi + -0.22475541 * fahrenheit * humidity
             hi = hi + -0.00683783 * pow(fahrenheit, 2)
-            hi = hi + -0.05481717 * pow(self._humidity, 2)
-            hi = hi + 0.00122874 * pow(fahrenheit, 2) * self._humidity
-            hi = hi + 0.00085282 * fahrenheit * pow(self._humidity, 2)
-            hi = hi + -0.00000199 * pow(fahrenheit, 2) * pow(self._humidity, 2)
+            hi = hi + -0.05481717 * pow(humidity, 2)
+            hi = hi + 0.00122874 * pow(fahrenheit, 2) * humidity
+            hi = hi + 0.00085282 * fahrenheit * pow(humidity, 2)
+            hi = hi + -0.00000199 * pow(fahrenheit, 2) * pow(humidity, 2)
 
-        if self._humidity < 13 and fahrenheit >= 80 and fahrenheit <= 112:
-            hi = hi - ((13 - self._humidity) * 0.25) * math.sqrt((17 - abs(fahrenheit - 95)) * 0.05882)
-        elif self._humidity > 85 and fahrenheit >= 80 and fahrenheit <= 87:
-            hi = hi + ((self._humidity - 85) * 0.1) * ((87 - fahrenheit) * 0.2)
+        if humidity < 13 and fahrenheit >= 80 and fahrenheit <= 112:
+            hi = hi - ((13 - humidity) * 0.25) * math.sqrt((17 - abs(fahrenheit - 95)) * 0.05882)
+        elif humidity > 85 and fahrenheit >= 80 and fahrenheit <= 87:
+            hi = hi + ((humidity - 85) * 0.1) * ((87 - fahrenheit) * 0.2)
 
         return TemperatureConverter.convert(hi, UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS)
 
     @compute_once_lock(SensorType.HUMIDEX)
     async def humidex(self) -> float:
         """<https://simple.wikipedia.org/wiki/Humidex#Humidex_formula>."""
+        if self._saturation_model is not SaturationModel.FORMULA:
+            return self._temperature + 0.5555 * (await self.vapor_pressure() - 10.0)
         dewpoint = await self.dew_point()
         e = 6.11 * math.exp(5417.7530 * ((1 / 273.16) - (1 / (dewpoint + 273.15))))
         h = (0.5555) * (e - 10.0)
@@ -803,6 +1484,8 @@ class DeviceThermalComfort:
     async def absolute_humidity(self) -> float:
         """Absolute Humidity <https://carnotcycle.wordpress.com/2012/08/04/how-to-convert-relative-humidity-to-absolute-humidity/>."""
         abs_temperature = self._temperature + 273.15
+        if self._saturation_model is not SaturationModel.FORMULA:
+            return 216.74 * await self.vapor_pressure() / abs_temperature
         abs_humidity = 6.112
         abs_humidity *= math.exp((17.67 * self._temperature) / (243.5 + self._temperature))
         abs_humidity *= self._humidity
@@ -836,12 +1519,45 @@ class DeviceThermalComfort:
 
         return frost_risk, {ATTR_FROST_POINT: frostpoint}
 
+    @compute_once_lock(SensorType.MOULD_RISK)
+    async def mould_risk(self) -> tuple[float, dict] | None:
+        """Mould growth index of the VTT model, 0 to 6, integrated over past updates."""
+        if self.mould_growth is None:
+            return None
+        return self.mould_growth.index, {ATTR_CRITICAL_HUMIDITY: round(critical_humidity(self._temperature), 1)}
+
+    @compute_once_lock(SensorType.PREDICTED_MEAN_VOTE)
+    async def predicted_mean_vote(self) -> float | None:
+        """Predicted mean vote of ISO 7730, from -3 (cold) to +3 (hot), solved from the clothing temperature of the previous update."""
+        inputs = self._comfort_inputs
+        radiant_temperature = self._temperature if self._comfort_sources[ComfortInput.RADIANT_TEMPERATURE] is None else inputs[ComfortInput.RADIANT_TEMPERATURE]
+        personal = (inputs[ComfortInput.AIR_SPEED], inputs[ComfortInput.METABOLIC_RATE], inputs[ComfortInput.CLOTHING_INSULATION])
+        if radiant_temperature is None or None in personal:
+            return None
+        if self._occupant is None:
+            self._occupant = Occupant(*personal)
+        result = self._occupant.solve(self._temperature, radiant_temperature, self._humidity, self._clothing_temperature)
+        if result is None:
+            self._clothing_temperature = None
+            return None
+        pmv, self._clothing_temperature = result
+        return pmv
+
+    @compute_once_lock(SensorType.PREDICTED_PERCENTAGE_DISSATISFIED)
+    async def predicted_percentage_dissatisfied(self) -> float | None:
+        """Predicted percentage of dissatisfied of ISO 7730."""
+        pmv = await self.predicted_mean_vote()
+        return None if pmv is None else percentage_dissatisfied(pmv)
+
     @compute_once_lock(SensorType.RELATIVE_STRAIN_PERCEPTION)
     async def relative_strain_perception(self) -> tuple[RelativeStrainPerception, dict]:
         """Relative strain perception."""
 
-        vp = 6.112 * pow(10, 7.5 * self._temperature / (237.7 + self._temperature))
-        e = self._humidity * vp / 100
+        if self._saturation_model is not SaturationModel.FORMULA:
+            e = await self.vapor_pressure()
+        else:
+            vp = 6.112 * pow(10, 7.5 * self._temperature / (237.7 + self._temperature))
+            e = self._humidity * vp / 100
         rsi = round((self._temperature - 21) / (58 - e), 2)
 
         if self._temperature < 26 or self._temperature > 35:
@@ -936,40 +1652,7 @@ class DeviceThermalComfort:
     @compute_once_lock(SensorType.MOIST_AIR_ENTHALPY)
     async def moist_air_enthalpy(self) -> float:
         """Calculate the enthalpy of moist air."""
-        patm = self.get_pressure_pa()
-        c_to_k = 273.15
-
-        # ASHRAE fundamentals 2021 pg 1.5
-        c1 = -5.6745359e03
-        c2 = 6.3925247e00
-        c3 = -9.6778430e-03
-        c4 = 6.2215701e-07
-        c5 = 2.0747825e-09
-        c6 = -9.4840240e-13
-        c7 = 4.1635019e00
-        c8 = -5.8002206e03
-        c9 = 1.3914993e00
-        c10 = -4.8640239e-02
-        c11 = 4.1764768e-05
-        c12 = -1.4452093e-08
-        c13 = 6.5459673e00
-
-        T = self._temperature + c_to_k
-
-        # calculate saturation vapor pressure for temperature
-        p_ws = (
-            # ASHRAE fundamentals 2021 pg 1.5 eq 5
-            math.exp(c1 / T + c2 + c3 * T + c4 * T**2 + c5 * T**3 + c6 * T**4 + c7 * math.log(T))
-            if T < c_to_k  # noqa: SIM300
-            # ASHRAE fundamentals 2021 pg 1.5 eq 6
-            else math.exp(c8 / T + c9 + c10 * T + c11 * T**2 + c12 * T**3 + c13 * math.log(T))
-        )
-
-        # calculate vapor pressure for RH % (ASHRAE fundamentals 2021 pg 1.9 eq 22)
-        p_w = self._humidity / 100 * p_ws
-
-        # calculate humidity ratio (ASHRAE fundamentals 2021 pg 1.9 eq 20)
-        W = 0.621945 * p_w / (patm - p_w)
+        W = await self.humidity_ratio()
 
         # calculate enthalpy (ASHRAE fundamentals 2021 pg 1.10 eq 30)
         return 1.006 * self._temperature + W * (2501 + 1.86 * self._temperature)
@@ -1001,22 +1684,143 @@ class DeviceThermalComfort:
 
         return perception, {ATTR_THOMS_DISCOMFORT_INDEX: round(tdi, 2)}
 
+    @compute_once_lock(SensorType.UNIVERSAL_THERMAL_CLIMATE_INDEX)
+    async def universal_thermal_climate_index(self) -> float | None:
+        """Universal Thermal Climate Index, None outside the range of its approximation."""
+        inputs = self._comfort_inputs
+        wind_speed = WIND_SPEED_DEFAULT if self._comfort_sources[ComfortInput.WIND_SPEED] is None else inputs[ComfortInput.WIND_SPEED]
+        radiant_temperature = self._temperature if self._comfort_sources[ComfortInput.RADIANT_TEMPERATURE] is None else inputs[ComfortInput.RADIANT_TEMPERATURE]
+        if wind_speed is None or radiant_temperature is None:
+            return None
+        return universal_thermal_climate_index(self._temperature, self._humidity, wind_speed, radiant_temperature)
+
+    @compute_once_lock(SensorType.WET_BULB_TEMPERATURE)
+    async def wet_bulb_temperature(self) -> float:
+        """Thermodynamic wet-bulb temperature at the pressure of the device, between the dew point and the temperature."""
+        return wet_bulb_temperature(
+            self._temperature,
+            await self.humidity_ratio(),
+            self.get_pressure_pa(),
+            self.saturation_pressure_pa,
+            await self.dew_point(),
+            stull_wet_bulb(self._temperature, self._humidity),
+        )
+
+    @compute_once_lock(SensorType.WET_BULB_GLOBE_TEMPERATURE)
+    async def wet_bulb_globe_temperature(self) -> float | None:
+        """Indoor wet-bulb globe temperature (ISO 7243), the radiant temperature stands in for the globe temperature."""
+        globe_temperature = self._temperature if self._comfort_sources[ComfortInput.RADIANT_TEMPERATURE] is None else self._comfort_inputs[ComfortInput.RADIANT_TEMPERATURE]
+        if globe_temperature is None:
+            return None
+        return 0.7 * await self.wet_bulb_temperature() + 0.3 * globe_temperature
+
+    @compute_once_lock(SensorType.ADAPTIVE_COMFORT_TEMPERATURE)
+    async def adaptive_comfort_temperature(self) -> tuple[float, dict] | None:
+        """Comfortable operative temperature of ASHRAE 55 by the prevailing mean temperature of the outdoor device."""
+        if self.running_mean is None or self.running_mean.running_mean is None:
+            return None
+        prevailing_mean = self.running_mean.running_mean
+        if (comfort_temperature := adaptive_comfort_temperature(prevailing_mean)) is None:
+            return None
+        attributes = {ATTR_PREVAILING_MEAN_OUTDOOR_TEMPERATURE: round(prevailing_mean, 2)}
+        if (operative_temperature := self.operative_temperature()) is not None:
+            attributes[ATTR_OPERATIVE_TEMPERATURE] = round(operative_temperature, 2)
+            attributes[ATTR_ACCEPTABILITY] = acceptability(operative_temperature, comfort_temperature)
+        return comfort_temperature, attributes
+
+    @compute_once_lock(SensorType.COMFORT_ZONE)
+    async def comfort_zone(self) -> tuple[str, dict] | None:
+        """First configured comfort zone that holds the operative temperature and humidity ratio, ZONE_OUTSIDE for none."""
+        if (operative_temperature := self.operative_temperature()) is None:
+            return None
+        zones = comfort_zones(self._comfort_zones, operative_temperature, await self.humidity_ratio(), self.get_pressure_pa())
+        return zones[0] if zones else ZONE_OUTSIDE, {ATTR_COMFORT_ZONES: zones}
+
+    def dew_point_at(self, temperature: float, humidity: float) -> float:
+        """Dew point of any temperature and humidity by the formula of dew_point, uncached."""
+        if self._saturation_model is not SaturationModel.FORMULA:
+            return DEW_POINT[self._saturation_model](humidity / 100 * self.saturation_pressure_pa(temperature) / 100)
+        # The formula takes the vapour pressure in kPa
+        return goff_gratch_dew_point(10 * self._kernels.dew_point_vapor_pressure(temperature, self.get_pressure_hpa(), humidity))
+
+    def humidex_at(self, temperature: float, humidity: float) -> float:
+        """Humidex of any temperature and humidity by the formula of humidex, uncached."""
+        if self._saturation_model is not SaturationModel.FORMULA:
+            return temperature + 0.5555 * (humidity / 100 * self.saturation_pressure_pa(temperature) / 100 - 10.0)
+        dewpoint = self.dew_point_at(temperature, humidity)
+        e = 6.11 * math.exp(5417.7530 * ((1 / 273.16) - (1 / (dewpoint + 273.15))))
+        return temperature + 0.5555 * (e - 10.0)
+
+    def humidity_for_dew_point(self, temperature: float, dew_point: float) -> float:
+        """Humidity that gives a dew point at a temperature, the inverse of dew_point_at."""
+        if self._saturation_model is not SaturationModel.FORMULA:
+            return 100 * DEW_POINT_VAPOR_PRESSURE[self._saturation_model](dew_point) / (self.saturation_pressure_pa(temperature) / 100)
+        return goff_gratch_dew_point_vapor_pressure(dew_point) / (10 * self._kernels.dew_point_vapor_pressure(temperature, self.get_pressure_hpa(), 1))
+
+    def humidity_for_humidex(self, temperature: float, humidex: float) -> float | None:
+        """Humidity that gives a humidex at a temperature, the inverse of humidex_at."""
+        vapor_pressure = humidex_vapor_pressure(temperature, humidex)
+        if self._saturation_model is not SaturationModel.FORMULA:
+            return 100 * vapor_pressure / (self.saturation_pressure_pa(temperature) / 100)
+        if (dew_point := humidex_dew_point(vapor_pressure)) is None:
+            return None
+        return self.humidity_for_dew_point(temperature, dew_point)
+
+    def solve(self, target: InverseTarget, value: float, solve_for: SolveFor) -> float | None:
+        """Humidity in % or temperature in °C that gives a value of target, the other input at its current value.
+
+        The formulas increase with both inputs, so lower humidities or temperatures give lower
+        values. None if there is no valid input that gives the value.
+        """
+        if self._temperature is None or self._humidity is None:
+            return None
+        if solve_for is SolveFor.HUMIDITY:
+            temperature = self._temperature
+            if target is InverseTarget.DEW_POINT:
+                humidity = self.humidity_for_dew_point(temperature, value)
+            elif target is InverseTarget.HUMIDEX:
+                humidity = self.humidity_for_humidex(temperature, value)
+            else:
+                humidity = solve_bracketed(lambda humidity: self.heat_index_at(temperature, humidity) - value, HUMIDITY_MIN, HUMIDITY_MAX)
+            return humidity if humidity is not None and HUMIDITY_MIN <= humidity <= HUMIDITY_MAX else None
+
+        humidity = self._humidity
+        formula = {InverseTarget.DEW_POINT: self.dew_point_at, InverseTarget.HUMIDEX: self.humidex_at, InverseTarget.HEAT_INDEX: self.heat_index_at}[target]
+        return solve_bracketed(lambda temperature: formula(temperature, humidity) - value, TEMPERATURE_MIN, TEMPERATURE_MAX)
+
     async def async_update(self):
         """Update the state."""
-        # Always mark all sensors as needing update
-        for sensor_type in SENSOR_TYPES:
-            self._compute_states[sensor_type].needs_update = True
+        # Always mark all sensors and intermediate values as needing update
+        for compute_state in self._compute_states.values():
+            compute_state.needs_update = True
+        if self.mould_growth is not None:
+            self.mould_growth.update(time.monotonic(), self._temperature, self._humidity)
+            self._mould_growth_store.async_schedule_save()
+        if (running_means := self.hass.data.get(DATA_RUNNING_MEAN)) is not None:
+            running_means.async_update(self.unique_id, dt_util.now(), self._temperature)
+        if self.rolling or self.trends:
+            now = time.monotonic()
+            for sensor_type in dict.fromkeys((*self.rolling, *self.trends)):
+                if (value := await getattr(self, sensor_type)()) is None:
+                    continue
+                for statistics in self.rolling.get(sensor_type, {}).values():
+                    statistics.add(now, value)
+                if sensor_type in self.trends:
+                    self.trends[sensor_type].add(now, value)
         if not self._should_poll:
             await self.async_update_sensors(True)
 
     async def async_update_sensors(self, force_refresh: bool = False) -> None:
         """Update the state of the sensors."""
         for sensor in self.sensors:
-            sensor.async_schedule_update_ha_state(force_refresh)
+            if force_refresh:
+                sensor.async_schedule_refresh()
+            else:
+                sensor.async_schedule_update_ha_state()
 
     @property
-    def compute_states(self) -> dict[SensorType, ComputeState]:
-        """Compute states of configured sensors."""
+    def compute_states(self) -> dict[SensorType | IntermediateType, ComputeState]:
+        """Compute states of configured sensors and intermediate values."""
         return self._compute_states
 
     @property
@@ -1034,6 +1838,24 @@ class DeviceThermalComfort:
         """Return the name."""
         return self._device_info["name"]
 
+    @property
+    def temperature(self) -> float | None:
+        """Return the current temperature in °C."""
+        return self._temperature
+
+    @property
+    def humidity(self) -> float | None:
+        """Return the current relative humidity in %."""
+        return self._humidity
+
+
+@callback
+def async_resolve_device(hass: HomeAssistant, device: str) -> str:
+    """Return the unique_id of a device given by device registry id (UI) or unique_id (YAML)."""
+    if (device_entry := dr.async_get(hass).async_get(device)) is not None:
+        return next((identifier for domain, identifier in device_entry.identifiers if domain == DOMAIN), device)
+    return device
+
 
 def _is_valid_state(state) -> bool:
     if state is not None:
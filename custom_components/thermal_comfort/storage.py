@@ -0,0 +1,65 @@
+"""State of Thermal Comfort devices that is kept across restarts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Generic, Protocol, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+
+class StoredState(Protocol):
+    """State that is restored from the keyword arguments as_dict returns."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to store."""
+
+
+_StateT = TypeVar("_StateT", bound=StoredState)
+
+
+class DeviceStore(Generic[_StateT]):
+    """States of devices by unique_id, written a delay after they change."""
+
+    def __init__(self, hass: HomeAssistant, version: int, key: str, save_delay: float, factory: Callable[..., _StateT]) -> None:
+        """Initialize the store, async_load reads it.
+
+        :param save_delay: seconds a changed state waits before it is written
+        :param factory: creates a state from its stored keyword arguments, or a new one without
+        """
+        self._hass = hass
+        self._store = Store(hass, version, key)
+        self._save_delay = save_delay
+        self._factory = factory
+        self._load_task = None
+        self._stored: dict[str, dict[str, Any]] = {}
+        self._states: dict[str, _StateT] = {}
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Read the stored states once, concurrent callers wait for the same read."""
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(self._store.async_load())
+        self._stored = await self._load_task or {}
+
+    @callback
+    def async_get(self, unique_id: str) -> _StateT:
+        """Return the state of a device, restored from the store if it has one, callers share it."""
+        if (state := self._states.get(unique_id)) is None:
+            state = self._states[unique_id] = self._factory(**self._stored.get(unique_id, {}))
+        return state
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Write the states after the save delay, changes until then are written together."""
+        # Scheduling again would postpone the write as long as changes keep arriving
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, self._save_delay)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_scheduled = False
+        # Devices that were not set up this time keep their stored state
+        return self._stored | {unique_id: state.as_dict() for unique_id, state in self._states.items()}
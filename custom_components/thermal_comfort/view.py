@@ -0,0 +1,94 @@
+"""Metrics endpoint of Thermal Comfort in the Prometheus text format."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_DEVICES, DATA_METRICS_ENDPOINT, DOMAIN
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = DOMAIN
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _family(name: str, metric_type: str, help_text: str, samples: Iterable[tuple[str, dict[str, str], float]]) -> list[str]:
+    """Return the lines of a metric family, samples are (suffix, labels, value)."""
+    lines = [f"# HELP {PREFIX}_{name} {help_text}", f"# TYPE {PREFIX}_{name} {metric_type}"]
+    lines += [f"{PREFIX}_{name}{suffix}{_labels(labels)} {value!r}" for suffix, labels, value in samples]
+    return lines
+
+
+def prometheus_text(devices: Iterable) -> str:
+    """Return the metrics of the devices in the Prometheus text exposition format."""
+    devices = sorted(devices, key=lambda device: str(device.unique_id))
+
+    def per_device(value):
+        for device in devices:
+            if (sample := value(device)) is not None:
+                yield "", {"device": device.unique_id, "name": device.name}, sample
+
+    def per_key(counters):
+        for device in devices:
+            for key, value in sorted(counters(device).items()):
+                yield "", {"device": device.unique_id, "name": device.name, "key": key}, value
+
+    def compute_seconds():
+        for device in devices:
+            for key, histogram in sorted(device.metrics.compute_time.items()):
+                labels = {"device": device.unique_id, "name": device.name, "key": key}
+                cumulative = 0
+                for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                    cumulative += count
+                    yield "_bucket", {**labels, "le": bound if bound == "+Inf" else repr(bound)}, cumulative
+                yield "_sum", labels, histogram.sum
+                yield "_count", labels, histogram.count
+
+    lines = [
+        *_family("input_events_total", "counter", "State changes received from input sensors.", per_key(lambda device: device.metrics.input_events)),
+        *_family("input_age_seconds", "gauge", "Seconds since the last state change of an input sensor.", per_key(lambda device: device.metrics.input_age())),
+        *_family("recomputes_total", "counter", "Recomputes of a sensor type or intermediate value.", per_key(lambda device: device.metrics.recomputes)),
+        *_family("cache_hits_total", "counter", "Values served without recomputing them.", per_key(lambda device: device.metrics.cache_hits)),
+        *_family("compute_seconds", "histogram", "Duration of recomputes.", compute_seconds()),
+        *_family("state_writes_total", "counter", "Sensor states written.", per_device(lambda device: device.metrics.state_writes)),
+        *_family(
+            "suppressed_writes_total", "counter", "Sensor state writes skipped because nothing changed.", per_device(lambda device: device.metrics.suppressed_writes)
+        ),
+        *_family("pending_refreshes", "gauge", "Sensor refreshes scheduled but not finished.", per_device(lambda device: device.metrics.pending_refreshes)),
+        *_family("update_lag_seconds", "gauge", "Seconds from the last input state change until all sensors processed it.", per_device(lambda device: device.metrics.update_lag)),
+        *_family(
+            "slow_updates_total",
+            "counter",
+            "Updates slower than the slow update threshold.",
+            per_device(lambda device: None if device.timer is None else device.timer.slow_updates),
+        ),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+class MetricsView(HomeAssistantView):
+    """Expose the counters of all Thermal Comfort devices."""
+
+    url = f"/api/{DOMAIN}/metrics"
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics."""
+        hass: HomeAssistant = request.app[KEY_HASS]
+        if not hass.data.get(DATA_METRICS_ENDPOINT):
+            # Views cannot be removed, a reload without the option disables it
+            return web.Response(status=404)
+        return web.Response(body=prometheus_text(hass.data.get(DATA_DEVICES, {}).values()).encode(), headers={"Content-Type": CONTENT_TYPE})
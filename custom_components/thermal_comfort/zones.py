@@ -0,0 +1,81 @@
+"""Comfort zones of the psychrometric chart and the membership of a point in them.
+
+A zone is given by its corners as (operative temperature in °C, relative humidity in %).
+Edges between corners of equal relative humidity follow the humidity curve, other
+edges are straight in the chart. The chart plots the humidity ratio, so the polygon
+of a zone depends on the pressure. Polygons are derived once per pressure bucket and
+shared by all devices, a membership test is then a point in polygon check.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+from .lookup import saturation_pressure
+from .psychrometrics import humidity_ratio
+
+# Width of the pressure buckets in Pa, the humidity ratio of a zone edge changes by about 0.5 % within one
+ZONE_PRESSURE_STEP = 500
+# Straight segments a humidity curve is divided into
+ZONE_CURVE_SEGMENTS = 8
+ZONE_OUTSIDE = "outside"
+
+Zone = tuple[tuple[float, float], ...]
+Polygon = tuple[tuple[float, float], ...]
+
+# Summer (0.5 clo) and winter (1.0 clo) zones of ASHRAE 55-1992 for sedentary activity,
+# bounded by 30 and 60 % relative humidity as given in the ASHRAE Handbook Fundamentals
+DEFAULT_COMFORT_ZONES: dict[str, Zone] = {
+    "summer": ((24.5, 30.0), (28.0, 30.0), (25.5, 60.0), (23.0, 60.0)),
+    "winter": ((20.5, 30.0), (25.5, 30.0), (24.0, 60.0), (20.0, 60.0)),
+}
+
+
+def zone_polygon(zone: Zone, pressure: float) -> Polygon:
+    """Return the polygon of a zone in (temperature, humidity ratio) at a pressure in Pa."""
+    polygon = []
+    for (temperature, humidity), (next_temperature, next_humidity) in zip(zone, zone[1:] + zone[:1]):
+        segments = ZONE_CURVE_SEGMENTS if humidity == next_humidity else 1
+        # Points along the edge up to the next corner, which starts the next edge
+        for step in range(segments):
+            point_temperature = temperature + (next_temperature - temperature) * step / segments
+            polygon.append((point_temperature, humidity_ratio(humidity / 100 * saturation_pressure(point_temperature), pressure)))
+    return tuple(polygon)
+
+
+@lru_cache(maxsize=32)
+def zone_polygons(zones: tuple[tuple[str, Zone], ...], pressure_bucket: int) -> tuple[tuple[str, Polygon, tuple[float, float, float, float]], ...]:
+    """Return the polygons of zones with their bounding boxes for a pressure bucket, derived once."""
+    result = []
+    for name, zone in zones:
+        polygon = zone_polygon(zone, pressure_bucket * ZONE_PRESSURE_STEP)
+        temperatures = [t for t, _ in polygon]
+        ratios = [w for _, w in polygon]
+        result.append((name, polygon, (min(temperatures), max(temperatures), min(ratios), max(ratios))))
+    return tuple(result)
+
+
+def point_in_polygon(x: float, y: float, polygon: Polygon) -> bool:
+    """Return whether a point lies inside a polygon, by the number of edges a ray to the right crosses."""
+    inside = False
+    x1, y1 = polygon[-1]
+    for x2, y2 in polygon:
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+        x1, y1 = x2, y2
+    return inside
+
+
+def comfort_zones(zones: tuple[tuple[str, Zone], ...], temperature: float, ratio: float, pressure: float) -> list[str]:
+    """Return the names of the zones that hold a temperature in °C and humidity ratio in kg/kg at a pressure in Pa."""
+    return [
+        name
+        for name, polygon, (t_min, t_max, w_min, w_max) in zone_polygons(zones, round(pressure / ZONE_PRESSURE_STEP))
+        if t_min <= temperature <= t_max and w_min <= ratio <= w_max and point_in_polygon(temperature, ratio, polygon)
+    ]
+
+
+def freeze_zones(zones: dict[str, Iterable[Iterable[float]]]) -> tuple[tuple[str, Zone], ...]:
+    """Return zones in the hashable form zone_polygons caches by."""
+    return tuple((name, tuple((float(temperature), float(humidity)) for temperature, humidity in corners)) for name, corners in zones.items())
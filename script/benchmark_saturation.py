@@ -0,0 +1,56 @@
+"""Compare the saturation vapour pressure models of Thermal Comfort.
+
+Reports the time per evaluation of every model and its deviation from the
+Goff-Gratch series over the valid temperature and humidity range.
+
+Run from the repository root:
+
+    python -m script.benchmark_saturation
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from custom_components.thermal_comfort.const import TEMPERATURE_MAX, TEMPERATURE_MIN
+from custom_components.thermal_comfort.lookup import load_lookup_tables
+from custom_components.thermal_comfort.saturation import (
+    DEW_POINT,
+    SATURATION_VAPOR_PRESSURE,
+    SaturationModel,
+)
+
+REFERENCE = SaturationModel.GOFF_GRATCH
+
+
+def _grid(start: float, stop: float, count: int) -> list[float]:
+    return [start + (stop - start) * i / (count - 1) for i in range(count)]
+
+
+def main() -> None:
+    """Print speed and deviation of the saturation models."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--points", type=int, default=2000, help="temperature and humidity grid size")
+    args = parser.parse_args()
+
+    temperatures = _grid(TEMPERATURE_MIN, TEMPERATURE_MAX, args.points)
+    humidities = _grid(1, 100, 100)
+    reference = SATURATION_VAPOR_PRESSURE[REFERENCE]
+    reference_dew_point = DEW_POINT[REFERENCE]
+    functions = dict(SATURATION_VAPOR_PRESSURE)
+    functions["goff_gratch (tables)"] = load_lookup_tables().goff_gratch_saturation_vapor_pressure
+
+    print(f"{'model':<22} {'ns/call':>8} {'max rel. dev. e_s':>18} {'max dev. dew point':>19}")
+    for name, function in functions.items():
+        seconds = min(timeit.repeat(lambda f=function: [f(t) for t in temperatures], number=20, repeat=5))
+        relative_deviation = max(abs(function(t) / reference(t) - 1) for t in temperatures)
+        dew_point = DEW_POINT.get(name, reference_dew_point)
+        dew_point_deviation = max(
+            abs(dew_point(function(t) * h / 100) - reference_dew_point(reference(t) * h / 100)) for t in temperatures for h in humidities
+        )
+        print(f"{name:<22} {seconds / (20 * len(temperatures)) * 1e9:>8.0f} {relative_deviation:>18.2e} {dew_point_deviation:>17.3f} °C")
+
+
+if __name__ == "__main__":
+    main()
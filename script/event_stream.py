@@ -0,0 +1,129 @@
+"""Compact file format for recorded state_changed streams of Thermal Comfort source entities.
+
+A stream is a gzip compressed JSON lines file. The first line is a header:
+
+    {"format": "thermal_comfort_events", "version": 1,
+     "devices": [{"temperature_sensor": ..., "humidity_sensor": ..., "pressure_sensor": ...}],
+     "entities": ["sensor.a", ...], "initial": [["21.3", {...}], ...]}
+
+Every following line is one state change:
+
+    [microseconds since the previous change, entity index, state, attributes]
+
+The attributes are left out if they did not change since the previous state of
+the same entity, which keeps the file small for the usual sensor updates.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+import gzip
+import json
+from typing import Any
+
+FORMAT = "thermal_comfort_events"
+VERSION = 1
+
+
+@dataclass
+class StreamEvent:
+    """A state change of a source entity."""
+
+    time: float  # seconds since the start of the stream
+    entity_id: str
+    state: str
+    attributes: dict[str, Any]
+
+
+@dataclass
+class StreamHeader:
+    """Devices, entities and initial states of a stream."""
+
+    devices: list[dict[str, str]]
+    entities: list[str]
+    initial: dict[str, tuple[str, dict[str, Any]]] = field(default_factory=dict)
+
+
+def source_entities(devices: list[dict[str, str]]) -> list[str]:
+    """Return the source entities of the devices without duplicates."""
+    entities = {}
+    for device in devices:
+        for key in ("temperature_sensor", "humidity_sensor", "pressure_sensor"):
+            if device.get(key):
+                entities[device[key]] = None
+    return list(entities)
+
+
+class StreamWriter:
+    """Write a stream file."""
+
+    def __init__(self, path: str, header: StreamHeader) -> None:
+        """Open the file and write the header."""
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._index = {entity_id: i for i, entity_id in enumerate(header.entities)}
+        self._attributes = {entity_id: attributes for entity_id, (_, attributes) in header.initial.items()}
+        self._last_time = 0.0
+        self._write(
+            {
+                "format": FORMAT,
+                "version": VERSION,
+                "devices": header.devices,
+                "entities": header.entities,
+                "initial": [list(header.initial.get(entity_id, (None, {}))) for entity_id in header.entities],
+            }
+        )
+
+    def _write(self, line: object) -> None:
+        self._file.write(json.dumps(line, separators=(",", ":")))
+        self._file.write("\n")
+
+    def write(self, event: StreamEvent) -> None:
+        """Append a state change, times before the previous change are clamped to it."""
+        line = [max(round((event.time - self._last_time) * 1e6), 0), self._index[event.entity_id], event.state]
+        if self._attributes.get(event.entity_id) != event.attributes:
+            self._attributes[event.entity_id] = event.attributes
+            line.append(event.attributes)
+        self._last_time += line[0] / 1e6
+        self._write(line)
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self) -> StreamWriter:
+        """Return the writer."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the file."""
+        self.close()
+
+
+def read_stream(path: str) -> tuple[StreamHeader, Iterator[StreamEvent]]:
+    """Read the header of a stream file and return it with an iterator over its events."""
+    file = gzip.open(path, "rt", encoding="utf-8")
+    raw_header = json.loads(file.readline())
+    if raw_header.get("format") != FORMAT or raw_header.get("version") != VERSION:
+        file.close()
+        raise ValueError(f"{path} is not a version {VERSION} {FORMAT} file")
+    entities = raw_header["entities"]
+    header = StreamHeader(
+        devices=raw_header["devices"],
+        entities=entities,
+        initial={entity_id: (state, attributes) for entity_id, (state, attributes) in zip(entities, raw_header["initial"]) if state is not None},
+    )
+
+    def events() -> Iterator[StreamEvent]:
+        attributes = {entity_id: attributes for entity_id, (_, attributes) in header.initial.items()}
+        time = 0.0
+        with file:
+            for line in file:
+                delta, index, state, *changed = json.loads(line)
+                time += delta / 1e6
+                entity_id = entities[index]
+                if changed:
+                    attributes[entity_id] = changed[0]
+                yield StreamEvent(time, entity_id, state, attributes.get(entity_id, {}))
+
+    return header, events()
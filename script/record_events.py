@@ -0,0 +1,119 @@
+r"""Record the state changes of Thermal Comfort source entities from a running Home Assistant.
+
+Connects to the websocket API with a long-lived access token and writes the
+state_changed events of the given devices' source entities to a stream file
+(see script/event_stream.py) until the duration elapsed or Ctrl+C is pressed.
+
+    HASS_TOKEN=... python -m script.record_events http://homeassistant.local:8123 living.events.gz \
+        --device sensor.living_temperature,sensor.living_humidity \
+        --device sensor.bath_temperature,sensor.bath_humidity,sensor.pressure \
+        --duration 3600
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime
+import os
+from typing import Any
+
+import aiohttp
+
+from script.event_stream import StreamEvent, StreamHeader, StreamWriter, source_entities
+
+
+def parse_device(value: str) -> dict[str, str]:
+    """Parse temperature_entity,humidity_entity[,pressure_entity]."""
+    entities = value.split(",")
+    if len(entities) not in (2, 3):
+        raise argparse.ArgumentTypeError("expected temperature_entity,humidity_entity[,pressure_entity]")
+    return dict(zip(("temperature_sensor", "humidity_sensor", "pressure_sensor"), entities))
+
+
+class WebsocketClient:
+    """Minimal Home Assistant websocket API client."""
+
+    def __init__(self, websocket: aiohttp.ClientWebSocketResponse) -> None:
+        """Initialize the client."""
+        self._websocket = websocket
+        self._id = 0
+
+    async def authenticate(self, token: str) -> None:
+        """Authenticate with a long-lived access token."""
+        await self._websocket.receive_json()  # auth_required
+        await self._websocket.send_json({"type": "auth", "access_token": token})
+        if (message := await self._websocket.receive_json())["type"] != "auth_ok":
+            raise RuntimeError(f"Authentication failed: {message.get('message')}")
+
+    async def command(self, command: dict[str, Any]) -> Any:
+        """Send a command and return its result."""
+        self._id += 1
+        await self._websocket.send_json({"id": self._id, **command})
+        while (message := await self._websocket.receive_json())["id"] != self._id:
+            pass
+        if not message["success"]:
+            raise RuntimeError(f"{command['type']} failed: {message['error']}")
+        return message["result"]
+
+    async def receive(self) -> dict[str, Any]:
+        """Receive the next message."""
+        return await self._websocket.receive_json()
+
+
+async def record(url: str, token: str, path: str, devices: list[dict[str, str]], duration: float | None) -> int:
+    """Record the stream and return the number of recorded events."""
+    entities = source_entities(devices)
+    wanted = set(entities)
+    count = 0
+    async with aiohttp.ClientSession() as session, session.ws_connect(f"{url.rstrip('/')}/api/websocket") as websocket:
+        client = WebsocketClient(websocket)
+        await client.authenticate(token)
+        await client.command({"type": "subscribe_events", "event_type": "state_changed"})
+        states = {state["entity_id"]: (state["state"], state["attributes"]) for state in await client.command({"type": "get_states"})}
+        if missing := wanted - states.keys():
+            raise RuntimeError(f"Unknown entities: {', '.join(sorted(missing))}")
+
+        start = None
+        loop = asyncio.get_running_loop()
+        deadline = None if duration is None else loop.time() + duration
+        with StreamWriter(path, StreamHeader(devices, entities, {entity_id: states[entity_id] for entity_id in entities})) as writer:
+            while deadline is None or loop.time() < deadline:
+                try:
+                    message = await asyncio.wait_for(client.receive(), None if deadline is None else deadline - loop.time())
+                except TimeoutError:
+                    break
+                if message.get("type") != "event":
+                    continue
+                data = message["event"]["data"]
+                if data["entity_id"] not in wanted or data["new_state"] is None:
+                    continue
+                fired = datetime.fromisoformat(message["event"]["time_fired"]).timestamp()
+                start = fired if start is None else start
+                writer.write(StreamEvent(fired - start, data["entity_id"], data["new_state"]["state"], data["new_state"]["attributes"]))
+                count += 1
+    return count
+
+
+def main() -> None:
+    """Record a stream."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("url", help="Home Assistant URL, e.g. http://homeassistant.local:8123")
+    parser.add_argument("output", help="stream file to write")
+    parser.add_argument("--device", type=parse_device, action="append", required=True, help="temperature_entity,humidity_entity[,pressure_entity]")
+    parser.add_argument("--duration", type=float, help="seconds to record, until Ctrl+C if omitted")
+    parser.add_argument("--token", default=os.environ.get("HASS_TOKEN"), help="long-lived access token, default $HASS_TOKEN")
+    args = parser.parse_args()
+    if not args.token:
+        parser.error("a token is required, use --token or $HASS_TOKEN")
+
+    try:
+        count = asyncio.run(record(args.url, args.token, args.output, args.device, args.duration))
+    except KeyboardInterrupt:
+        print(f"Stopped, {args.output} contains the events recorded so far")
+    else:
+        print(f"Recorded {count} events to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
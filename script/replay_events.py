@@ -0,0 +1,308 @@
+"""Replay a recorded event stream against a test Home Assistant running Thermal Comfort.
+
+Sets up one Thermal Comfort device per recorded device, replays the source
+entity state changes at the recorded pace (or N times faster, or as fast as
+possible with --speed 0) and reports:
+
+- events/sec: replayed input events divided by the time until all updates were written
+- p50/p99 latency: input state change until all sensors of the device wrote their state, or
+  skipped the write because it was unchanged
+- tasks: asyncio tasks created during the replay
+- peak memory: python allocations with --trace-memory (slows the replay down), peak RSS otherwise
+
+The replay fails instead of reporting if an exception is logged, e.g. a failed
+sensor update, because the numbers would not measure working updates.
+
+    python -m script.replay_events living.events.gz --speed 10
+    python -m script.replay_events living.events.gz --speed 0 --options '{"lookup_tables": true}'
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Iterable
+from contextlib import contextmanager
+import json
+import logging
+import resource
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.thermal_comfort.const import DOMAIN
+from custom_components.thermal_comfort.metrics import DeviceMetrics
+from custom_components.thermal_comfort.sensor import (
+    CONF_CUSTOM_ICONS,
+    CONF_ENABLED_SENSORS,
+    CONF_POLL,
+    CONF_PRESSURE_SENSOR,
+    CONF_SCAN_INTERVAL,
+    SensorThermalComfort,
+    SensorType,
+)
+from homeassistant import core, loader
+from homeassistant.components.sensor import DOMAIN as PLATFORM_DOMAIN
+from homeassistant.const import CONF_NAME, CONF_UNIQUE_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_component import DATA_INSTANCES
+from homeassistant.setup import async_setup_component
+from script.event_stream import StreamEvent, StreamHeader, read_stream
+
+
+class ReplayStats:
+    """Collect latencies and task counts of a replay."""
+
+    def __init__(self, devices: dict[str, list[str]]) -> None:
+        """Initialize the statistics.
+
+        :param devices: device unique_ids by source entity
+        """
+        self._devices = devices
+        self._entities: dict[str, int] = {}  # number of sensors by device unique_id
+        self._metrics: dict[int, str] = {}  # device unique_id by id() of the device metrics
+        self._pending: dict[str, list[float]] = {}  # [first input time, sensors left to write] by device unique_id
+        self.latencies: list[float] = []
+        self.tasks = 0
+
+    def register(self, sensor: SensorThermalComfort) -> None:
+        """Count a sensor of a device."""
+        unique_id = sensor._device.unique_id
+        self._entities[unique_id] = self._entities.get(unique_id, 0) + 1
+        self._metrics[id(sensor._device.metrics)] = unique_id
+
+    def input(self, entity_id: str) -> None:
+        """Start the latency measurement for the devices of a source entity."""
+        now = time.perf_counter()
+        for unique_id in self._devices.get(entity_id, ()):
+            if (pending := self._pending.get(unique_id)) is None:
+                self._pending[unique_id] = [now, self._entities.get(unique_id, 0)]
+            else:
+                # All sensors recompute again, keep the time of the first unanswered input
+                pending[1] = self._entities.get(unique_id, 0)
+
+    def written(self, unique_id: str) -> None:
+        """Stop the latency measurement once all sensors of a device have written or skipped an unchanged state."""
+        if (pending := self._pending.get(unique_id)) is None:
+            return
+        pending[1] -= 1
+        if pending[1] <= 0:
+            self.latencies.append(time.perf_counter() - pending[0])
+            del self._pending[unique_id]
+
+    @contextmanager
+    def instrument(self, loop: asyncio.AbstractEventLoop):
+        """Count created tasks and written or skipped sensor states."""
+        stats = self
+        task_factory = loop.get_task_factory()
+        create_eager_task = core.create_eager_task
+        async_write_ha_state = SensorThermalComfort.async_write_ha_state
+        record_write = DeviceMetrics.record_write
+
+        def counting_task_factory(loop, coro, **kwargs):
+            stats.tasks += 1
+            if task_factory is None:
+                return asyncio.Task(coro, loop=loop, **kwargs)
+            return task_factory(loop, coro, **kwargs)
+
+        def counting_create_eager_task(*args, **kwargs):
+            stats.tasks += 1
+            return create_eager_task(*args, **kwargs)
+
+        def timed_async_write_ha_state(self):
+            async_write_ha_state(self)
+            stats.written(self._device.unique_id)
+
+        def timed_record_write(self, written):
+            record_write(self, written)
+            # A skipped write completes the update, a write completes in async_write_ha_state
+            if not written and (unique_id := stats._metrics.get(id(self))) is not None:
+                stats.written(unique_id)
+
+        loop.set_task_factory(counting_task_factory)
+        try:
+            with patch.object(core, "create_eager_task", counting_create_eager_task), patch.object(
+                SensorThermalComfort, "async_write_ha_state", timed_async_write_ha_state
+            ), patch.object(DeviceMetrics, "record_write", timed_record_write):
+                yield
+        finally:
+            loop.set_task_factory(task_factory)
+
+
+class ReplayError(Exception):
+    """The replay did not run the integration as configured."""
+
+
+class _ExceptionCollector(logging.Handler):
+    """Collect the log records of exceptions, e.g. of failed updates and tasks."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.ERROR)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.exc_info is not None:
+            self.records.append(record)
+
+    @contextmanager
+    def collect(self):
+        """Collect while the context is active."""
+        logger = logging.getLogger()
+        logger.addHandler(self)
+        try:
+            yield self
+        finally:
+            logger.removeHandler(self)
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    """Return the percentile of the values, 0 if there are none."""
+    if len(values) < 2:
+        return values[0] if values else 0
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+async def _async_setup_devices(hass: HomeAssistant, header: StreamHeader, options: dict[str, Any], config_entries: bool) -> dict[str, list[str]]:
+    """Set up one Thermal Comfort device per stream device and return the device unique_ids by source entity."""
+    if not config_entries and any(CONF_PRESSURE_SENSOR in device for device in header.devices):
+        raise ReplayError("The stream has pressure sensors, which only config entries support, replay it with --config-entries")
+    devices: dict[str, list[str]] = {}
+    platform = []
+    for i, device in enumerate(header.devices):
+        unique_id = f"replay_{i}"
+        for entity_id in device.values():
+            devices.setdefault(entity_id, []).append(unique_id)
+        if config_entries:
+            MockConfigEntry(
+                domain=DOMAIN,
+                version=2,
+                unique_id=unique_id,
+                data={
+                    CONF_NAME: unique_id,
+                    CONF_POLL: False,
+                    CONF_SCAN_INTERVAL: 30,
+                    CONF_CUSTOM_ICONS: False,
+                    CONF_ENABLED_SENSORS: list(SensorType),
+                    **device,
+                },
+                options=options,
+            ).add_to_hass(hass)
+        else:
+            platform.append({CONF_NAME: unique_id, CONF_UNIQUE_ID: unique_id, **device})
+    assert await async_setup_component(hass, DOMAIN, {} if config_entries else {DOMAIN: {**options, PLATFORM_DOMAIN: platform}})
+    return devices
+
+
+async def replay_stream(
+    header: StreamHeader,
+    events: Iterable[StreamEvent],
+    speed: float,
+    options: dict[str, Any],
+    trace_memory: bool = False,
+    config_entries: bool = False,
+) -> dict[str, Any]:
+    """Replay a stream and return the report.
+
+    :param speed: replay speed factor, 0 for as fast as possible
+    :param options: Thermal Comfort sensor options
+    :param trace_memory: measure peak python allocations instead of peak RSS
+    :param config_entries: set the devices up as config entries instead of YAML
+    :raises ReplayError: if the integration logged an exception
+    """
+    loop = asyncio.get_running_loop()
+
+    with tempfile.TemporaryDirectory() as config_dir, _ExceptionCollector().collect() as exceptions:
+        async with async_test_home_assistant(loop, storage_dir=config_dir) as hass:
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            for entity_id, (state, attributes) in header.initial.items():
+                hass.states.async_set(entity_id, state, attributes)
+            stats = ReplayStats(await _async_setup_devices(hass, header, options, config_entries))
+            await hass.async_block_till_done()
+            for entity in hass.data[DATA_INSTANCES][PLATFORM_DOMAIN].entities:
+                if isinstance(entity, SensorThermalComfort):
+                    stats.register(entity)
+
+            if trace_memory:
+                tracemalloc.start()
+            count = 0
+            with stats.instrument(loop):
+                start = time.perf_counter()
+                for event in events:
+                    if speed > 0 and (delay := start + event.time / speed - time.perf_counter()) > 0:
+                        await asyncio.sleep(delay)
+                    # Home Assistant fires no state change for a repeated state, nothing would answer it
+                    if (old_state := hass.states.get(event.entity_id)) is None or (old_state.state, old_state.attributes) != (event.state, event.attributes):
+                        stats.input(event.entity_id)
+                    hass.states.async_set(event.entity_id, event.state, event.attributes)
+                    count += 1
+                    # Let the event loop run between events like a real event source would
+                    await asyncio.sleep(0)
+                await hass.async_block_till_done()
+                elapsed = time.perf_counter() - start
+            if trace_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            await hass.async_stop(force=True)
+
+    if exceptions.records:
+        first = exceptions.records[0]
+        raise ReplayError(f"{len(exceptions.records)} exceptions were logged during the replay, the first: {first.getMessage()}") from first.exc_info[1]
+
+    return {
+        "events": count,
+        "devices": len(header.devices),
+        "seconds": elapsed,
+        "events_per_second": count / elapsed if elapsed else 0,
+        "latency_p50_ms": _percentile(stats.latencies, 50) * 1e3,
+        "latency_p99_ms": _percentile(stats.latencies, 99) * 1e3,
+        "latency_samples": len(stats.latencies),
+        "tasks": stats.tasks,
+        "peak_memory_mb": (peak_memory if trace_memory else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024) / 2**20,
+        "peak_memory_source": "tracemalloc" if trace_memory else "rss",
+    }
+
+
+def add_replay_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the replay options to a command line parser."""
+    parser.add_argument("--speed", type=float, default=1, help="replay speed factor, 0 for as fast as possible")
+    parser.add_argument("--options", type=json.loads, default={}, help="Thermal Comfort sensor options as JSON")
+    parser.add_argument("--config-entries", action="store_true", help="set the devices up as config entries instead of YAML")
+    parser.add_argument("--trace-memory", action="store_true", help="measure peak python allocations with tracemalloc")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+
+
+def print_report(report: dict[str, Any], as_json: bool = False) -> None:
+    """Print a replay report."""
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{report['events']} events for {report['devices']} devices in {report['seconds']:.2f} s")
+    print(f"events/sec:   {report['events_per_second']:.0f}")
+    if report["latency_samples"]:
+        print(f"latency p50:  {report['latency_p50_ms']:.3f} ms")
+        print(f"latency p99:  {report['latency_p99_ms']:.3f} ms")
+    print(f"tasks:        {report['tasks']}")
+    print(f"peak memory:  {report['peak_memory_mb']:.1f} MiB ({report['peak_memory_source']})")
+
+
+def main() -> None:
+    """Replay a stream and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("stream", help="stream file written by script.record_events or script.synthetic_load")
+    add_replay_arguments(parser)
+    args = parser.parse_args()
+
+    header, events = read_stream(args.stream)
+    print_report(asyncio.run(replay_stream(header, events, args.speed, args.options, args.trace_memory, args.config_entries)), args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Generate a seeded synthetic workload for Thermal Comfort and replay it or write it to a stream file.
+
+Every device gets its own temperature, humidity and, with --pressure true
+and --config-entries, pressure source sensor. Each sensor reports periodically with a random phase. The
+values follow a diurnal cycle plus gaussian noise, and humidity moves
+opposite to temperature. On top of that:
+
+- bursts: a random fraction of devices report all their sensors at the same
+  instant, like a coordinator reconnecting or a gateway flushing its frames
+- dropouts: a sensor becomes unavailable for a while and then resumes
+
+The same seed and parameters always produce the same event stream.
+
+    python -m script.synthetic_load --devices 5000 --duration 600 --speed 0 --config-entries
+    python -m script.synthetic_load --devices 100 --duration 86400 --output day.events.gz
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Iterator
+from dataclasses import dataclass, fields
+import heapq
+import math
+import random
+
+from script.event_stream import StreamEvent, StreamHeader, StreamWriter, source_entities
+from script.replay_events import add_replay_arguments, print_report, replay_stream
+
+DAY = 86400
+TEMPERATURE_ATTRIBUTES = {"device_class": "temperature", "unit_of_measurement": "°C"}
+HUMIDITY_ATTRIBUTES = {"device_class": "humidity", "unit_of_measurement": "%"}
+PRESSURE_ATTRIBUTES = {"device_class": "pressure", "unit_of_measurement": "hPa"}
+# Workload field annotations are strings because of the postponed evaluation of annotations
+ARGUMENT_TYPES = {"int": int, "float": float, "bool": lambda value: value.lower() in ("1", "true", "yes", "on")}
+
+
+@dataclass
+class Workload:
+    """Parameters of a synthetic workload, times in seconds."""
+
+    devices: int = 100
+    duration: float = 3600
+    interval: float = 60  # between two reports of a sensor
+    noise: float = 0.1  # standard deviation in °C, three times that in % and hPa / 2
+    diurnal: float = 3.0  # amplitude in °C
+    burst_interval: float = 600  # mean time between bursts, 0 to disable
+    burst_fraction: float = 0.2  # of the devices reporting in a burst
+    dropout_interval: float = 6 * 3600  # mean time between dropouts of a sensor, 0 to disable
+    dropout_duration: float = 120  # mean
+    pressure: bool = False  # YAML devices have no pressure sensor, needs --config-entries to replay
+    seed: int = 0
+
+
+class _Device:
+    """Deterministic source values of a device."""
+
+    def __init__(self, index: int, rng: random.Random) -> None:
+        self.temperature_entity = f"sensor.synthetic_temperature_{index}"
+        self.humidity_entity = f"sensor.synthetic_humidity_{index}"
+        self.pressure_entity = f"sensor.synthetic_pressure_{index}"
+        self.temperature = rng.uniform(18, 24)
+        self.humidity = rng.uniform(35, 65)
+        self.pressure = rng.uniform(990, 1030)
+        self.phase = rng.uniform(0, 2 * math.pi)
+
+    def value(self, entity_id: str, time: float, workload: Workload, rng: random.Random) -> str:
+        cycle = math.sin(2 * math.pi * time / DAY + self.phase)
+        if entity_id == self.temperature_entity:
+            return f"{self.temperature + workload.diurnal * cycle + rng.gauss(0, workload.noise):.1f}"
+        if entity_id == self.humidity_entity:
+            humidity = self.humidity - 2.5 * workload.diurnal * cycle + rng.gauss(0, 3 * workload.noise)
+            return f"{min(max(humidity, 1), 100):.1f}"
+        return f"{self.pressure + 2 * cycle + rng.gauss(0, workload.noise / 2):.1f}"
+
+
+def synthetic_stream(workload: Workload) -> tuple[StreamHeader, Iterator[StreamEvent]]:
+    """Return the header and the events of a synthetic workload."""
+    rng = random.Random(workload.seed)
+    devices = [_Device(i, rng) for i in range(workload.devices)]
+    device_configs = []
+    attributes = {}
+    owner = {}
+    for device in devices:
+        config = {"temperature_sensor": device.temperature_entity, "humidity_sensor": device.humidity_entity}
+        attributes[device.temperature_entity] = TEMPERATURE_ATTRIBUTES
+        attributes[device.humidity_entity] = HUMIDITY_ATTRIBUTES
+        if workload.pressure:
+            config["pressure_sensor"] = device.pressure_entity
+            attributes[device.pressure_entity] = PRESSURE_ATTRIBUTES
+        device_configs.append(config)
+        for entity_id in config.values():
+            owner[entity_id] = device
+    entities = source_entities(device_configs)
+    header = StreamHeader(
+        device_configs,
+        entities,
+        {entity_id: (owner[entity_id].value(entity_id, 0, workload, rng), attributes[entity_id]) for entity_id in entities},
+    )
+
+    def events() -> Iterator[StreamEvent]:
+        # (time, sequence, entity_id or None for a burst), the sequence keeps the order deterministic
+        queue = [(rng.uniform(0, workload.interval), i, entity_id) for i, entity_id in enumerate(entities)]
+        sequence = len(queue)
+        if workload.burst_interval > 0:
+            queue.append((rng.expovariate(1 / workload.burst_interval), sequence, None))
+            sequence += 1
+        heapq.heapify(queue)
+        unavailable_until = {}
+        dropout_probability = 1 - math.exp(-workload.interval / workload.dropout_interval) if workload.dropout_interval > 0 else 0
+
+        while queue and (item := heapq.heappop(queue))[0] < workload.duration:
+            time, _, entity_id = item
+            if entity_id is None:
+                for device in rng.sample(devices, round(workload.burst_fraction * len(devices))):
+                    for burst_entity_id in (device.temperature_entity, device.humidity_entity, device.pressure_entity):
+                        if burst_entity_id in attributes and unavailable_until.get(burst_entity_id, 0) <= time:
+                            yield StreamEvent(time, burst_entity_id, device.value(burst_entity_id, time, workload, rng), attributes[burst_entity_id])
+                heapq.heappush(queue, (time + rng.expovariate(1 / workload.burst_interval), sequence, None))
+            elif rng.random() < dropout_probability:
+                unavailable_until[entity_id] = time + rng.expovariate(1 / workload.dropout_duration)
+                yield StreamEvent(time, entity_id, "unavailable", attributes[entity_id])
+                heapq.heappush(queue, (unavailable_until[entity_id], sequence, entity_id))
+            else:
+                yield StreamEvent(time, entity_id, owner[entity_id].value(entity_id, time, workload, rng), attributes[entity_id])
+                heapq.heappush(queue, (time + workload.interval, sequence, entity_id))
+            sequence += 1
+
+    return header, events()
+
+
+def main() -> None:
+    """Generate a workload and replay it or write it to a file."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    for workload_field in fields(Workload):
+        parser.add_argument(
+            f"--{workload_field.name.replace('_', '-')}",
+            type=ARGUMENT_TYPES[workload_field.type],
+            default=workload_field.default,
+            help=f"default: {workload_field.default}",
+        )
+    parser.add_argument("--output", help="write the stream to this file instead of replaying it")
+    add_replay_arguments(parser)
+    args = parser.parse_args()
+
+    workload = Workload(**{workload_field.name: getattr(args, workload_field.name) for workload_field in fields(Workload)})
+    if workload.pressure and not args.output and not args.config_entries:
+        parser.error("--pressure true needs --config-entries, YAML devices have no pressure sensor")
+    header, events = synthetic_stream(workload)
+    if args.output:
+        count = 0
+        with StreamWriter(args.output, header) as writer:
+            for event in events:
+                writer.write(event)
+                count += 1
+        print(f"Wrote {count} events for {workload.devices} devices to {args.output}")
+        return
+    print_report(asyncio.run(replay_stream(header, events, args.speed, args.options, args.trace_memory, args.config_entries)), args.json)
+
+
+if __name__ == "__main__":
+    main()
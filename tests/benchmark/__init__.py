@@ -0,0 +1 @@
+"""Benchmarks for Thermal Comfort component."""
@@ -0,0 +1,95 @@
+"""Fixtures for Thermal Comfort benchmarks.
+
+Every benchmark records the best time per operation of several repeats. The
+results are compared with baseline.json and a benchmark fails if it is slower
+than the baseline times --benchmark-tolerance. Run with --benchmark-save to
+write the results as new baseline instead.
+"""
+
+from collections.abc import Awaitable, Callable
+import json
+import math
+from pathlib import Path
+import platform
+import time
+import timeit
+
+import pytest
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+
+class Benchmark:
+    """Time code and compare the result with the baseline."""
+
+    def __init__(self, baseline: dict[str, float], results: dict[str, float], tolerance: float | None) -> None:
+        """Initialize the benchmark.
+
+        :param baseline: seconds per operation by benchmark name
+        :param results: collects the seconds per operation of this run
+        :param tolerance: allowed factor over the baseline, None to skip the comparison
+        """
+        self._baseline = baseline
+        self._results = results
+        self._tolerance = tolerance
+
+    def _record(self, name: str, seconds: float) -> float:
+        self._results[name] = seconds
+        expected = self._baseline.get(name)
+        if self._tolerance is not None and expected is not None:
+            assert seconds <= expected * self._tolerance, f"{name}: {seconds * 1e6:.2f} µs per operation, baseline {expected * 1e6:.2f} µs"
+        return seconds
+
+    def run(self, name: str, func: Callable[[], object], number: int = 1000, repeat: int = 5, operations: int = 1) -> float:
+        """Time a function and return the seconds per operation.
+
+        :param operations: number of operations a single call performs
+        """
+        return self._record(name, min(timeit.repeat(func, number=number, repeat=repeat)) / (number * operations))
+
+    async def async_run(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[object]],
+        number: int = 1000,
+        repeat: int = 5,
+        operations: int = 1,
+    ) -> float:
+        """Time a coroutine function and return the seconds per operation.
+
+        :param operations: number of operations a single call performs
+        """
+        best = math.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                await func()
+            best = min(best, time.perf_counter() - start)
+        return self._record(name, best / (number * operations))
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request):
+    """Collect the results of all benchmarks and store them as baseline if requested."""
+    results = {}
+    yield results
+    if request.config.getoption("--benchmark-save") and results:
+        baseline = {
+            "machine": f"{platform.python_implementation()} {platform.python_version()} {platform.machine()}",
+            "seconds_per_operation": dict(sorted(results.items())),
+        }
+        BASELINE.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def benchmark(request, benchmark_results) -> Benchmark:
+    """Return a benchmark timer."""
+    baseline = json.loads(BASELINE.read_text(encoding="utf-8"))["seconds_per_operation"] if BASELINE.exists() else {}
+    tolerance = None if request.config.getoption("--benchmark-save") else request.config.getoption("--benchmark-tolerance")
+    return Benchmark(baseline, benchmark_results, tolerance)
+
+
+@pytest.fixture(autouse=True)
+def disable_loop_debug(hass):
+    """Disable asyncio debug mode, its tracebacks for every task and callback would dominate the timings."""
+    hass.loop.set_debug(False)
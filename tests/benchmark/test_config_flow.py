@@ -0,0 +1,36 @@
+"""Benchmark the Thermal Comfort config flow against large state machines."""
+
+import pytest
+
+from custom_components.thermal_comfort.config_flow import build_schema
+from homeassistant.components.sensor import SensorDeviceClass
+
+pytestmark = pytest.mark.benchmark
+
+# Every tenth entity is a candidate temperature or humidity sensor, the rest
+# resembles a typical installation.
+ENTITY_MIX = [
+    ("sensor", {"device_class": SensorDeviceClass.TEMPERATURE, "unit_of_measurement": "°C"}),
+    ("sensor", {"device_class": SensorDeviceClass.HUMIDITY, "unit_of_measurement": "%"}),
+    ("sensor", {"device_class": SensorDeviceClass.POWER, "unit_of_measurement": "W"}),
+    ("sensor", {"device_class": SensorDeviceClass.ENERGY, "unit_of_measurement": "kWh"}),
+    ("sensor", {"device_class": SensorDeviceClass.BATTERY, "unit_of_measurement": "%"}),
+    ("sensor", {"unit_of_measurement": "°C"}),
+    ("sensor", {}),
+    ("binary_sensor", {}),
+    ("light", {}),
+    ("switch", {}),
+]
+
+
+@pytest.mark.parametrize("entities", [1000, 10000])
+@pytest.mark.parametrize("show_advanced", [False, True])
+async def test_build_schema(hass, benchmark, entities, show_advanced):
+    """Time building the user step schema."""
+    for i in range(entities):
+        domain, attributes = ENTITY_MIX[i % len(ENTITY_MIX)]
+        hass.states.async_set(f"{domain}.bench_{i}", "1", attributes)
+
+    assert build_schema(None, hass, show_advanced) is not None
+
+    benchmark.run(f"build_schema[{entities} entities-{'advanced' if show_advanced else 'basic'}]", lambda: build_schema(None, hass, show_advanced), number=5, repeat=3)
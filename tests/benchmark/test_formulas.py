@@ -0,0 +1,52 @@
+"""Benchmark the Thermal Comfort formulas in isolation."""
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.thermal_comfort.saturation import SaturationModel
+from custom_components.thermal_comfort.sensor import DeviceThermalComfort, SensorType
+
+pytestmark = pytest.mark.benchmark
+
+VARIANTS = {
+    "formula": {},
+    "lookup_tables": {"lookup_tables": True},
+    "magnus": {"saturation_model": SaturationModel.MAGNUS},
+}
+
+
+@pytest.fixture
+async def device(hass, tmp_path, request):
+    """Return a compute device with valid inputs."""
+    hass.config.config_dir = str(tmp_path)
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0", {"unit_of_measurement": "°C"})
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    compute_device = DeviceThermalComfort(
+        hass=hass,
+        name="test_thermal_comfort",
+        unique_id="unique_thermal_comfort_id",
+        temperature_entity="sensor.test_temperature_sensor",
+        humidity_entity="sensor.test_humidity_sensor",
+        pressure_entity=None,
+        outdoor_device="unique_thermal_comfort_id",
+        should_poll=True,
+        scan_interval=timedelta(hours=1),
+        **VARIANTS[request.param],
+    )
+    await compute_device.async_track_mould_growth()
+    await compute_device.async_track_running_mean()
+    compute_device.running_mean.running_mean = 20.0
+    await hass.async_block_till_done()
+    yield compute_device
+    compute_device.cleanup()
+
+
+@pytest.mark.parametrize("device", list(VARIANTS), indirect=True)
+@pytest.mark.parametrize("sensor_type", list(SensorType))
+async def test_formula(benchmark, device, sensor_type, request):
+    """Time a single formula, with the values it depends on already computed."""
+    formula = getattr(DeviceThermalComfort, sensor_type).__wrapped__
+    assert await formula(device) is not None
+
+    await benchmark.async_run(f"formula[{sensor_type}-{request.node.callspec.params['device']}]", lambda: formula(device))
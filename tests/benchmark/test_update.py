@@ -0,0 +1,50 @@
+"""Benchmark the Thermal Comfort update path from input state change to written sensor states."""
+
+import pytest
+
+from custom_components.thermal_comfort.const import DOMAIN
+from custom_components.thermal_comfort.sensor import DEFAULT_SENSOR_TYPES, SensorType
+from homeassistant.components.sensor import DOMAIN as PLATFORM_DOMAIN
+from homeassistant.setup import async_setup_component
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize(("devices", "rounds"), [(1, 200), (100, 20), (1000, 5)])
+async def test_temperature_update(hass, benchmark, devices, rounds):
+    """Time a temperature change until all sensor states of its device are written."""
+    for i in range(devices):
+        hass.states.async_set(f"sensor.bench_temperature_{i}", "20.0", {"unit_of_measurement": "°C"})
+        hass.states.async_set(f"sensor.bench_humidity_{i}", "50.0")
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: {
+                PLATFORM_DOMAIN: [
+                    {
+                        "name": f"bench_{i}",
+                        "temperature_sensor": f"sensor.bench_temperature_{i}",
+                        "humidity_sensor": f"sensor.bench_humidity_{i}",
+                        "unique_id": f"bench_{i}",
+                    }
+                    for i in range(devices)
+                ]
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    assert len(hass.states.async_entity_ids(PLATFORM_DOMAIN)) == devices * (len(DEFAULT_SENSOR_TYPES) + 2)
+
+    temperature = 20.0
+
+    async def update():
+        nonlocal temperature
+        temperature = 45.0 - temperature
+        for i in range(devices):
+            hass.states.async_set(f"sensor.bench_temperature_{i}", str(temperature), {"unit_of_measurement": "°C"})
+        await hass.async_block_till_done()
+
+    await benchmark.async_run(f"update[{devices} devices]", update, number=rounds, repeat=3, operations=devices)
+
+    assert hass.states.get(f"sensor.bench_{devices - 1}_{SensorType.HEAT_INDEX}").attributes["temperature"] == temperature
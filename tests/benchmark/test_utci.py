@@ -0,0 +1,40 @@
+"""Benchmark the evaluation of the UTCI polynomial."""
+
+import numpy as np
+import pytest
+
+from custom_components.thermal_comfort.utci import (
+    universal_thermal_climate_indices,
+    utci_polynomial,
+    utci_terms,
+)
+
+pytestmark = pytest.mark.benchmark
+
+TERMS = utci_terms()
+ARGUMENTS = (25.0, 1.0, 2.0, 1.6)  # ta, va, d_tmrt, pa
+BATCH = 10000
+
+
+def naive_polynomial(ta: float, va: float, d_tmrt: float, pa: float) -> float:
+    """Evaluate the polynomial term by term, as the reference code does."""
+    return sum(coefficient * ta**i * va**j * d_tmrt**k * pa**m for coefficient, i, j, k, m in TERMS)
+
+
+async def test_utci_polynomial(benchmark):
+    """Time the compiled Horner scheme against the term by term evaluation."""
+    assert utci_polynomial(*ARGUMENTS) == pytest.approx(naive_polynomial(*ARGUMENTS), abs=1e-9)
+
+    naive = benchmark.run("utci[naive]", lambda: naive_polynomial(*ARGUMENTS), number=200)
+    horner = benchmark.run("utci[horner]", lambda: utci_polynomial(*ARGUMENTS))
+    assert horner < naive
+
+
+async def test_utci_batch(benchmark):
+    """Time the NumPy form per evaluation."""
+    rng = np.random.default_rng(0)
+    temperatures = rng.uniform(-20, 40, BATCH)
+    humidities = rng.uniform(10, 100, BATCH)
+    wind_speeds = rng.uniform(0.5, 10, BATCH)
+
+    benchmark.run("utci[numpy]", lambda: universal_thermal_climate_indices(temperatures, humidities, wind_speeds), number=10, operations=BATCH)
@@ -39,3 +39,26 @@ async def start_ha(hass, domains, config, caplog):
 async def caplog_setup_text(caplog):
     """Return setup log of integration."""
     yield caplog.text
+
+
+def pytest_addoption(parser):
+    """Add the benchmark options."""
+    group = parser.getgroup("thermal_comfort", "Thermal Comfort benchmarks")
+    group.addoption("--benchmark", action="store_true", help="run the benchmarks in tests/benchmark")
+    group.addoption("--benchmark-save", action="store_true", help="store the benchmark results as new baseline instead of comparing")
+    group.addoption("--benchmark-tolerance", type=float, default=2.0, help="fail benchmarks slower than tolerance times the baseline")
+
+
+def pytest_configure(config):
+    """Register the benchmark marker."""
+    config.addinivalue_line("markers", "benchmark: performance benchmark, only run with --benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless requested."""
+    if config.getoption("--benchmark") or config.getoption("--benchmark-save"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="needs --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
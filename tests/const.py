@@ -1,6 +1,20 @@
 """Constants for Thermal Comfort integration tests."""
 
-from custom_components.thermal_comfort.const import CONF_HUMIDITY_SENSOR, CONF_POLL, CONF_TEMPERATURE_SENSOR
+from custom_components.thermal_comfort.const import (
+    CONF_AIR_SPEED,
+    CONF_BUNDLE,
+    CONF_CLOTHING_INSULATION,
+    CONF_HUMIDITY_SENSOR,
+    CONF_INPUT_ATTRIBUTES,
+    CONF_LOOKUP_TABLES,
+    CONF_METABOLIC_RATE,
+    CONF_POLL,
+    CONF_ROLLING_STATISTICS,
+    CONF_SATURATION_MODEL,
+    CONF_SLOW_UPDATE_THRESHOLD,
+    CONF_TEMPERATURE_SENSOR,
+    CONF_TRENDS,
+)
 from custom_components.thermal_comfort.sensor import CONF_CUSTOM_ICONS, CONF_ENABLED_SENSORS, CONF_SCAN_INTERVAL
 from homeassistant.const import CONF_NAME
 
@@ -11,6 +25,16 @@ USER_INPUT = {
     CONF_POLL: False,
     CONF_CUSTOM_ICONS: False,
     CONF_SCAN_INTERVAL: 30,
+    CONF_LOOKUP_TABLES: False,
+    CONF_SATURATION_MODEL: "formula",
+    CONF_SLOW_UPDATE_THRESHOLD: 0,
+    CONF_BUNDLE: False,
+    CONF_INPUT_ATTRIBUTES: True,
+    CONF_ROLLING_STATISTICS: [],
+    CONF_TRENDS: [],
+    CONF_AIR_SPEED: 0.1,
+    CONF_METABOLIC_RATE: 1.2,
+    CONF_CLOTHING_INSULATION: 0.7,
 }
 
 ADVANCED_USER_INPUT = {
@@ -0,0 +1,68 @@
+"""Test the adaptive comfort model and the prevailing mean outdoor temperature."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from custom_components.thermal_comfort.adaptive import (
+    RUNNING_MEAN_ALPHA,
+    RunningMeanTemperature,
+    acceptability,
+    adaptive_comfort_temperature,
+)
+import homeassistant.util.dt as dt_util
+
+
+def local(day: int, hour: float) -> datetime:
+    """Return a local time in January 2024."""
+    return dt_util.start_of_local_day(datetime(2024, 1, day)) + timedelta(hours=hour)
+
+
+def test_adaptive_comfort_temperature():
+    """Test the comfort temperature and its valid range."""
+    assert adaptive_comfort_temperature(20.0) == pytest.approx(24.0)
+    assert adaptive_comfort_temperature(9.9) is None
+    assert adaptive_comfort_temperature(33.6) is None
+
+
+def test_acceptability():
+    """Test the ranges of 90 and 80 % satisfied occupants."""
+    assert acceptability(24.0, 24.0) == 90
+    assert acceptability(21.5, 24.0) == 90
+    assert acceptability(27.0, 24.0) == 80
+    assert acceptability(27.6, 24.0) == 0
+
+
+def test_running_mean():
+    """Test that each completed day is weighted into the running mean by its time weighted mean."""
+    running_mean = RunningMeanTemperature()
+    running_mean.update(local(1, 0), 10.0)
+    running_mean.update(local(1, 18), 30.0)
+    assert running_mean.running_mean is None
+
+    # The first day starts the running mean, 18 h at 10 °C and 6 h at 30 °C
+    running_mean.update(local(2, 6), 20.0)
+    assert running_mean.days == 1
+    assert running_mean.running_mean == pytest.approx(15.0)
+
+    # A gap without a valid temperature does not count
+    running_mean.update(local(2, 12), None)
+    running_mean.update(local(4, 0), 20.0)
+    running_mean.update(local(5, 1), 20.0)
+    assert running_mean.days == 3
+    expected = (1 - RUNNING_MEAN_ALPHA) * 25.0 + RUNNING_MEAN_ALPHA * 15.0  # 6 h at 30 °C and 6 h at 20 °C, day 3 is skipped
+    expected = (1 - RUNNING_MEAN_ALPHA) * 20.0 + RUNNING_MEAN_ALPHA * expected
+    assert running_mean.running_mean == pytest.approx(expected)
+
+
+def test_restore():
+    """Test that a restored partial day continues."""
+    running_mean = RunningMeanTemperature()
+    running_mean.update(local(1, 0), 10.0)
+    running_mean.update(local(1, 12), 20.0)
+
+    restored = RunningMeanTemperature(**running_mean.as_dict())
+    # The time without an update across the restart does not count
+    restored.update(local(1, 18), 20.0)
+    restored.update(local(2, 1), 20.0)
+    assert restored.running_mean == pytest.approx((12 * 10.0 + 6 * 20.0) / 18)
@@ -7,13 +7,16 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.thermal_comfort.config_flow import CONF_HUMIDITY_SENSOR, CONF_TEMPERATURE_SENSOR
-from custom_components.thermal_comfort.const import DOMAIN
-from custom_components.thermal_comfort.sensor import CONF_PRESSURE_SENSOR
+from custom_components.thermal_comfort import async_setup_entry
+from custom_components.thermal_comfort.candidates import async_release_candidate_index
+from custom_components.thermal_comfort.config_flow import CONF_HUMIDITY_SENSOR, CONF_TEMPERATURE_SENSOR, SOURCE_DISCOVERED_PAIR, get_sensors_by_device_class
+from custom_components.thermal_comfort.const import CONF_PAIRS, DATA_CANDIDATE_INDEX, DOMAIN
+from custom_components.thermal_comfort.sensor import CONF_PRESSURE_SENSOR, DEFAULT_SENSOR_TYPES
 from homeassistant import config_entries
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import CONF_NAME
 from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import area_registry as ar, device_registry as dr, entity_registry as er
 
 from .const import ADVANCED_USER_INPUT, USER_INPUT
 from .test_sensor import DEFAULT_TEST_SENSORS
@@ -169,3 +172,121 @@ async def test_config_flow_with_pressure_sensor(hass, start_ha):
     result = await _flow_configure(hass, result, input_with_pressure)
     assert result["type"] == FlowResultType.CREATE_ENTRY
     assert result["data"][CONF_PRESSURE_SENSOR] == "sensor.test_pressure_sensor"
+
+
+async def test_candidate_index(hass):
+    """Test that the candidate sources follow state changes and entity registry updates."""
+    entity_registry = er.async_get(hass)
+    hass.states.async_set("sensor.kitchen_temperature", "20", {"device_class": SensorDeviceClass.TEMPERATURE})
+    hass.states.async_set("sensor.outside", "20", {"unit_of_measurement": "°C"})
+    hass.states.async_set("sensor.power", "20", {"unit_of_measurement": "W"})
+    hass.states.async_set("light.kitchen", "on")
+    entity_registry.async_get_or_create("sensor", DOMAIN, "kitchen_dew_point", suggested_object_id="kitchen_dew_point")
+    hass.states.async_set("sensor.kitchen_dew_point", "10", {"device_class": SensorDeviceClass.TEMPERATURE})
+    assert get_sensors_by_device_class(None, hass, SensorDeviceClass.TEMPERATURE) == ["sensor.kitchen_temperature"]
+    assert get_sensors_by_device_class(None, hass, SensorDeviceClass.TEMPERATURE, include_all=True) == ["sensor.kitchen_temperature", "sensor.outside"]
+    assert get_sensors_by_device_class(None, hass, SensorDeviceClass.HUMIDITY, include_all=True) == ["sensor.kitchen_temperature"]
+
+    hass.states.async_set("sensor.bathroom_temperature", "20", {"device_class": SensorDeviceClass.TEMPERATURE})
+    hass.states.async_set("sensor.outside", "20", {"device_class": SensorDeviceClass.HUMIDITY, "unit_of_measurement": "%"})
+    hass.states.async_remove("sensor.kitchen_temperature")
+    assert get_sensors_by_device_class(None, hass, SensorDeviceClass.TEMPERATURE, include_all=True) == ["sensor.bathroom_temperature"]
+    assert get_sensors_by_device_class(None, hass, SensorDeviceClass.HUMIDITY) == ["sensor.outside"]
+
+    # Entities of other integrations are candidates whatever their name, those of Thermal Comfort never are
+    hass.states.async_set("sensor.cellar_dew_point", "10", {"device_class": SensorDeviceClass.TEMPERATURE})
+    assert get_sensors_by_device_class(None, hass, SensorDeviceClass.TEMPERATURE) == ["sensor.bathroom_temperature", "sensor.cellar_dew_point"]
+    entity_registry.async_remove("sensor.kitchen_dew_point")
+    await hass.async_block_till_done()
+    assert get_sensors_by_device_class(None, hass, SensorDeviceClass.TEMPERATURE) == ["sensor.bathroom_temperature", "sensor.cellar_dew_point", "sensor.kitchen_dew_point"]
+
+    # The index is dropped with its listeners once nothing uses it and is built again on the next use
+    async_release_candidate_index(hass)
+    assert DATA_CANDIDATE_INDEX not in hass.data
+    hass.states.async_set("sensor.attic_temperature", "20", {"device_class": SensorDeviceClass.TEMPERATURE})
+    assert get_sensors_by_device_class(None, hass, SensorDeviceClass.TEMPERATURE) == [
+        "sensor.attic_temperature",
+        "sensor.bathroom_temperature",
+        "sensor.cellar_dew_point",
+        "sensor.kitchen_dew_point",
+    ]
+
+
+async def test_discovery_flow(hass):
+    """Test pairing sensors by device and area and creating their entries in one batch."""
+    other_entry = MockConfigEntry(domain="test")
+    other_entry.add_to_hass(hass)
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+    bedroom = ar.async_get(hass).async_create("Bedroom")
+
+    def add_sensor(object_id, device_class, device=None, area_id=None):
+        entity_registry.async_get_or_create(
+            "sensor", "test", object_id, suggested_object_id=object_id, device_id=device.id if device else None, config_entry=other_entry if device else None
+        )
+        if area_id is not None:
+            entity_registry.async_update_entity(f"sensor.{object_id}", area_id=area_id)
+        hass.states.async_set(f"sensor.{object_id}", "1", {"device_class": device_class, "state_class": "measurement"})
+
+    climate = device_registry.async_get_or_create(config_entry_id=other_entry.entry_id, identifiers={("test", "climate")}, name="Living room climate")
+    add_sensor("living_room_temperature", SensorDeviceClass.TEMPERATURE, climate)
+    add_sensor("living_room_humidity", SensorDeviceClass.HUMIDITY, climate)
+    add_sensor("living_room_pressure", SensorDeviceClass.PRESSURE, climate)
+    thermometer = device_registry.async_get_or_create(config_entry_id=other_entry.entry_id, identifiers={("test", "thermometer")}, name="Thermometer")
+    device_registry.async_update_device(thermometer.id, area_id=bedroom.id)
+    add_sensor("bedroom_temperature", SensorDeviceClass.TEMPERATURE, thermometer)
+    add_sensor("bedroom_humidity", SensorDeviceClass.HUMIDITY, area_id=bedroom.id)
+    add_sensor("kitchen_temperature", SensorDeviceClass.TEMPERATURE)
+
+    result = await _flow_init(hass)
+    assert result["type"] == FlowResultType.MENU
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {"next_step_id": "discovery"})
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "discovery"
+    assert result["description_placeholders"] == {"count": "2"}
+
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {CONF_PAIRS: []})
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "no_valid_pairs"}
+
+    with patch("custom_components.thermal_comfort.async_setup_entry", async_setup_entry):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                CONF_PAIRS: ["sensor.living_room_temperature+sensor.living_room_humidity", "sensor.bedroom_temperature+sensor.bedroom_humidity"],
+                CONF_PRESSURE_SENSOR: "sensor.living_room_pressure",
+            },
+        )
+        await hass.async_block_till_done()
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["title"] == "Living room climate"
+    assert result["description"] == "entries_created"
+    assert result["description_placeholders"] == {"count": "2", "failed": ""}
+    entries = hass.config_entries.async_entries(DOMAIN)
+    assert sorted((entry.title, entry.data.get(CONF_PRESSURE_SENSOR)) for entry in entries) == [
+        ("Bedroom", "sensor.living_room_pressure"),
+        ("Living room climate", "sensor.living_room_pressure"),
+    ]
+    for entry in entries:
+        enabled = {entity.unique_id.removeprefix(entry.unique_id) for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id) if not entity.disabled}
+        assert enabled == set(DEFAULT_SENSOR_TYPES)
+
+    # All pairs are configured now
+    result = await _flow_init(hass)
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "user"
+
+    # The flows of further pairs end with the reason they were not created, which the discovery step reports
+    data = {CONF_NAME: "Living room", CONF_TEMPERATURE_SENSOR: "sensor.living_room_temperature", CONF_HUMIDITY_SENSOR: "sensor.living_room_humidity"}
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_DISCOVERED_PAIR}, data=data)
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_DISCOVERED_PAIR}, data={**data, CONF_HUMIDITY_SENSOR: "sensor.kitchen_temperature"})
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "humidity_not_found"
+
+    # The candidate index is kept while entries are loaded and dropped with the last one
+    assert DATA_CANDIDATE_INDEX in hass.data
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    assert DATA_CANDIDATE_INDEX not in hass.data
@@ -0,0 +1,53 @@
+"""Test the Thermal Comfort diagnostics."""
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.thermal_comfort.const import DOMAIN
+from custom_components.thermal_comfort.diagnostics import (
+    async_get_config_entry_diagnostics,
+    async_get_device_diagnostics,
+)
+from custom_components.thermal_comfort.sensor import CONF_ENABLED_SENSORS, SensorType
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from .const import ADVANCED_USER_INPUT
+
+
+async def test_diagnostics(hass: HomeAssistant):
+    """Test input, recompute and write counters."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={**ADVANCED_USER_INPUT, CONF_ENABLED_SENSORS: [SensorType.DEW_POINT, SensorType.ABSOLUTE_HUMIDITY]},
+        entry_id="test",
+        unique_id="uniqueid",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.test_temperature_sensor", "26.0")
+    await hass.async_block_till_done()
+    # Same humidity with new attributes, the computed values do not change
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0", {"unit_of_measurement": "%"})
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["entry"]["data"]["name"] == "test_thermal_comfort"
+    metrics = diagnostics["device"]
+    assert metrics["unique_id"] == "uniqueid"
+    assert metrics["input_events"] == {"temperature": 1, "humidity": 1}
+    assert set(metrics["input_age_seconds"]) == {"temperature", "humidity"}
+    assert metrics["recomputes"][SensorType.DEW_POINT] == 3
+    assert metrics["compute_time"][SensorType.DEW_POINT]["count"] == 3
+    assert sum(metrics["compute_time"][SensorType.DEW_POINT]["buckets_us"].values()) == 3
+    assert metrics["state_writes"] == 4
+    assert metrics["suppressed_writes"] == 2
+
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "uniqueid")})
+    device_diagnostics = await async_get_device_diagnostics(hass, entry, device)
+    assert device_diagnostics["recomputes"] == metrics["recomputes"]
+    assert device_diagnostics["state_writes"] == metrics["state_writes"]
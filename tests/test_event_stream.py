@@ -0,0 +1,77 @@
+"""Test the event stream file format of the load scripts."""
+
+import gzip
+
+import pytest
+
+from script.event_stream import (
+    StreamEvent,
+    StreamHeader,
+    StreamWriter,
+    read_stream,
+    source_entities,
+)
+from script.synthetic_load import Workload, synthetic_stream
+
+DEVICES = [
+    {"temperature_sensor": "sensor.temperature", "humidity_sensor": "sensor.humidity"},
+    {"temperature_sensor": "sensor.temperature", "humidity_sensor": "sensor.humidity_2", "pressure_sensor": "sensor.pressure"},
+]
+
+
+def test_source_entities():
+    """Test that shared source entities are listed once."""
+    assert source_entities(DEVICES) == ["sensor.temperature", "sensor.humidity", "sensor.humidity_2", "sensor.pressure"]
+
+
+def test_round_trip(tmp_path):
+    """Test that events are read back as written."""
+    path = str(tmp_path / "test.events.gz")
+    header = StreamHeader(DEVICES, source_entities(DEVICES), {"sensor.temperature": ("20.0", {"unit_of_measurement": "°C"})})
+    events = [
+        StreamEvent(0.5, "sensor.temperature", "20.5", {"unit_of_measurement": "°C"}),
+        StreamEvent(0.5, "sensor.humidity", "40", {"unit_of_measurement": "%"}),
+        StreamEvent(1.25, "sensor.humidity", "41", {"unit_of_measurement": "%"}),
+        StreamEvent(3, "sensor.temperature", "68.9", {"unit_of_measurement": "°F"}),
+    ]
+    with StreamWriter(path, header) as writer:
+        for event in events:
+            writer.write(event)
+
+    read_header, read_events = read_stream(path)
+    assert read_header == header
+    assert list(read_events) == events
+
+
+def test_wrong_format(tmp_path):
+    """Test that other files are rejected."""
+    path = tmp_path / "test.events.gz"
+    path.write_bytes(gzip.compress(b'{"format": "other"}\n'))
+    with pytest.raises(ValueError):
+        read_stream(str(path))
+
+
+def test_synthetic_workload_is_deterministic():
+    """Test that the same seed produces the same stream and other seeds do not."""
+    workload = Workload(devices=10, duration=1800, pressure=True, seed=1)
+
+    def stream(workload):
+        header, events = synthetic_stream(workload)
+        return header, list(events)
+
+    header, events = stream(workload)
+    assert stream(workload) == (header, events)
+    assert stream(Workload(devices=10, duration=1800, pressure=True, seed=2))[1] != events
+    assert len(header.entities) == 30
+    assert all(0 <= event.time < 1800 for event in events)
+    assert [event.time for event in events] == sorted(event.time for event in events)
+
+
+def test_synthetic_workload_patterns():
+    """Test bursts and dropouts."""
+    _, events = synthetic_stream(Workload(devices=20, duration=3600, burst_interval=300, burst_fraction=0.5, dropout_interval=0, pressure=True))
+    times = [event.time for event in events]
+    assert max(times.count(time) for time in set(times)) == 30  # 10 devices with three sensors each in one burst
+
+    _, events = synthetic_stream(Workload(devices=20, duration=3600, burst_interval=0, dropout_interval=600))
+    assert any(event.state == "unavailable" for event in events)
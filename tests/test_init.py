@@ -2,13 +2,16 @@
 
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.thermal_comfort import async_migrate_entry, async_setup_entry, async_unload_entry, async_update_options
-from custom_components.thermal_comfort.const import DOMAIN, PLATFORMS
-from custom_components.thermal_comfort.sensor import LegacySensorType, SensorType
+from custom_components.thermal_comfort import _async_migrate_yaml_unique_ids, async_migrate_entry, async_setup_entry, async_unload_entry, async_update_options
+from custom_components.thermal_comfort.const import COMPUTE_DEVICE, CONF_TEMPERATURE_SENSOR, DATA_YAML_DEVICES, DOMAIN, MIGRATION_LEGACY_UNIQUE_IDS, MIGRATION_STORAGE_KEY, PLATFORMS, SERVICE_SOLVE
+from custom_components.thermal_comfort.sensor import CONF_CUSTOM_ICONS, CONF_ENABLED_SENSORS, CONF_POLL, LegacySensorType, SensorType
 from homeassistant.components.sensor import DOMAIN as PLATFORM_DOMAIN
-from homeassistant.helpers import entity_registry as er
+from homeassistant.const import CONF_NAME, SERVICE_RELOAD, STATE_UNAVAILABLE
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.setup import async_setup_component
 
 from .const import ADVANCED_USER_INPUT
 
@@ -80,3 +83,143 @@ async def test_sensor_migration(hass):
     config_entry.add_to_hass(hass)
     assert await async_migrate_entry(hass, config_entry)
     assert config_entry.version == 2
+
+
+async def test_yaml_sensor_migration(hass, hass_storage):
+    """Test that legacy YAML sensor types are migrated once in a single registry pass."""
+    registry = er.async_get(hass)
+    legacy = registry.async_get_or_create(domain=PLATFORM_DOMAIN, platform=DOMAIN, unique_id=f"uniqueid{LegacySensorType.SIMMER_INDEX}")
+    # Unique ids in the current format stay, although summer_simmer_index ends in simmer_index
+    current = [
+        registry.async_get_or_create(domain=PLATFORM_DOMAIN, platform=DOMAIN, unique_id=f"room{sensor_type}")
+        for sensor_type in (SensorType.SUMMER_SIMMER_INDEX, SensorType.SUMMER_SIMMER_PERCEPTION, SensorType.DEW_POINT_PERCEPTION)
+    ]
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    assert registry.async_get(legacy.entity_id).unique_id == f"uniqueid{SensorType.SUMMER_SIMMER_INDEX}"
+    assert [registry.async_get(entry.entity_id).unique_id for entry in current] == [entry.unique_id for entry in current]
+    assert hass_storage[MIGRATION_STORAGE_KEY]["data"] == {MIGRATION_LEGACY_UNIQUE_IDS: True}
+
+    # Later startups skip the registry scan
+    other = registry.async_get_or_create(domain=PLATFORM_DOMAIN, platform=DOMAIN, unique_id=f"otherid{LegacySensorType.SIMMER_ZONE}")
+    await _async_migrate_yaml_unique_ids(hass)
+    assert registry.async_get(other.entity_id).unique_id == f"otherid{LegacySensorType.SIMMER_ZONE}"
+
+
+async def test_hot_apply_options(hass):
+    """Test that source, polling and icon changes are applied without reloading the entry."""
+    for entity_id, state in (("sensor.test_temperature_sensor", "25.0"), ("sensor.test_humidity_sensor", "50.0"), ("sensor.other_temperature_sensor", "30.0")):
+        hass.states.async_set(entity_id, state)
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={**ADVANCED_USER_INPUT, CONF_ENABLED_SENSORS: [SensorType.DEW_POINT]},
+        entry_id="test",
+        unique_id="uniqueid",
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    compute_device = hass.data[DOMAIN][config_entry.entry_id][COMPUTE_DEVICE]
+    entity_id = er.async_get(hass).async_get_entity_id(PLATFORM_DOMAIN, DOMAIN, f"uniqueid{SensorType.DEW_POINT}")
+    assert hass.states.get(entity_id).attributes["temperature"] == 25.0
+
+    with patch.object(hass.config_entries, "async_reload") as reload:
+        hass.config_entries.async_update_entry(
+            config_entry,
+            options={**ADVANCED_USER_INPUT, CONF_TEMPERATURE_SENSOR: "sensor.other_temperature_sensor", CONF_POLL: True, CONF_CUSTOM_ICONS: True},
+        )
+        await hass.async_block_till_done()
+        reload.assert_not_called()
+
+    assert hass.data[DOMAIN][config_entry.entry_id][COMPUTE_DEVICE] is compute_device
+    state = hass.states.get(entity_id)
+    assert state.attributes["temperature"] == 30.0
+    assert state.attributes["icon"] == "tc:dew-point"
+
+    # Only the new temperature sensor is tracked
+    hass.states.async_set("sensor.test_temperature_sensor", "20.0")
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).attributes["temperature"] == 30.0
+
+    with patch.object(hass.config_entries, "async_reload") as reload:
+        hass.config_entries.async_update_entry(config_entry, options={**config_entry.options, CONF_NAME: "renamed"})
+        await hass.async_block_till_done()
+        reload.assert_called_once_with(config_entry.entry_id)
+
+
+
+async def test_solve_service(hass):
+    """Test that the solve service finds a device of a config entry by its device registry id."""
+    hass.states.async_set("sensor.test_temperature_sensor", "22.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={**ADVANCED_USER_INPUT, CONF_ENABLED_SENSORS: [SensorType.DEW_POINT]},
+        entry_id="test",
+        unique_id="uniqueid",
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    device_id = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "uniqueid")}).id
+
+    response = await hass.services.async_call(DOMAIN, SERVICE_SOLVE, {"device_id": device_id, "target": "dew_point", "value": 12.0, "solve_for": "humidity"}, blocking=True, return_response=True)
+    assert response["devices"][device_id]["temperature"] == 22.0
+    assert response["devices"][device_id]["humidity"] == pytest.approx(53.0, abs=0.1)
+
+
+def _yaml_device(name: str, temperature_sensor: str = "sensor.test_temperature_sensor", **options) -> dict:
+    return {
+        "name": name,
+        "temperature_sensor": temperature_sensor,
+        "humidity_sensor": "sensor.test_humidity_sensor",
+        "sensor_types": [SensorType.DEW_POINT],
+        "unique_id": name,
+        **options,
+    }
+
+
+async def test_incremental_reload(hass):
+    """Test that reload only touches the YAML devices that changed."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.other_temperature_sensor", "30.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    assert await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {PLATFORM_DOMAIN: [_yaml_device("unchanged"), _yaml_device("reconfigured"), _yaml_device("renamed"), _yaml_device("removed")]}}
+    )
+    await hass.async_block_till_done()
+    devices = {unique_id: compute_device for unique_id, (_, compute_device) in hass.data[DATA_YAML_DEVICES].items()}
+    unchanged_state = hass.states.get("sensor.unchanged_dew_point")
+
+    config = {
+        DOMAIN: [
+            {
+                PLATFORM_DOMAIN: [
+                    _yaml_device("unchanged"),
+                    _yaml_device("reconfigured", "sensor.other_temperature_sensor", custom_icons=True),
+                    {**_yaml_device("renamed"), "name": "new name"},
+                    _yaml_device("added"),
+                ]
+            }
+        ]
+    }
+    with patch("custom_components.thermal_comfort.async_integration_yaml_config", return_value=config):
+        await hass.services.async_call(DOMAIN, SERVICE_RELOAD, blocking=True)
+        await hass.async_block_till_done()
+
+    running = {unique_id: compute_device for unique_id, (_, compute_device) in hass.data[DATA_YAML_DEVICES].items()}
+    assert running.keys() == {"unchanged", "reconfigured", "renamed", "added"}
+    assert running["unchanged"] is devices["unchanged"]
+    assert hass.states.get("sensor.unchanged_dew_point") is unchanged_state
+    assert running["reconfigured"] is devices["reconfigured"]
+    assert hass.states.get("sensor.reconfigured_dew_point").attributes["temperature"] == 30.0
+    assert running["renamed"] is not devices["renamed"]
+    assert devices["renamed"].sensors == []
+    # The entity registry keeps the entity_id of the recreated sensor
+    assert hass.states.get("sensor.renamed_dew_point").name == "new name Dew point"
+    # Like other YAML integrations the registry entry stays and the state is restored as unavailable
+    assert hass.states.get("sensor.removed_dew_point").state == STATE_UNAVAILABLE
+    assert devices["removed"].sensors == []
+    assert hass.states.get("sensor.added_dew_point") is not None
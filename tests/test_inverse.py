@@ -0,0 +1,46 @@
+"""Test the inverse solvers."""
+
+import math
+
+import pytest
+
+from custom_components.thermal_comfort.inverse import (
+    humidex_dew_point,
+    humidex_vapor_pressure,
+    solve_bracketed,
+)
+from custom_components.thermal_comfort.saturation import (
+    DEW_POINT,
+    DEW_POINT_VAPOR_PRESSURE,
+    goff_gratch_dew_point,
+    goff_gratch_dew_point_vapor_pressure,
+)
+
+
+def test_solve_bracketed():
+    """Test that the root is found within the tolerance and that a bracket without sign change has none."""
+    assert solve_bracketed(lambda x: x**3 - 2, 0, 10) == pytest.approx(2 ** (1 / 3), abs=1e-4)
+    assert solve_bracketed(lambda x: math.exp(x) - 50, -100, 100) == pytest.approx(math.log(50), abs=1e-4)
+    assert solve_bracketed(lambda x: x - 5, 5, 10) == 5
+    assert solve_bracketed(lambda x: x + 1, 0, 10) is None
+
+
+@pytest.mark.parametrize("model", list(DEW_POINT_VAPOR_PRESSURE))
+def test_dew_point_vapor_pressure(model):
+    """Test that the vapour pressure of a dew point inverts the dew point."""
+    for dew_point in range(-40, 41, 5):
+        assert DEW_POINT[model](DEW_POINT_VAPOR_PRESSURE[model](dew_point)) == pytest.approx(dew_point, abs=1e-9)
+
+
+def test_goff_gratch_dew_point_vapor_pressure():
+    """Test that the vapour pressure in hPa inverts the dew point of the formula."""
+    for dew_point in range(-40, 41, 5):
+        assert goff_gratch_dew_point(goff_gratch_dew_point_vapor_pressure(dew_point)) == pytest.approx(dew_point, abs=1e-9)
+
+
+def test_humidex():
+    """Test the vapour pressure and dew point of a humidex."""
+    assert humidex_vapor_pressure(25, 25 + 0.5555 * (20 - 10)) == pytest.approx(20)
+    # The humidex formula gives 6.11 hPa at 0 °C
+    assert humidex_dew_point(6.11) == pytest.approx(0.01, abs=1e-9)
+    assert humidex_dew_point(0) is None
@@ -0,0 +1,146 @@
+"""Test the Thermal Comfort lookup tables."""
+
+import math
+import random
+
+import pytest
+
+from custom_components.thermal_comfort.const import (
+    CONF_LOOKUP_TABLES,
+    DOMAIN,
+    HUMIDITY_MAX,
+    TEMPERATURE_MAX,
+    TEMPERATURE_MIN,
+)
+from custom_components.thermal_comfort.lookup import (
+    EXACT_KERNELS,
+    TABLE_STEP,
+    LookupTables,
+    interpolator,
+    load_lookup_tables,
+)
+from custom_components.thermal_comfort.sensor import SensorType
+from homeassistant.components.command_line.const import DOMAIN as COMMAND_LINE_DOMAIN
+from homeassistant.components.sensor import DOMAIN as PLATFORM_DOMAIN
+from homeassistant.setup import async_setup_component
+
+from .test_sensor import HUMIDITY_TEST_SENSOR, TEMPERATURE_TEST_SENSOR, get_sensor
+
+MAX_DEW_POINT_ERROR = 1e-5
+MAX_MOIST_AIR_ENTHALPY_ERROR = 2e-3
+
+
+def _dew_point(kernels, temperature: float, pressure_hpa: float, humidity: float) -> float:
+    VP = kernels.dew_point_vapor_pressure(temperature, pressure_hpa, humidity)
+    Td = math.log(VP / 0.61078)
+    return (241.88 * Td) / (17.558 - Td)
+
+
+def _moist_air_enthalpy(kernels, temperature: float, pressure_pa: float, humidity: float) -> float:
+    p_w = humidity / 100 * kernels.saturation_pressure(temperature)
+    W = 0.621945 * p_w / (pressure_pa - p_w)
+    return 1.006 * temperature + W * (2501 + 1.86 * temperature)
+
+
+def _inputs(count: int = 50000):
+    """Yield random temperature, humidity and pressure (hPa) in the valid domain."""
+    rng = random.Random(42)
+    for _ in range(count):
+        yield rng.uniform(TEMPERATURE_MIN, TEMPERATURE_MAX), rng.uniform(0.01, HUMIDITY_MAX), rng.uniform(500, 1100)
+
+
+@pytest.fixture(scope="module")
+def tables() -> LookupTables:
+    """Return in-memory lookup tables."""
+    return load_lookup_tables()
+
+
+def test_interpolator():
+    """Test linear interpolation and extrapolation."""
+    interpolate = interpolator(0, 1, [0, 2, 6])
+    assert interpolate(0) == 0
+    assert interpolate(0.5) == 1
+    assert interpolate(1.5) == 4
+    assert interpolate(2) == 6
+    assert interpolate(-1) == -2
+    assert interpolate(3) == 10
+
+
+def test_dew_point_max_error(tables):
+    """Test the documented maximum error of the tabulated dew point."""
+    error = max(abs(_dew_point(tables, t, p, h) - _dew_point(EXACT_KERNELS, t, p, h)) for t, h, p in _inputs())
+    assert error < MAX_DEW_POINT_ERROR
+
+
+def test_moist_air_enthalpy_max_error(tables):
+    """Test the documented maximum error of the tabulated moist air enthalpy."""
+    error = max(abs(_moist_air_enthalpy(tables, t, p * 100, h) - _moist_air_enthalpy(EXACT_KERNELS, t, p * 100, h)) for t, h, p in _inputs())
+    assert error < MAX_MOIST_AIR_ENTHALPY_ERROR
+
+
+def test_tables_are_exact_on_grid(tables):
+    """Test that grid points reproduce the exact values."""
+    for i in range(0, round((TEMPERATURE_MAX - TEMPERATURE_MIN) / TABLE_STEP), 997):
+        t = TEMPERATURE_MIN + i * TABLE_STEP
+        assert tables.saturation_pressure(t) == pytest.approx(EXACT_KERNELS.saturation_pressure(t), rel=1e-12)
+
+
+def test_memory_mapped_file(tmp_path, monkeypatch):
+    """Test that the tables are written once and memory-mapped afterwards."""
+    path = str(tmp_path / "tables.bin")
+    tables = load_lookup_tables(path)
+    assert tables.is_memory_mapped
+
+    def fail():
+        raise AssertionError("tables should be read from file")
+
+    monkeypatch.setattr("custom_components.thermal_comfort.lookup.build_table_values", fail)
+    cached = load_lookup_tables(path)
+    assert cached.is_memory_mapped
+    assert cached.dew_point_vapor_pressure(21.3, 1013.25, 40) == tables.dew_point_vapor_pressure(21.3, 1013.25, 40)
+
+
+def test_stale_file_is_rebuilt(tmp_path):
+    """Test that a file with a wrong header is replaced."""
+    path = tmp_path / "tables.bin"
+    path.write_bytes(b"garbage")
+    assert load_lookup_tables(str(path)).is_memory_mapped
+    assert path.stat().st_size > 7
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(COMMAND_LINE_DOMAIN, 2), (DOMAIN, 1)],
+            {
+                COMMAND_LINE_DOMAIN: [
+                    TEMPERATURE_TEST_SENSOR,
+                    HUMIDITY_TEST_SENSOR,
+                ],
+                DOMAIN: {
+                    CONF_LOOKUP_TABLES: True,
+                    PLATFORM_DOMAIN: {
+                        "name": "test_thermal_comfort",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "unique_id": "unique_thermal_comfort_id",
+                    },
+                },
+            },
+        ),
+    ],
+)
+async def test_lookup_tables_option(hass, tmp_path, domains, config):
+    """Test that devices with lookup tables enabled compute close to the exact values."""
+    hass.config.config_dir = str(tmp_path)
+    for domain, _ in domains:
+        assert await async_setup_component(hass, domain, config)
+        await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.test_temperature_sensor", "15.0")
+    await hass.async_block_till_done()
+    assert float(get_sensor(hass, SensorType.DEW_POINT).state) == pytest.approx(4.67503901377299, abs=MAX_DEW_POINT_ERROR)
+    assert (tmp_path / ".storage" / "thermal_comfort_tables.bin").exists()
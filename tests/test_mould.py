@@ -0,0 +1,67 @@
+"""Test the mould growth index of Thermal Comfort devices."""
+
+import math
+
+import pytest
+
+from custom_components.thermal_comfort.mould import MouldGrowth, critical_humidity
+
+
+def test_critical_humidity():
+    """Test the critical humidity of the VTT model."""
+    assert critical_humidity(0) == 100.0
+    assert critical_humidity(10) == pytest.approx(82.03)
+    assert critical_humidity(20) == pytest.approx(80.04)
+    assert critical_humidity(25) == 80.0
+
+
+def test_growth():
+    """Test that the index reaches 1 after the growth start time and stays below its maximum."""
+    hours_to_index_1 = 7 * 24 * math.exp(-0.68 * math.log(20) - 13.9 * math.log(97) + 66.02)
+    growth = MouldGrowth()
+    growth.advance(20, 97, hours_to_index_1)
+    assert growth.index == pytest.approx(1, rel=1e-3)
+    assert growth.unfavourable_hours == 0
+
+    growth.advance(20, 97, 24 * 365 * 10)
+    assert 5.4 < growth.index < 1 + 7 * 0.85 - 2 * 0.85**2
+
+    # Below the critical humidity nothing grows
+    growth = MouldGrowth()
+    growth.advance(20, 79, 24 * 365)
+    assert growth.index == 0
+
+
+def test_decline():
+    """Test the decline in the first 6 hours and after 24 hours of unfavourable conditions."""
+    growth = MouldGrowth(index=1.0)
+    growth.advance(20, 50, 6)
+    assert growth.index == pytest.approx(1 - 6 * 0.00133)
+    growth.advance(20, 50, 18)
+    assert growth.index == pytest.approx(1 - 6 * 0.00133)
+    growth.advance(20, 50, 24)
+    assert growth.index == pytest.approx(1 - 6 * 0.00133 - 24 * 0.000667)
+    assert growth.unfavourable_hours == 48
+
+    # Favourable conditions start a new unfavourable period
+    growth.advance(20, 97, 1)
+    assert growth.unfavourable_hours == 0
+    growth.advance(20, 50, 1000)
+    assert growth.index >= 0
+
+
+def test_update():
+    """Test that updates hold their conditions until the next one and skip missing values."""
+    streamed = MouldGrowth()
+    streamed.update(0, 20, 95)
+    for second in range(600, 7 * 86400, 600):
+        streamed.update(second, 20, 95)
+    direct = MouldGrowth()
+    direct.advance(20, 95, 7 * 24 - 1 / 6)
+    assert streamed.index == pytest.approx(direct.index)
+
+    index = streamed.index
+    streamed.update(7 * 86400, None, 95)
+    streamed.update(8 * 86400, 20, 95)
+    assert streamed.index == pytest.approx(index + direct.index / (7 * 24 - 1 / 6) / 6, rel=1e-3)
+    assert MouldGrowth(**streamed.as_dict()).index == streamed.index
@@ -0,0 +1,66 @@
+"""Test the predicted mean vote and percentage of dissatisfied."""
+
+import math
+
+import pytest
+
+from custom_components.thermal_comfort.pmv import (
+    Occupant,
+    predicted_mean_vote,
+    predicted_mean_votes,
+    predicted_percentage_dissatisfied,
+)
+
+# Rows of ISO 7730 Table D.1: air temperature, radiant temperature, air speed, humidity, met, clo, PMV, PPD
+ISO_7730_TABLE = [
+    (22.0, 22.0, 0.1, 60, 1.2, 0.5, -0.75, 17),
+    (27.0, 27.0, 0.1, 60, 1.2, 0.5, 0.77, 17),
+    (27.0, 27.0, 0.3, 60, 1.2, 0.5, 0.44, 9),
+    (23.5, 25.5, 0.1, 60, 1.2, 0.5, -0.01, 5),
+    (23.5, 25.5, 0.3, 60, 1.2, 0.5, -0.55, 11),
+    (19.0, 19.0, 0.1, 40, 1.2, 1.0, -0.60, 13),
+    (23.0, 21.0, 0.1, 40, 1.2, 1.0, 0.05, 5),
+    (22.0, 22.0, 0.1, 60, 1.6, 0.5, 0.05, 5),
+    (27.0, 27.0, 0.1, 60, 1.6, 0.5, 1.17, 34),
+    (27.0, 27.0, 0.3, 60, 1.6, 0.5, 0.95, 24),
+]
+
+
+@pytest.mark.parametrize(("temperature", "radiant_temperature", "air_speed", "humidity", "metabolic_rate", "clothing_insulation", "pmv", "ppd"), ISO_7730_TABLE)
+def test_iso_7730(temperature, radiant_temperature, air_speed, humidity, metabolic_rate, clothing_insulation, pmv, ppd):
+    """Test against the reference values of ISO 7730."""
+    vote = predicted_mean_vote(temperature, radiant_temperature, humidity, air_speed, metabolic_rate, clothing_insulation)
+    assert vote == pytest.approx(pmv, abs=0.015)
+    assert predicted_percentage_dissatisfied(vote) == pytest.approx(ppd, abs=0.6)
+
+
+def test_percentage_dissatisfied():
+    """Test that the percentage of dissatisfied is 5 % at a neutral vote and symmetric."""
+    assert predicted_percentage_dissatisfied(0) == pytest.approx(5)
+    assert predicted_percentage_dissatisfied(-1.5) == predicted_percentage_dissatisfied(1.5)
+    assert predicted_percentage_dissatisfied(3) > 99
+
+
+def test_warm_start():
+    """Test that starting from the previous clothing temperature gives the same vote."""
+    occupant = Occupant(0.1, 1.2, 0.7)
+    vote, clothing_temperature = occupant.solve(22.0, 22.0, 50.0)
+    assert occupant.solve(22.0, 22.0, 50.0, clothing_temperature)[0] == pytest.approx(vote, abs=1e-3)
+    warm = occupant.solve(23.0, 23.0, 55.0, clothing_temperature)[0]
+    assert warm == pytest.approx(occupant.solve(23.0, 23.0, 55.0)[0], abs=1e-3)
+
+
+def test_predicted_mean_votes():
+    """Test that the series form matches single solves and keeps missing values."""
+    temperatures = [20.0, 21.0, math.nan, 23.0, 24.0]
+    humidities = [40.0, 45.0, 50.0, math.nan, 60.0]
+    votes = predicted_mean_votes(temperatures, humidities, clothing_insulation=1.0)
+    assert len(votes) == 5
+    assert math.isnan(votes[2])
+    assert math.isnan(votes[3])
+    for temperature, humidity, vote in zip(temperatures, humidities, votes):
+        if not math.isnan(vote):
+            assert vote == pytest.approx(predicted_mean_vote(temperature, temperature, humidity, clothing_insulation=1.0), abs=1e-3)
+
+    radiant = predicted_mean_votes([22.0], [50.0], [26.0])
+    assert radiant[0] == pytest.approx(predicted_mean_vote(22.0, 26.0, 50.0), abs=1e-3)
@@ -0,0 +1,86 @@
+"""Test the wet-bulb temperature solver."""
+
+import pytest
+
+from custom_components.thermal_comfort.psychrometrics import (
+    WET_BULB_MAX_ITERATIONS,
+    humidity_ratio,
+    psychrometric_humidity_ratio,
+    stull_wet_bulb,
+    wet_bulb_temperature,
+)
+from custom_components.thermal_comfort.saturation import (
+    magnus_dew_point,
+    magnus_saturation_vapor_pressure,
+)
+
+STANDARD_PRESSURE = 101325
+
+
+def saturation_pressure(temperature: float) -> float:
+    """Saturation vapour pressure in Pa."""
+    return 100 * magnus_saturation_vapor_pressure(temperature)
+
+
+def solve(temperature: float, humidity: float, pressure: float = STANDARD_PRESSURE, saturation=saturation_pressure) -> float:
+    """Solve the wet-bulb temperature of air."""
+    vapor_pressure = humidity / 100 * saturation_pressure(temperature)
+    return wet_bulb_temperature(
+        temperature,
+        humidity_ratio(vapor_pressure, pressure),
+        pressure,
+        saturation,
+        magnus_dew_point(vapor_pressure / 100),
+        stull_wet_bulb(temperature, humidity),
+    )
+
+
+def bisect(temperature: float, humidity: float, pressure: float = STANDARD_PRESSURE) -> float:
+    """Solve the wet-bulb temperature by bisection."""
+    target = humidity_ratio(humidity / 100 * saturation_pressure(temperature), pressure)
+    lower, upper = -60.0, temperature
+    for _ in range(60):
+        middle = (lower + upper) / 2
+        if psychrometric_humidity_ratio(temperature, middle, pressure, saturation_pressure) > target:
+            upper = middle
+        else:
+            lower = middle
+    return (lower + upper) / 2
+
+
+@pytest.mark.parametrize(("temperature", "humidity"), [(20, 50), (35, 20), (30, 90), (5, 70), (45, 10), (-10, 60), (25, 1)])
+def test_wet_bulb_temperature(temperature, humidity):
+    """Test against bisection of the psychrometric equation."""
+    assert solve(temperature, humidity) == pytest.approx(bisect(temperature, humidity), abs=1e-3)
+
+
+def test_stull():
+    """Test the fit of Stull against his example."""
+    assert stull_wet_bulb(20, 50) == pytest.approx(13.7, abs=0.05)
+
+
+def test_saturated():
+    """Test that saturated air is at its wet-bulb temperature."""
+    assert solve(25, 100) == pytest.approx(25, abs=1e-3)
+
+
+def test_pressure():
+    """Test that the wet-bulb temperature is lower at altitude."""
+    assert solve(30, 40, 80000) == pytest.approx(bisect(30, 40, 80000), abs=1e-3)
+    assert solve(30, 40, 80000) < solve(30, 40)
+
+
+def test_iterations():
+    """Test that the number of saturation pressures is bounded."""
+    calls = 0
+
+    def counting(temperature: float) -> float:
+        nonlocal calls
+        calls += 1
+        return saturation_pressure(temperature)
+
+    for temperature in range(-20, 50, 5):
+        for humidity in range(5, 101, 5):
+            calls = 0
+            solve(temperature, humidity, saturation=counting)
+            assert calls <= WET_BULB_MAX_ITERATIONS + 1
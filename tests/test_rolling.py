@@ -0,0 +1,94 @@
+"""Test the rolling statistics of Thermal Comfort."""
+
+import random
+
+import pytest
+
+from custom_components.thermal_comfort.rolling import (
+    RollingStatistic,
+    RollingStatistics,
+    RollingTrend,
+)
+
+
+def _expected(samples: list[tuple[float, float]], window: float, now: float) -> tuple[float, float, float]:
+    """Return min, max and time-weighted mean by integrating the held values over the window."""
+    start = now - window
+    held = [(timestamp, value) for timestamp, value in samples if timestamp <= now]
+    before = [sample for sample in held if sample[0] <= start]
+    inside = ([before[-1]] if before else []) + [sample for sample in held if sample[0] > start]
+    values = [value for _, value in inside]
+    begin = max(start, inside[0][0])
+    integral = 0.0
+    for (timestamp, value), (next_timestamp, _) in zip(inside, [*inside[1:], (now, None)]):
+        integral += value * (next_timestamp - max(timestamp, begin))
+    return min(values), max(values), integral / (now - begin) if now > begin else values[-1]
+
+
+def test_window():
+    """Test a hand computed window."""
+    statistics = RollingStatistics(10)
+    assert statistics.get(RollingStatistic.MEAN, 0) is None
+    assert statistics.minimum(0) is None
+
+    statistics.add(0, 10)
+    statistics.add(5, 20)
+    assert statistics.get(RollingStatistic.MIN, 10) == 10
+    assert statistics.get(RollingStatistic.MAX, 10) == 20
+    assert statistics.get(RollingStatistic.MEAN, 10) == 15
+
+    # 10 still holds at the start of the window at 2
+    assert statistics.mean(12) == pytest.approx((10 * 3 + 20 * 7) / 10)
+    # Only 20 holds within the window
+    statistics.add(16, 30)
+    assert statistics.minimum(16) == 20
+    assert len(statistics) == 2
+
+
+def test_random_samples():
+    """Test against brute force integration of random samples."""
+    rng = random.Random(0)
+    statistics = RollingStatistics(3600)
+    samples = []
+    now = 0.0
+    for _ in range(2000):
+        # Reads happen between the samples like those of the sensors, time never goes back
+        timestamp = now + rng.expovariate(1 / 30)
+        value = rng.uniform(-10, 30)
+        statistics.add(timestamp, value)
+        samples.append((timestamp, value))
+        now = timestamp + rng.uniform(0, 60)
+        minimum, maximum, mean = _expected(samples, 3600, now)
+        assert statistics.minimum(now) == minimum
+        assert statistics.maximum(now) == maximum
+        assert statistics.mean(now) == pytest.approx(mean, abs=1e-9)
+    assert len(statistics) < 200
+
+
+def test_trend():
+    """Test the least squares slope against a direct regression."""
+    trend = RollingTrend(900)
+    assert trend.slope(0) is None
+    trend.add(100, 5.0)
+    assert trend.slope(100) is None
+    trend.add(160, 6.0)
+    assert trend.slope(160) == pytest.approx(1 / 60)
+
+    rng = random.Random(0)
+    samples = [(100, 5.0), (160, 6.0)]
+    now = 200.0
+    for _ in range(3000):
+        timestamp = now + rng.expovariate(1 / 20)
+        value = 0.001 * timestamp + rng.gauss(0, 0.1)
+        trend.add(timestamp, value)
+        samples.append((timestamp, value))
+        now = timestamp + rng.uniform(0, 30)
+        window = [(t, v) for t, v in samples if t >= now - 900]
+        if len(window) < 2:
+            assert trend.slope(now) is None
+            continue
+        mean_t = sum(t for t, _ in window) / len(window)
+        mean_v = sum(v for _, v in window) / len(window)
+        expected = sum((t - mean_t) * (v - mean_v) for t, v in window) / sum((t - mean_t) ** 2 for t, _ in window)
+        assert trend.slope(now) == pytest.approx(expected, rel=1e-6)
+    assert len(trend) < 100
@@ -0,0 +1,82 @@
+"""Test the Thermal Comfort saturation vapour pressure models."""
+
+import pytest
+
+from custom_components.thermal_comfort.const import CONF_SATURATION_MODEL, DOMAIN
+from custom_components.thermal_comfort.lookup import load_lookup_tables
+from custom_components.thermal_comfort.saturation import (
+    DEW_POINT,
+    SATURATION_VAPOR_PRESSURE,
+    SaturationModel,
+)
+from custom_components.thermal_comfort.sensor import SensorType
+from homeassistant.components.command_line.const import DOMAIN as COMMAND_LINE_DOMAIN
+from homeassistant.components.sensor import DOMAIN as PLATFORM_DOMAIN
+
+from .test_sensor import HUMIDITY_TEST_SENSOR, TEMPERATURE_TEST_SENSOR, get_sensor
+
+TEMPERATURES = [t / 10 for t in range(-400, 501, 5)]
+
+
+@pytest.mark.parametrize("model", [SaturationModel.MAGNUS, SaturationModel.BUCK])
+def test_dew_point_inverts_saturation_vapor_pressure(model):
+    """Test that the dew point of a saturated air mass is its temperature."""
+    for t in TEMPERATURES:
+        assert DEW_POINT[model](SATURATION_VAPOR_PRESSURE[model](t)) == pytest.approx(t, abs=1e-9)
+
+
+@pytest.mark.parametrize("model", [SaturationModel.MAGNUS, SaturationModel.BUCK])
+def test_models_agree(model):
+    """Test that the models stay close to the Goff-Gratch series between -40 and 50 °C."""
+    for t in TEMPERATURES:
+        assert SATURATION_VAPOR_PRESSURE[model](t) == pytest.approx(SATURATION_VAPOR_PRESSURE[SaturationModel.GOFF_GRATCH](t), rel=5e-3)
+
+
+def test_goff_gratch_tables():
+    """Test that the dew point table reproduces the Goff-Gratch series."""
+    tables = load_lookup_tables()
+    for t in TEMPERATURES:
+        assert tables.goff_gratch_saturation_vapor_pressure(t) == pytest.approx(SATURATION_VAPOR_PRESSURE[SaturationModel.GOFF_GRATCH](t), rel=1e-6)
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(COMMAND_LINE_DOMAIN, 2), (DOMAIN, 1)],
+            {
+                COMMAND_LINE_DOMAIN: [
+                    TEMPERATURE_TEST_SENSOR,
+                    HUMIDITY_TEST_SENSOR,
+                ],
+                DOMAIN: {
+                    CONF_SATURATION_MODEL: SaturationModel.MAGNUS,
+                    PLATFORM_DOMAIN: {
+                        "name": "test_thermal_comfort",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "unique_id": "unique_thermal_comfort_id",
+                    },
+                },
+            },
+        ),
+    ],
+)
+async def test_shared_saturation_model(hass, monkeypatch, domains, config, start_ha):
+    """Test that all sensors share one saturation vapour pressure evaluation per update."""
+    calls = []
+    magnus = SATURATION_VAPOR_PRESSURE[SaturationModel.MAGNUS]
+
+    def counting_magnus(temperature):
+        calls.append(temperature)
+        return magnus(temperature)
+
+    monkeypatch.setitem(SATURATION_VAPOR_PRESSURE, SaturationModel.MAGNUS, counting_magnus)
+    hass.states.async_set("sensor.test_temperature_sensor", "20.0")
+    await hass.async_block_till_done()
+
+    assert calls == [20.0]
+    e = magnus(20.0) / 2
+    assert float(get_sensor(hass, SensorType.DEW_POINT).state) == pytest.approx(DEW_POINT[SaturationModel.MAGNUS](e))
+    assert float(get_sensor(hass, SensorType.HUMIDEX).state) == pytest.approx(20.0 + 0.5555 * (e - 10))
+    assert float(get_sensor(hass, SensorType.ABSOLUTE_HUMIDITY).state) == pytest.approx(216.74 * e / 293.15)
@@ -1,16 +1,51 @@
 """Test the Thermal Comfort sensor platform."""
 
+from asyncio import Lock
 from collections.abc import Callable
 from datetime import timedelta
 import logging
+import time
+from unittest.mock import patch
 
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
-from custom_components.thermal_comfort.const import DOMAIN
+from custom_components.thermal_comfort.adaptive import (
+    RUNNING_MEAN_SAVE_DELAY,
+    RUNNING_MEAN_STORAGE_KEY,
+)
+from custom_components.thermal_comfort.const import (
+    CONF_PRESSURE_SENSOR,
+    CONF_ROLLING_STATISTICS,
+    CONF_TRENDS,
+    DOMAIN,
+    SERVICE_SOLVE,
+)
+from custom_components.thermal_comfort.metrics import (
+    DeviceMetrics,
+    UpdateStage,
+    UpdateTimer,
+)
+from custom_components.thermal_comfort.mould import (
+    MOULD_GROWTH_SAVE_DELAY,
+    MOULD_GROWTH_STORAGE_KEY,
+)
+from custom_components.thermal_comfort.pmv import (
+    predicted_mean_vote,
+    predicted_percentage_dissatisfied,
+)
+from custom_components.thermal_comfort.rolling import EXPIRY_INTERVAL, ROLLING_WINDOWS
 from custom_components.thermal_comfort.sensor import (
+    ATTR_ACCEPTABILITY,
+    ATTR_COMFORT_ZONES,
+    ATTR_CRITICAL_HUMIDITY,
     ATTR_FROST_POINT,
     ATTR_HUMIDITY,
+    ATTR_OPERATIVE_TEMPERATURE,
+    ATTR_PREVAILING_MEAN_OUTDOOR_TEMPERATURE,
     ATTR_RELATIVE_STRAIN_INDEX,
     ATTR_SUMMER_SCHARLAU_INDEX,
     ATTR_THOMS_DISCOMFORT_INDEX,
@@ -23,6 +58,7 @@ from custom_components.thermal_comfort.sensor import (
     DEFAULT_SENSOR_TYPES,
     SENSOR_TYPES,
     STATE_UNAVAILABLE,
+    ComputeState,
     DewPointPerception,
     FrostRisk,
     HumidexPerception,
@@ -31,13 +67,19 @@ from custom_components.thermal_comfort.sensor import (
     SensorType,
     SummerSimmerPerception,
     ThomsDiscomfortPerception,
+    compute_once_lock,
     id_generator,
 )
+from custom_components.thermal_comfort.utci import universal_thermal_climate_index
 from homeassistant.components.command_line.const import DOMAIN as COMMAND_LINE_DOMAIN
 from homeassistant.components.sensor import DOMAIN as PLATFORM_DOMAIN, SensorDeviceClass
-from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.const import ATTR_TEMPERATURE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, State
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import DATA_INSTANCES
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from .const import ADVANCED_USER_INPUT
 
@@ -1087,3 +1129,701 @@ async def test_custom_icons(hass):
     sensor_state = get_sensor(hass, SensorType.DEW_POINT_PERCEPTION)
     assert sensor_state is not None, f"Sensor sensor.test_thermal_comfort_{SensorType.DEW_POINT_PERCEPTION} was not created"
     assert sensor_state.attributes["icon"] == "tc:thermal-perception"
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(DOMAIN, 1)],
+            {
+                DOMAIN: {
+                    "slow_update_threshold": 0.000001,
+                    PLATFORM_DOMAIN: {
+                        "name": "test_thermal_comfort",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "unique_id": "unique_thermal_comfort_id",
+                    },
+                },
+            },
+        ),
+    ],
+)
+async def test_slow_update_warning(hass: HomeAssistant, start_ha: Callable, caplog) -> None:
+    """Test that slow updates are reported once per interval with their stages."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0", {"unit_of_measurement": "°C"})
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    await hass.async_block_till_done()
+
+    # The first update during setup is reported, the later ones are rate limited
+    records = caplog.get_records("setup") + caplog.records
+    warnings = [record.getMessage() for record in records if "held the event loop" in record.getMessage()]
+    assert len(warnings) == 1
+    assert warnings[0].startswith("Update of test_thermal_comfort held the event loop")
+    for stage in ("parse", "unit_conversion", "formula", "template", "write"):
+        assert f"{stage}: " in warnings[0]
+
+
+
+async def test_compute_time_is_exclusive() -> None:
+    """Test that a compute does not count the time of the computes it awaits."""
+    clock = [0.0]
+
+    class Device:
+        def __init__(self) -> None:
+            self._temperature = 20.0
+            self._humidity = 50.0
+            self._compute_states = {key: ComputeState(needs_update=True, lock=Lock()) for key in (SensorType.DEW_POINT, SensorType.FROST_RISK)}
+            self.metrics = DeviceMetrics()
+            self.timer = UpdateTimer("test", 1)
+
+        @compute_once_lock(SensorType.DEW_POINT)
+        async def dew_point(self) -> float:
+            clock[0] += 3
+            return 10.0
+
+        @compute_once_lock(SensorType.FROST_RISK)
+        async def frost_risk(self) -> int:
+            clock[0] += 1
+            await self.dew_point()
+            await self.dew_point()  # cached
+            clock[0] += 1
+            return 0
+
+    device = Device()
+    with patch("custom_components.thermal_comfort.sensor.time.perf_counter", side_effect=lambda: clock[0]):
+        assert await device.frost_risk() == 0
+    assert device.metrics.compute_time[SensorType.FROST_RISK].sum == 2
+    assert device.metrics.compute_time[SensorType.DEW_POINT].sum == 3
+    assert device.timer.stages[UpdateStage.FORMULA] == 5
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(DOMAIN, 1)],
+            {
+                DOMAIN: {
+                    "bundle": True,
+                    PLATFORM_DOMAIN: {
+                        "name": "test_thermal_comfort",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "sensor_types": [SensorType.ABSOLUTE_HUMIDITY, SensorType.DEW_POINT, SensorType.DEW_POINT_PERCEPTION],
+                        "unique_id": "unique_thermal_comfort_id",
+                    },
+                },
+            },
+        ),
+    ],
+)
+async def test_bundle(hass: HomeAssistant, start_ha: Callable) -> None:
+    """Test that bundle mode creates one sensor with the other sensor types as attributes."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0", {"unit_of_measurement": "°C"})
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    await hass.async_block_till_done()
+
+    assert len(hass.states.async_all(PLATFORM_DOMAIN)) == 3  # the bundle sensor and the two source sensors
+    state = get_sensor(hass, SensorType.DEW_POINT)
+    assert round(float(state.state), 2) == 13.88
+    assert state.attributes[SensorType.ABSOLUTE_HUMIDITY] == 11.51
+    assert state.attributes[SensorType.DEW_POINT_PERCEPTION] == DewPointPerception.COMFORTABLE
+    assert state.attributes[ATTR_TEMPERATURE] == 25.0
+    assert state.attributes[ATTR_HUMIDITY] == 50.0
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(DOMAIN, 1)],
+            {
+                DOMAIN: {
+                    "bundle": True,
+                    PLATFORM_DOMAIN: {
+                        "name": "test_thermal_comfort",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "sensor_types": [],
+                        "unique_id": "unique_thermal_comfort_id",
+                    },
+                },
+            },
+        ),
+    ],
+)
+async def test_bundle_without_sensor_types(hass: HomeAssistant, start_ha: Callable, caplog) -> None:
+    """Test that bundle mode without sensor types sets up no sensor instead of failing."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    await hass.async_block_till_done()
+
+    assert [state.entity_id for state in hass.states.async_all(PLATFORM_DOMAIN)] == ["sensor.test_temperature_sensor", "sensor.test_humidity_sensor"]
+    assert not [record for record in caplog.get_records("setup") + caplog.records if record.levelno >= logging.ERROR]
+
+
+async def test_bundle_migration(hass: HomeAssistant) -> None:
+    """Test that switching a config entry to bundle mode keeps the primary entity and removes the others."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    entry = MockConfigEntry(domain=DOMAIN, version=2, data={**ADVANCED_USER_INPUT, "bundle": True}, entry_id="test", unique_id="uniqueid")
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    for sensor_type in (SensorType.DEW_POINT, SensorType.HEAT_INDEX):
+        registry.async_get_or_create(PLATFORM_DOMAIN, DOMAIN, id_generator(entry.unique_id, sensor_type), config_entry=entry)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert registry.async_get_entity_id(PLATFORM_DOMAIN, DOMAIN, id_generator(entry.unique_id, SensorType.HEAT_INDEX)) is None
+    entity_id = registry.async_get_entity_id(PLATFORM_DOMAIN, DOMAIN, id_generator(entry.unique_id, SensorType.DEW_POINT))
+    state = hass.states.get(entity_id)
+    assert len(state.attributes) > len(SensorType)
+    assert state.attributes[SensorType.HEAT_INDEX] == 24.86
+
+
+async def test_unrecorded_attributes(hass: HomeAssistant) -> None:
+    """Test that copies of input states are not recorded and other attributes are."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={**ADVANCED_USER_INPUT, CONF_ENABLED_SENSORS: [SensorType.DEW_POINT_PERCEPTION, SensorType.RELATIVE_STRAIN_PERCEPTION]},
+        entry_id="test",
+        unique_id="uniqueid",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    def unrecorded_attributes(sensor_type: SensorType) -> frozenset[str]:
+        # What the recorder reads from the entity to strip the attributes
+        return hass.data[DATA_INSTANCES][PLATFORM_DOMAIN].get_entity(get_sensor(hass, sensor_type).entity_id)._state_info["unrecorded_attributes"]
+
+    assert ATTR_TEMPERATURE in get_sensor(hass, SensorType.DEW_POINT_PERCEPTION).attributes
+    assert {ATTR_TEMPERATURE, ATTR_HUMIDITY} <= unrecorded_attributes(SensorType.DEW_POINT_PERCEPTION)
+    # The dew point sensor is not set up, its value is only recorded as the attribute
+    assert "dew_point" in get_sensor(hass, SensorType.DEW_POINT_PERCEPTION).attributes
+    assert "dew_point" not in unrecorded_attributes(SensorType.DEW_POINT_PERCEPTION)
+    assert ATTR_RELATIVE_STRAIN_INDEX in get_sensor(hass, SensorType.RELATIVE_STRAIN_PERCEPTION).attributes
+    assert ATTR_RELATIVE_STRAIN_INDEX not in unrecorded_attributes(SensorType.RELATIVE_STRAIN_PERCEPTION)
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(DOMAIN, 1)],
+            {
+                DOMAIN: {
+                    "input_attributes": False,
+                    PLATFORM_DOMAIN: {
+                        "name": "test_thermal_comfort",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "sensor_types": [SensorType.DEW_POINT],
+                        "unique_id": "unique_thermal_comfort_id",
+                    },
+                },
+            },
+        ),
+    ],
+)
+async def test_input_attributes_disabled(hass: HomeAssistant, start_ha: Callable) -> None:
+    """Test that the input states can be left out of the attributes."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    await hass.async_block_till_done()
+    state = get_sensor(hass, SensorType.DEW_POINT)
+    assert state.state != "unknown"
+    assert ATTR_TEMPERATURE not in state.attributes
+    assert ATTR_HUMIDITY not in state.attributes
+
+
+async def test_rolling_statistics(hass: HomeAssistant) -> None:
+    """Test the rolling minimum, maximum and mean sensors."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={**ADVANCED_USER_INPUT, CONF_ENABLED_SENSORS: [SensorType.DEW_POINT], CONF_ROLLING_STATISTICS: [SensorType.DEW_POINT]},
+        entry_id="test",
+        unique_id="uniqueid",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.test_temperature_sensor", "20.0")
+    await hass.async_block_till_done()
+
+    registry = er.async_get(hass)
+
+    def rolling_state(statistic: str, window: str):
+        entity_id = registry.async_get_entity_id(PLATFORM_DOMAIN, DOMAIN, id_generator(entry.unique_id, f"{SensorType.DEW_POINT}_{statistic}_{window}"))
+        return hass.states.get(entity_id)
+
+    assert len([entity for entity in registry.entities.values() if "_24h" in entity.unique_id]) == 3
+    assert rolling_state("min", "1h").name == "test_thermal_comfort Dew point 1h min"
+    assert rolling_state("min", "1h").state == get_sensor(hass, SensorType.DEW_POINT).state
+    assert round(float(rolling_state("max", "24h").state), 2) == 13.88
+    assert float(rolling_state("min", "1h").state) <= float(rolling_state("mean", "1h").state) <= 13.88
+    assert rolling_state("mean", "1h").attributes["unit_of_measurement"] == "°C"
+    assert "temperature" not in rolling_state("mean", "1h").attributes
+
+
+async def test_trends(hass: HomeAssistant) -> None:
+    """Test the trend sensors."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={**ADVANCED_USER_INPUT, CONF_ENABLED_SENSORS: [SensorType.ABSOLUTE_HUMIDITY], CONF_TRENDS: [SensorType.ABSOLUTE_HUMIDITY]},
+        entry_id="test",
+        unique_id="uniqueid",
+    )
+    entry.add_to_hass(hass)
+    with patch("custom_components.thermal_comfort.sensor.time") as mock_time:
+        mock_time.perf_counter = time.perf_counter
+        mock_time.monotonic.return_value = 1000.0
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        hass.states.async_set("sensor.test_humidity_sensor", "55.0")
+        await hass.async_block_till_done()
+
+        registry = er.async_get(hass)
+        entity_id = registry.async_get_entity_id(PLATFORM_DOMAIN, DOMAIN, id_generator(entry.unique_id, f"{SensorType.ABSOLUTE_HUMIDITY}_trend"))
+        assert hass.states.get(entity_id).name == "test_thermal_comfort Absolute humidity trend"
+        assert hass.states.get(entity_id).state == STATE_UNKNOWN
+        assert hass.states.get(entity_id).attributes["unit_of_measurement"] == "g/m³/h"
+        assert "device_class" not in hass.states.get(entity_id).attributes
+
+        first = float(get_sensor(hass, SensorType.ABSOLUTE_HUMIDITY).state)
+        mock_time.monotonic.return_value = 1360.0
+        hass.states.async_set("sensor.test_humidity_sensor", "70.0")
+        await hass.async_block_till_done()
+        second = float(get_sensor(hass, SensorType.ABSOLUTE_HUMIDITY).state)
+        # The samples at 50 % and 55 % were both taken at 1000 s, at the same temperature absolute humidity is proportional to the relative humidity
+        assert float(hass.states.get(entity_id).state) == pytest.approx((second - (first * 50 / 55 + first) / 2) * 10, abs=0.01)
+
+
+async def test_derived_sensors_expire(hass: HomeAssistant) -> None:
+    """Test that values leave the rolling windows and trends without new input."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            **ADVANCED_USER_INPUT,
+            CONF_ENABLED_SENSORS: [SensorType.ABSOLUTE_HUMIDITY],
+            CONF_ROLLING_STATISTICS: [SensorType.ABSOLUTE_HUMIDITY],
+            CONF_TRENDS: [SensorType.ABSOLUTE_HUMIDITY],
+        },
+        entry_id="test",
+        unique_id="uniqueid",
+    )
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+
+    def derived_state(key: str) -> str:
+        return hass.states.get(registry.async_get_entity_id(PLATFORM_DOMAIN, DOMAIN, id_generator(entry.unique_id, f"{SensorType.ABSOLUTE_HUMIDITY}_{key}"))).state
+
+    with patch("custom_components.thermal_comfort.sensor.time") as mock_time:
+        mock_time.perf_counter = time.perf_counter
+        mock_time.monotonic.return_value = 1000.0
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        mock_time.monotonic.return_value = 1300.0
+        hass.states.async_set("sensor.test_humidity_sensor", "80.0")
+        await hass.async_block_till_done()
+        mock_time.monotonic.return_value = 1600.0
+        hass.states.async_set("sensor.test_humidity_sensor", "60.0")
+        await hass.async_block_till_done()
+        assert float(derived_state("trend")) != 0
+        assert derived_state("max_1h") != get_sensor(hass, SensorType.ABSOLUTE_HUMIDITY).state
+
+        mock_time.monotonic.return_value = 1600.0 + ROLLING_WINDOWS["1h"] + 1
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=EXPIRY_INTERVAL + 1))
+        await hass.async_block_till_done()
+        assert derived_state("trend") == STATE_UNKNOWN
+        assert derived_state("max_1h") == get_sensor(hass, SensorType.ABSOLUTE_HUMIDITY).state
+        assert derived_state("min_1h") == get_sensor(hass, SensorType.ABSOLUTE_HUMIDITY).state
+        assert derived_state("max_24h") != get_sensor(hass, SensorType.ABSOLUTE_HUMIDITY).state
+
+
+async def test_mould_risk(hass: HomeAssistant, hass_storage) -> None:
+    """Test that the mould growth index is opt-in, restored and stored."""
+    hass_storage[MOULD_GROWTH_STORAGE_KEY] = {"version": 1, "key": MOULD_GROWTH_STORAGE_KEY, "data": {"uniqueid": {"index": 2.0, "unfavourable_hours": 0.0}}}
+    hass.states.async_set("sensor.test_temperature_sensor", "20.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "97.0")
+    assert SensorType.MOULD_RISK not in DEFAULT_SENSOR_TYPES
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={**ADVANCED_USER_INPUT, CONF_ENABLED_SENSORS: [SensorType.MOULD_RISK]},
+        entry_id="test",
+        unique_id="uniqueid",
+    )
+    entry.add_to_hass(hass)
+    with patch("custom_components.thermal_comfort.sensor.time") as mock_time:
+        mock_time.perf_counter = time.perf_counter
+        mock_time.monotonic.return_value = 1000.0
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        hass.states.async_set("sensor.test_humidity_sensor", "96.0")
+        await hass.async_block_till_done()
+        assert float(get_sensor(hass, SensorType.MOULD_RISK).state) == 2.0
+        assert get_sensor(hass, SensorType.MOULD_RISK).attributes[ATTR_CRITICAL_HUMIDITY] == 80.0
+
+        # A day at 96 % grows the index, the new value is written after the save delay
+        mock_time.monotonic.return_value = 1000.0 + 86400
+        hass.states.async_set("sensor.test_humidity_sensor", "95.0")
+        await hass.async_block_till_done()
+        index = float(get_sensor(hass, SensorType.MOULD_RISK).state)
+        assert index > 2.0
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=MOULD_GROWTH_SAVE_DELAY + 1))
+        await hass.async_block_till_done()
+        assert hass_storage[MOULD_GROWTH_STORAGE_KEY]["data"]["uniqueid"]["index"] == pytest.approx(index)
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(DOMAIN, 1)],
+            {
+                DOMAIN: {
+                    "clothing_insulation": "input_number.clothing",
+                    "metabolic_rate": 1.2,
+                    PLATFORM_DOMAIN: {
+                        "name": "test_thermal_comfort",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "radiant_temperature_sensor": "sensor.test_radiant_temperature_sensor",
+                        "sensor_types": [SensorType.PREDICTED_MEAN_VOTE, SensorType.PREDICTED_PERCENTAGE_DISSATISFIED],
+                        "unique_id": "unique_thermal_comfort_id",
+                    },
+                },
+            },
+        ),
+    ],
+)
+async def test_predicted_mean_vote(hass: HomeAssistant, start_ha: Callable) -> None:
+    """Test the predicted mean vote with a radiant temperature sensor and the clothing from an entity."""
+    hass.states.async_set("input_number.clothing", "0.5")
+    hass.states.async_set("sensor.test_radiant_temperature_sensor", "77.9", {"unit_of_measurement": "°F"})
+    hass.states.async_set("sensor.test_temperature_sensor", "23.5")
+    hass.states.async_set("sensor.test_humidity_sensor", "60.0")
+    await hass.async_block_till_done()
+    vote = float(get_sensor(hass, SensorType.PREDICTED_MEAN_VOTE).state)
+    assert vote == pytest.approx(predicted_mean_vote(23.5, 25.5, 60.0, clothing_insulation=0.5), abs=0.01)
+    assert float(get_sensor(hass, SensorType.PREDICTED_PERCENTAGE_DISSATISFIED).state) == pytest.approx(predicted_percentage_dissatisfied(vote), abs=0.1)
+    assert get_sensor(hass, SensorType.PREDICTED_PERCENTAGE_DISSATISFIED).attributes["unit_of_measurement"] == "%"
+
+    # Warmer clothing raises the vote
+    hass.states.async_set("input_number.clothing", "1.0")
+    await hass.async_block_till_done()
+    assert float(get_sensor(hass, SensorType.PREDICTED_MEAN_VOTE).state) == pytest.approx(predicted_mean_vote(23.5, 25.5, 60.0, clothing_insulation=1.0), abs=0.01)
+
+    # Without a valid input the vote is unknown
+    hass.states.async_set("input_number.clothing", "5.0")
+    await hass.async_block_till_done()
+    assert get_sensor(hass, SensorType.PREDICTED_MEAN_VOTE).state == STATE_UNKNOWN
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(DOMAIN, 1)],
+            {
+                DOMAIN: {
+                    PLATFORM_DOMAIN: {
+                        "name": "test_thermal_comfort",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "wind_speed_sensor": "sensor.test_wind_speed_sensor",
+                        "sensor_types": [SensorType.UNIVERSAL_THERMAL_CLIMATE_INDEX],
+                        "unique_id": "unique_thermal_comfort_id",
+                    },
+                },
+            },
+        ),
+    ],
+)
+async def test_universal_thermal_climate_index(hass: HomeAssistant, start_ha: Callable) -> None:
+    """Test the UTCI with a wind speed sensor in km/h."""
+    hass.states.async_set("sensor.test_wind_speed_sensor", "36.0", {"unit_of_measurement": "km/h"})
+    hass.states.async_set("sensor.test_temperature_sensor", "27.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    await hass.async_block_till_done()
+    state = get_sensor(hass, SensorType.UNIVERSAL_THERMAL_CLIMATE_INDEX)
+    assert state.name == "test_thermal_comfort Universal thermal climate index"
+    assert float(state.state) == pytest.approx(universal_thermal_climate_index(27.0, 50.0, 10.0))
+
+    # Outside the range of the approximation the index is unknown
+    hass.states.async_set("sensor.test_temperature_sensor", "52.0")
+    await hass.async_block_till_done()
+    assert get_sensor(hass, SensorType.UNIVERSAL_THERMAL_CLIMATE_INDEX).state == STATE_UNKNOWN
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(DOMAIN, 1)],
+            {
+                DOMAIN: {
+                    PLATFORM_DOMAIN: {
+                        "name": "test_thermal_comfort",
+                        "temperature_sensor": "sensor.test_temperature_sensor",
+                        "humidity_sensor": "sensor.test_humidity_sensor",
+                        "radiant_temperature_sensor": "sensor.test_radiant_temperature_sensor",
+                        "sensor_types": [SensorType.WET_BULB_TEMPERATURE, SensorType.WET_BULB_GLOBE_TEMPERATURE],
+                        "unique_id": "unique_thermal_comfort_id",
+                    },
+                },
+            },
+        ),
+    ],
+)
+async def test_wet_bulb_temperature(hass: HomeAssistant, start_ha: Callable) -> None:
+    """Test the wet-bulb temperature and the wet-bulb globe temperature with a radiant temperature sensor."""
+    hass.states.async_set("sensor.test_radiant_temperature_sensor", "30.0")
+    hass.states.async_set("sensor.test_temperature_sensor", "20.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    await hass.async_block_till_done()
+    state = get_sensor(hass, SensorType.WET_BULB_TEMPERATURE)
+    assert state.name == "test_thermal_comfort Wet bulb temperature"
+    wet_bulb = float(state.state)
+    assert wet_bulb == pytest.approx(13.8, abs=0.05)
+    assert float(get_sensor(hass, SensorType.WET_BULB_GLOBE_TEMPERATURE).state) == pytest.approx(0.7 * wet_bulb + 0.3 * 30.0)
+
+    # Saturated air is at its wet-bulb temperature
+    hass.states.async_set("sensor.test_humidity_sensor", "100.0")
+    await hass.async_block_till_done()
+    assert float(get_sensor(hass, SensorType.WET_BULB_TEMPERATURE).state) == pytest.approx(20.0, abs=0.01)
+
+    # Without a globe temperature there is no wet-bulb globe temperature
+    hass.states.async_set("sensor.test_radiant_temperature_sensor", STATE_UNKNOWN)
+    await hass.async_block_till_done()
+    assert get_sensor(hass, SensorType.WET_BULB_GLOBE_TEMPERATURE).state == STATE_UNKNOWN
+
+
+async def test_pressure(hass: HomeAssistant) -> None:
+    """Test the wet-bulb temperature and the comfort zone at the pressure of a pressure sensor."""
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    hass.states.async_set("sensor.test_pressure_sensor", "1013.25", {"unit_of_measurement": "hPa"})
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            **ADVANCED_USER_INPUT,
+            CONF_PRESSURE_SENSOR: "sensor.test_pressure_sensor",
+            CONF_ENABLED_SENSORS: [SensorType.WET_BULB_TEMPERATURE, SensorType.COMFORT_ZONE],
+        },
+        entry_id="test",
+        unique_id="uniqueid",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert float(get_sensor(hass, SensorType.WET_BULB_TEMPERATURE).state) == pytest.approx(17.89, abs=0.05)
+    assert get_sensor(hass, SensorType.COMFORT_ZONE).state == "summer"
+
+    # Less pressure evaporates more, which cools the wet bulb
+    hass.states.async_set("sensor.test_pressure_sensor", "70.0", {"unit_of_measurement": "kPa"})
+    await hass.async_block_till_done()
+    assert float(get_sensor(hass, SensorType.WET_BULB_TEMPERATURE).state) == pytest.approx(17.03, abs=0.05)
+    assert get_sensor(hass, SensorType.COMFORT_ZONE).state == "summer"
+    assert get_sensor(hass, SensorType.COMFORT_ZONE).attributes[ATTR_COMFORT_ZONES] == ["summer"]
+
+    hass.states.async_set("sensor.test_humidity_sensor", "65.0")
+    await hass.async_block_till_done()
+    assert get_sensor(hass, SensorType.COMFORT_ZONE).state == "outside"
+
+
+async def test_adaptive_comfort_temperature(hass: HomeAssistant, hass_storage) -> None:
+    """Test the adaptive comfort temperature by the restored and stored running mean of an outdoor device."""
+    today = dt_util.now().date()
+    hass_storage[RUNNING_MEAN_STORAGE_KEY] = {
+        "version": 1,
+        "key": RUNNING_MEAN_STORAGE_KEY,
+        "data": {"outdoor_id": {"running_mean": 16.0, "days": 10, "day": today.isoformat(), "day_sum": 26.0 * 3600, "day_seconds": 3600.0}},
+    }
+    hass.states.async_set("sensor.test_temperature_sensor", "24.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    hass.states.async_set("sensor.test_outdoor_temperature_sensor", "26.0")
+    indoor = {
+        "temperature_sensor": "sensor.test_temperature_sensor",
+        "humidity_sensor": "sensor.test_humidity_sensor",
+        "sensor_types": [SensorType.ADAPTIVE_COMFORT_TEMPERATURE],
+        "outdoor_device": "outdoor_id",
+    }
+    config = {
+        DOMAIN: {
+            PLATFORM_DOMAIN: [
+                {**indoor, "name": "test_thermal_comfort", "unique_id": "unique_thermal_comfort_id"},
+                {**indoor, "name": "test_thermal_comfort_2", "unique_id": "unique_thermal_comfort_id_2"},
+                {
+                    "name": "outdoor",
+                    "temperature_sensor": "sensor.test_outdoor_temperature_sensor",
+                    "humidity_sensor": "sensor.test_humidity_sensor",
+                    "sensor_types": [SensorType.DEW_POINT],
+                    "unique_id": "outdoor_id",
+                },
+            ]
+        }
+    }
+    assert await async_setup_component(hass, DOMAIN, config)
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.test_outdoor_temperature_sensor", "26.0", {"source": "update"})
+    await hass.async_block_till_done()
+
+    state = get_sensor(hass, SensorType.ADAPTIVE_COMFORT_TEMPERATURE)
+    assert state.name == "test_thermal_comfort Adaptive comfort temperature"
+    assert float(state.state) == pytest.approx(0.31 * 16.0 + 17.8)
+    assert state.attributes[ATTR_PREVAILING_MEAN_OUTDOOR_TEMPERATURE] == 16.0
+    assert state.attributes[ATTR_OPERATIVE_TEMPERATURE] == 24.0
+    assert state.attributes[ATTR_ACCEPTABILITY] == 90
+
+    # At the next update of the outdoor device after midnight the day at 26 °C is weighted in, for both indoor devices
+    tomorrow = dt_util.start_of_local_day(today + timedelta(days=1)) + timedelta(hours=1)
+    with patch("custom_components.thermal_comfort.sensor.dt_util") as mock_dt_util:
+        mock_dt_util.now.return_value = tomorrow
+        hass.states.async_set("sensor.test_outdoor_temperature_sensor", "25.0")
+        await hass.async_block_till_done()
+    hass.states.async_set("sensor.test_temperature_sensor", "24.5")
+    await hass.async_block_till_done()
+    prevailing_mean = 0.2 * 26.0 + 0.8 * 16.0
+    for entity_id in ("sensor.test_thermal_comfort_adaptive_comfort_temperature", "sensor.test_thermal_comfort_2_adaptive_comfort_temperature"):
+        state = hass.states.get(entity_id)
+        assert float(state.state) == pytest.approx(0.31 * prevailing_mean + 17.8)
+        assert state.attributes[ATTR_PREVAILING_MEAN_OUTDOOR_TEMPERATURE] == pytest.approx(prevailing_mean)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=RUNNING_MEAN_SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+    stored = hass_storage[RUNNING_MEAN_STORAGE_KEY]["data"]["outdoor_id"]
+    assert stored["running_mean"] == pytest.approx(prevailing_mean)
+    assert stored["days"] == 11
+    assert stored["day"] == (today + timedelta(days=1)).isoformat()
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(DOMAIN, 1)],
+            {
+                DOMAIN: {
+                    PLATFORM_DOMAIN: [
+                        {
+                            "name": "test_thermal_comfort",
+                            "temperature_sensor": "sensor.test_temperature_sensor",
+                            "humidity_sensor": "sensor.test_humidity_sensor",
+                            "sensor_types": [SensorType.COMFORT_ZONE],
+                            "unique_id": "unique_thermal_comfort_id",
+                        },
+                        {
+                            "name": "test_thermal_comfort_custom",
+                            "temperature_sensor": "sensor.test_temperature_sensor",
+                            "humidity_sensor": "sensor.test_humidity_sensor",
+                            "sensor_types": [SensorType.COMFORT_ZONE],
+                            "comfort_zones": {"office": [[20, 20], [26, 20], [26, 70], [20, 70]]},
+                            "unique_id": "unique_thermal_comfort_id_custom",
+                        },
+                    ]
+                },
+            },
+        ),
+    ],
+)
+async def test_comfort_zone(hass: HomeAssistant, start_ha: Callable) -> None:
+    """Test the comfort zone with the default and with configured zones."""
+    custom = "sensor.test_thermal_comfort_custom_comfort_zone"
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "35.0")
+    await hass.async_block_till_done()
+    state = get_sensor(hass, SensorType.COMFORT_ZONE)
+    assert state.name == "test_thermal_comfort Comfort zone"
+    assert state.state == "summer"
+    assert state.attributes[ATTR_COMFORT_ZONES] == ["summer", "winter"]
+    assert hass.states.get(custom).state == "office"
+
+    hass.states.async_set("sensor.test_humidity_sensor", "65.0")
+    await hass.async_block_till_done()
+    assert get_sensor(hass, SensorType.COMFORT_ZONE).state == "outside"
+    assert get_sensor(hass, SensorType.COMFORT_ZONE).attributes[ATTR_COMFORT_ZONES] == []
+    assert hass.states.get(custom).state == "office"
+
+
+@pytest.mark.parametrize(
+    "domains, config",
+    [
+        (
+            [(DOMAIN, 1)],
+            {
+                DOMAIN: {
+                    PLATFORM_DOMAIN: [
+                        {
+                            "name": "test_thermal_comfort",
+                            "temperature_sensor": "sensor.test_temperature_sensor",
+                            "humidity_sensor": "sensor.test_humidity_sensor",
+                            "sensor_types": [SensorType.DEW_POINT, SensorType.HUMIDEX, SensorType.HEAT_INDEX],
+                            "unique_id": "unique_thermal_comfort_id",
+                        },
+                        {
+                            "name": "test_thermal_comfort_buck",
+                            "temperature_sensor": "sensor.test_temperature_sensor",
+                            "humidity_sensor": "sensor.test_humidity_sensor",
+                            "sensor_types": [SensorType.DEW_POINT],
+                            "saturation_model": "buck",
+                            "unique_id": "unique_thermal_comfort_id_buck",
+                        },
+                    ]
+                },
+            },
+        ),
+    ],
+)
+async def test_solve(hass: HomeAssistant, start_ha: Callable) -> None:
+    """Test that solving for the current value gives the current input, for several devices at once."""
+    hass.states.async_set("sensor.test_temperature_sensor", "30.0")
+    hass.states.async_set("sensor.test_humidity_sensor", "60.0")
+    await hass.async_block_till_done()
+    # YAML devices are not in the device registry and are given by unique_id
+    device_ids = ["unique_thermal_comfort_id", "unique_thermal_comfort_id_buck"]
+
+    for sensor_type in (SensorType.DEW_POINT, SensorType.HUMIDEX, SensorType.HEAT_INDEX):
+        value = float(get_sensor(hass, sensor_type).state)
+        for solve_for, current, tolerance in (("humidity", 60.0, 1.0), ("temperature", 30.0, 0.2)):
+            response = await hass.services.async_call(
+                DOMAIN, SERVICE_SOLVE, {"device_id": device_ids[0], "target": sensor_type, "value": value, "solve_for": solve_for}, blocking=True, return_response=True
+            )
+            result = response["devices"][device_ids[0]]
+            assert result["name"] == "test_thermal_comfort"
+            assert result[solve_for] == pytest.approx(current, abs=tolerance)
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_SOLVE, {"device_id": device_ids, "target": "dew_point", "value": 15.0, "solve_for": "humidity"}, blocking=True, return_response=True
+    )
+    assert response["devices"][device_ids[0]] == {"name": "test_thermal_comfort", "temperature": 30.0, "humidity": pytest.approx(40.0, abs=0.5)}
+    assert response["devices"][device_ids[1]]["humidity"] == pytest.approx(40.0, abs=0.5)
+
+    # No humidity gives a dew point above the temperature
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_SOLVE, {"device_id": device_ids[0], "target": "dew_point", "value": 35.0, "solve_for": "humidity"}, blocking=True, return_response=True
+    )
+    assert response["devices"][device_ids[0]]["humidity"] is None
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_SOLVE, {"device_id": "unknown", "target": "dew_point", "value": 15.0, "solve_for": "humidity"}, blocking=True, return_response=True
+        )
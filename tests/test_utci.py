@@ -0,0 +1,87 @@
+"""Test the Universal Thermal Climate Index."""
+
+import math
+
+import numpy as np
+import pytest
+
+from custom_components.thermal_comfort.utci import (
+    universal_thermal_climate_index,
+    universal_thermal_climate_indices,
+    utci_polynomial,
+    utci_terms,
+    utci_vapor_pressure,
+)
+
+
+def evaluate_terms(ta: float, va: float, d_tmrt: float, pa: float) -> float:
+    """Evaluate the polynomial term by term."""
+    return sum(coefficient * ta**i * va**j * d_tmrt**k * pa**m for coefficient, i, j, k, m in utci_terms())
+
+
+def test_terms():
+    """Test that the polynomial has every term of up to 6th order once."""
+    terms = utci_terms()
+    assert len(terms) == 210
+    assert len({tuple(term[1:]) for term in terms}) == 210
+    assert max(sum(term[1:]) for term in terms) == 6
+
+
+@pytest.mark.parametrize(
+    ("ta", "va", "d_tmrt", "pa"),
+    [(25.0, 1.0, 0.0, 1.6), (-30.0, 12.0, 20.0, 0.05), (45.0, 0.5, 60.0, 4.0), (5.0, 3.0, -25.0, 0.7)],
+)
+def test_horner(ta, va, d_tmrt, pa):
+    """Test that the compiled Horner scheme matches the terms."""
+    assert utci_polynomial(ta, va, d_tmrt, pa) == pytest.approx(evaluate_terms(ta, va, d_tmrt, pa), abs=1e-9)
+
+
+@pytest.mark.parametrize(
+    ("temperature", "radiant_temperature", "wind_speed", "humidity", "utci"),
+    [
+        (25, 25, 1.0, 50, 24.6),
+        (25, 27, 1.0, 50, 25.2),
+        (19, 24, 1.0, 50, 20.0),
+        (19, 14, 1.0, 50, 16.8),
+        (27, 22, 10.0, 50, 20.0),
+        (27, 22, 16.0, 50, 15.8),
+    ],
+)
+def test_utci(temperature, radiant_temperature, wind_speed, humidity, utci):
+    """Test against reference values of the UTCI."""
+    assert round(universal_thermal_climate_index(temperature, humidity, wind_speed, radiant_temperature), 1) == utci
+
+
+def test_validity():
+    """Test the valid range of the approximation."""
+    assert universal_thermal_climate_index(51, 50) is None
+    assert universal_thermal_climate_index(20, 50, radiant_temperature=-11) is None
+    # Calm air counts as the lower limit of the wind speed
+    assert universal_thermal_climate_index(20, 50, 0.0) == universal_thermal_climate_index(20, 50, 0.5)
+    assert universal_thermal_climate_index(20, 50) == universal_thermal_climate_index(20, 50, radiant_temperature=20)
+
+
+def test_vapor_pressure():
+    """Test the vapour pressure in kPa."""
+    assert utci_vapor_pressure(20, 100) == pytest.approx(2.339, abs=1e-3)
+    assert utci_vapor_pressure(20, 50) == pytest.approx(utci_vapor_pressure(20, 100) / 2)
+
+
+def test_batch():
+    """Test that the NumPy form matches single evaluations and gives NaN where they give None."""
+    temperatures = [25.0, -10.0, 60.0, 19.0, math.nan]
+    humidities = [50.0, 80.0, 50.0, 50.0, 50.0]
+    wind_speeds = [1.0, 8.0, 1.0, 0.2, 1.0]
+    radiant_temperatures = [27.0, -5.0, 60.0, 24.0, 20.0]
+    utci = universal_thermal_climate_indices(temperatures, humidities, wind_speeds, radiant_temperatures)
+    assert isinstance(utci, np.ndarray)
+    for index, expected in enumerate(map(universal_thermal_climate_index, temperatures[:4], humidities, wind_speeds, radiant_temperatures)):
+        if expected is None:
+            assert math.isnan(utci[index])
+        else:
+            assert utci[index] == pytest.approx(expected, abs=1e-9)
+    assert math.isnan(utci[4])
+
+    # A scalar wind speed and no radiant temperatures
+    utci = universal_thermal_climate_indices([20.0, 30.0], [50.0, 40.0])
+    assert utci[1] == pytest.approx(universal_thermal_climate_index(30.0, 40.0), abs=1e-9)
@@ -0,0 +1,71 @@
+"""Test the Thermal Comfort metrics endpoint."""
+
+from http import HTTPStatus
+from unittest.mock import Mock
+
+from custom_components.thermal_comfort.const import DOMAIN
+from custom_components.thermal_comfort.view import MetricsView
+from homeassistant.components.http import KEY_HASS
+from homeassistant.components.sensor import DOMAIN as PLATFORM_DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+
+async def _async_setup(hass: HomeAssistant, metrics_endpoint: bool) -> None:
+    hass.http = Mock()
+    hass.states.async_set("sensor.test_temperature_sensor", "25.0", {"unit_of_measurement": "°C"})
+    hass.states.async_set("sensor.test_humidity_sensor", "50.0")
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            DOMAIN: {
+                "metrics_endpoint": metrics_endpoint,
+                PLATFORM_DOMAIN: {
+                    "name": "test_thermal_comfort",
+                    "temperature_sensor": "sensor.test_temperature_sensor",
+                    "humidity_sensor": "sensor.test_humidity_sensor",
+                    "sensor_types": ["dew_point", "frost_point"],
+                    "unique_id": "unique_thermal_comfort_id",
+                },
+            },
+        },
+    )
+    await hass.async_block_till_done()
+
+
+async def _async_get(hass: HomeAssistant):
+    request = Mock(app={KEY_HASS: hass})
+    return await MetricsView().get(request)
+
+
+async def test_metrics_endpoint(hass: HomeAssistant) -> None:
+    """Test the metrics of a device in the Prometheus text format."""
+    await _async_setup(hass, True)
+    hass.http.register_view.assert_called_once_with(MetricsView)
+    assert MetricsView.requires_auth
+    hass.states.async_set("sensor.test_temperature_sensor", "26.0", {"unit_of_measurement": "°C"})
+    await hass.async_block_till_done()
+
+    response = await _async_get(hass)
+    assert response.status == HTTPStatus.OK
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    labels = 'device="unique_thermal_comfort_id",name="test_thermal_comfort"'
+    assert "# TYPE thermal_comfort_input_events_total counter" in lines
+    assert f'thermal_comfort_input_events_total{{{labels},key="temperature"}} 1' in lines
+    assert f'thermal_comfort_recomputes_total{{{labels},key="dew_point"}} 2' in lines
+    # The frost point reads the dew point computed for the dew point sensor
+    assert f'thermal_comfort_cache_hits_total{{{labels},key="dew_point"}} 2' in lines
+    assert f'thermal_comfort_compute_seconds_bucket{{{labels},key="dew_point",le="+Inf"}} 2' in lines
+    assert f'thermal_comfort_compute_seconds_count{{{labels},key="dew_point"}} 2' in lines
+    assert f"thermal_comfort_state_writes_total{{{labels}}} 4" in lines
+    assert f"thermal_comfort_pending_refreshes{{{labels}}} 0" in lines
+    assert any(line.startswith(f"thermal_comfort_update_lag_seconds{{{labels}}} ") for line in lines)
+    assert not any(line.startswith("thermal_comfort_slow_updates_total{") for line in lines)
+
+
+async def test_metrics_endpoint_disabled(hass: HomeAssistant) -> None:
+    """Test that the endpoint is only registered when enabled."""
+    await _async_setup(hass, False)
+    hass.http.register_view.assert_not_called()
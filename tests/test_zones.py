@@ -0,0 +1,63 @@
+"""Test the comfort zones of the psychrometric chart."""
+
+import pytest
+
+from custom_components.thermal_comfort.lookup import saturation_pressure
+from custom_components.thermal_comfort.psychrometrics import humidity_ratio
+from custom_components.thermal_comfort.zones import (
+    DEFAULT_COMFORT_ZONES,
+    ZONE_CURVE_SEGMENTS,
+    comfort_zones,
+    freeze_zones,
+    point_in_polygon,
+    zone_polygon,
+    zone_polygons,
+)
+
+STANDARD_PRESSURE = 101325
+ZONES = freeze_zones(DEFAULT_COMFORT_ZONES)
+
+
+def ratio(temperature: float, humidity: float, pressure: float = STANDARD_PRESSURE) -> float:
+    """Humidity ratio of air."""
+    return humidity_ratio(humidity / 100 * saturation_pressure(temperature), pressure)
+
+
+def test_point_in_polygon():
+    """Test a concave polygon."""
+    polygon = ((0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (2.0, 1.0), (0.0, 4.0))
+    assert point_in_polygon(1.0, 0.5, polygon)
+    assert point_in_polygon(3.5, 3.0, polygon)
+    assert not point_in_polygon(2.0, 3.0, polygon)
+    assert not point_in_polygon(5.0, 0.5, polygon)
+
+
+@pytest.mark.parametrize(
+    ("temperature", "humidity", "zones"),
+    [(22.0, 45.0, ["winter"]), (27.0, 40.0, ["summer"]), (25.0, 35.0, ["summer", "winter"]), (30.0, 40.0, []), (22.0, 70.0, []), (22.0, 25.0, [])],
+)
+def test_default_zones(temperature, humidity, zones):
+    """Test the membership in the ASHRAE 55 summer and winter zones."""
+    assert comfort_zones(ZONES, temperature, ratio(temperature, humidity), STANDARD_PRESSURE) == zones
+
+
+def test_humidity_curve():
+    """Test that edges of equal relative humidity follow the humidity curve."""
+    polygon = zone_polygon(DEFAULT_COMFORT_ZONES["summer"], STANDARD_PRESSURE)
+    assert len(polygon) == 2 * ZONE_CURVE_SEGMENTS + 2
+    # Just below 30 % in the middle of the lower edge is outside, a straight edge would hold it
+    assert not point_in_polygon(26.25, ratio(26.25, 29.9), polygon)
+    assert point_in_polygon(26.25, ratio(26.25, 30.1), polygon)
+
+
+def test_pressure():
+    """Test that polygons are derived once per pressure bucket and hold more humidity at altitude."""
+    zone_polygons.cache_clear()
+    comfort_zones(ZONES, 22.0, 0.008, 101325)
+    comfort_zones(ZONES, 22.0, 0.008, 101300)
+    assert zone_polygons.cache_info().misses == 1
+
+    # 60 % at 22 °C at 800 hPa is outside at sea level
+    high = ratio(22.0, 59.0, 80000)
+    assert comfort_zones(ZONES, 22.0, high, 80000) == ["winter"]
+    assert comfort_zones(ZONES, 22.0, high, STANDARD_PRESSURE) == []